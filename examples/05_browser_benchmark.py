@@ -0,0 +1,110 @@
+import os
+import time
+import argparse
+import statistics
+from switch_TL_SG108PE.switch_manager import SwitchManager
+
+
+# Compares stock headless Chrome with lean one (started by default): time of page loads and memory of browser.
+# Memory is read from /proc, so it is measured only on Linux. Browser's processes are found by its profile
+# directory, chromedriver is measured apart (one chromedriver is shared by all browsers of process).
+#
+# $ python 05_browser_benchmark.py -i 192.168.1.42 -l admin -p admin -n 20
+
+
+READS = [('system', 'system_info'), ('system', 'ip_settings'), ('switching', 'ports_settings'),
+         ('monitoring', 'port_statistics')]  # each read opens other tab, so each one loads page
+
+
+def argument_parser():
+    """Parses user arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark of stock and lean headless Chrome.')
+    parser.add_argument('-i', '--ip', help='IP address of switch admin page.', type=str, required=True)
+    parser.add_argument('-l', '--login', help='Username to authenticate.', type=str, required=True)
+    parser.add_argument('-p', '--password', help='Password to authenticate.', type=str, required=True)
+    parser.add_argument('-n', '--rounds', help='Number of rounds of reads.', type=int, default=10)
+    return parser.parse_args()
+
+
+def processes():
+    """Returns parent PID and command line of all running processes by their PIDs."""
+    found = {}
+    for entry in os.listdir('/proc'):
+        try:
+            with open(f'/proc/{entry}/stat', encoding='utf-8') as file:
+                parent = int(file.read().rsplit(')', 1)[1].split()[1])
+            with open(f'/proc/{entry}/cmdline', encoding='utf-8') as file:
+                found[int(entry)] = (parent, file.read().split('\0'))
+        except (OSError, IndexError, ValueError):
+            continue
+    return found
+
+
+def rss(pids):
+    """Returns resident memory (in MiB) of given processes."""
+    total = 0
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/status', encoding='utf-8') as file:
+                total += sum(int(line.split()[1]) for line in file if line.startswith('VmRSS:'))
+        except OSError:
+            pass
+    return total / 1024
+
+
+def browser_processes(webdriver):
+    """
+    Returns PIDs of processes of given Chrome: its main process (found by its profile directory) and all its
+    descendants. Chromedriver is not included, because it is shared by all browsers of process.
+    """
+    user_data_dir = f'--user-data-dir={webdriver.capabilities["chrome"]["userDataDir"]}'
+    found = processes()
+    profile = {pid for pid, (_, command_line) in found.items() if user_data_dir in command_line}
+    pending = [pid for pid in profile if found[pid][0] not in profile]
+    tree = set()
+    while pending:
+        current = pending.pop()
+        tree.add(current)
+        pending.extend(pid for pid, (parent, _) in found.items() if parent == current)
+    return tree
+
+
+def benchmark(args, lean_browser):
+    """Returns times of reads (in seconds) and memory of browser (in MiB)."""
+    switch_manager = SwitchManager()
+    start = time.perf_counter()
+    switch_manager.connect(args.ip, args.login, args.password, lean_browser=lean_browser)
+    connect_time = time.perf_counter() - start
+    times = []
+    for _ in range(args.rounds):
+        for section, method in READS:
+            start = time.perf_counter()
+            getattr(switch_manager.control(section), method)()
+            times.append(time.perf_counter() - start)
+    webdriver = switch_manager._web_controller.webdriver
+    memory = rss(browser_processes(webdriver))
+    driver_memory = rss([webdriver.service.process.pid])
+    switch_manager.disconnect()
+    return connect_time, times, memory, driver_memory
+
+
+def main():
+    """Runs benchmark."""
+    args = argument_parser()
+    results = {}
+    for name, lean_browser in (('stock', False), ('lean', True)):
+        print(f'Benchmarking {name} browser...')
+        results[name] = benchmark(args, lean_browser)
+    print(f'{"":8}{"connect [s]":>14}{"page load median [ms]":>24}{"page load p90 [ms]":>21}'
+          f'{"browser RSS [MiB]":>20}')
+    for name, (connect_time, times, memory, _) in results.items():
+        p90 = statistics.quantiles(times, n=10)[-1]
+        print(f'{name:8}{connect_time:14.2f}{statistics.median(times) * 1000:24.1f}{p90 * 1000:21.1f}{memory:20.1f}')
+    stock, lean = results['stock'], results['lean']
+    print(f'Lean browser loads pages {1 - statistics.median(lean[1]) / statistics.median(stock[1]):.0%} faster '
+          f'and takes {stock[2] - lean[2]:.0f} MiB less memory.')
+    print(f'Chromedriver shared by browsers takes {lean[3]:.1f} MiB (not counted above).')
+
+
+if __name__ == '__main__':
+    main()
@@ -30,7 +30,13 @@ setup(
         exclude=['tests*'],
     ),
     install_requires=[
-        'selenium'
+        'selenium>=4.0',
+        'requests',
+        'lxml',
+        'cssselect'
     ],
+    extras_require={
+        'async': ['aiohttp'],
+    },
     py_modules=['switch_TL_SG108PE'],
 )
@@ -7,6 +7,7 @@ __version__ = "0.0.0"
 
 
 from .switch_manager import SwitchManager
+from .easy_smart.discovery import discover
 from . import exceptions, port, control_fields
 
 
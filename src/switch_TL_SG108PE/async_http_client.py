@@ -0,0 +1,62 @@
+"""Contains non-blocking HTTP transport used to communicate with admin web page of switch from asyncio code."""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .exceptions import HttpRequestException
+
+
+class AsyncHttpClient:
+    """
+    Creates object to send requests to admin web page of switch without blocking event loop.
+    Connection is kept alive between requests. It requires aiohttp library (pip install switch_TL_SG108PE[async]).
+    """
+
+    def __init__(self, host: str, timeout: float = 4) -> None:
+        if aiohttp is None:
+            raise ImportError('AsyncHttpClient requires aiohttp library. '
+                              'Install it via "pip install switch_TL_SG108PE[async]".')
+        self.host = host
+        self.timeout = timeout
+        self._session = None
+
+    async def request(self, method: str, url: str,
+                      data: Optional[Dict[str, Union[str, List[str]]]] = None) -> Tuple[str, str]:
+        """
+        Sends request to switch and returns address and content of received page.
+
+        :param method: HTTP method (GET or POST)
+        :param url: absolute address of page
+        :param data: form data sent in body of POST request
+        :raises HttpRequestException: if switch did not answer
+        :return: final url (after redirects) and content of page
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit_per_host=1),
+                cookie_jar=aiohttp.CookieJar(unsafe=True),  # switch is addressed by IP, not by domain
+            )
+        if data is not None:
+            data = [(key, value) for key, values in data.items()
+                    for value in (values if isinstance(values, list) else [values])]
+        try:
+            async with self._session.request(method, url, data=data) as response:
+                return str(response.url), await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            raise HttpRequestException(f'Request "{method} {url}" failed: {error!r}') from None
+
+    async def close(self) -> None:
+        """
+        Closes connection with switch.
+
+        :return: None
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,224 @@
+"""Contains main class to control switch from asyncio code."""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .async_http_client import AsyncHttpClient
+from .http_client import HttpClient
+from .html_driver import HtmlDriver
+from .web_controller import HttpWebController
+from .control_fields.control_field import ControlField
+from .control_fields.system import SystemControlField
+from .control_fields.switching import SwitchingControlField
+from .control_fields.monitoring import MonitoringControlField
+from .control_fields.vlan import VLANControlField
+from .control_fields.qos import QoSControlField
+from .control_fields.poe import PoEControlField
+from .exceptions import SwitchManagerNotConnectedException, UnknownControlFieldException, DeadlineExceededException
+
+
+class _RequestRequired(Exception):
+    """Thrown by replay client when operation needs response which was not downloaded yet."""
+
+    def __init__(self, method: str, url: str, data: Optional[Dict[str, Any]]) -> None:
+        super().__init__(f'{method} {url}')
+        self.request = (method, url, data)
+
+
+class _ReplayClient(HttpClient):
+    """HTTP client which answers with already downloaded responses instead of sending requests."""
+
+    def __init__(self, host: str, username: str, password: str) -> None:
+        super().__init__(host, username, password)
+        self._journal: List[Tuple[tuple, Tuple[str, str]]] = []
+        self._position = 0
+
+    def replay(self, journal: List[Tuple[tuple, Tuple[str, str]]]) -> None:
+        """
+        Starts answering with given responses from the first one.
+
+        :param journal: requests and their responses in order in which they were sent
+        :return: None
+        """
+        self._journal = journal
+        self._position = 0
+
+    def request(self, method: str, url: str, data: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+        if self._position == len(self._journal):
+            raise _RequestRequired(method, url, data)
+        request, response = self._journal[self._position]
+        if request != (method, url, data):
+            raise RuntimeError(f'Operation is not deterministic: expected {request}, got {(method, url, data)}.')
+        self._position += 1
+        return response
+
+
+class AsyncControlField:
+    """
+    Creates object to control given section of admin page from asyncio code.
+    It exposes all public methods of wrapped control field as coroutines, e.g.
+    ``await switch_manager.control('monitoring').port_statistics()``.
+    """
+
+    def __init__(self, switch_manager: 'AsyncSwitchManager', control_field_class: Type[ControlField]) -> None:
+        self._switch_manager = switch_manager
+        self._control_field_class = control_field_class
+
+    def __getattr__(self, name: str) -> Callable:
+        method = getattr(self._control_field_class, name, None)
+        if name.startswith('_') or not callable(method):
+            raise AttributeError(f'{self._control_field_class.__name__} has no method "{name}".')
+
+        async def inner(*args, deadline: Optional[float] = None, **kwargs):
+            return await self._switch_manager.run(
+                lambda web_controller: getattr(self._control_field_class(web_controller), name)(*args, **kwargs),
+                deadline=deadline
+            )
+        inner.__name__ = name
+        inner.__doc__ = method.__doc__
+        return inner
+
+    def __dir__(self) -> List[str]:
+        return [name for name in dir(self._control_field_class)
+                if not name.startswith('_') and callable(getattr(self._control_field_class, name))]
+
+
+class AsyncSwitchManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Creates object to control switch TL-SG108PE from asyncio code. Pages are downloaded without blocking
+    event loop, so one event loop can control many switches at once (each one by its own AsyncSwitchManager).
+
+    Control fields are the same as in SwitchManager with ``http`` backend. Operation is executed against already
+    downloaded pages. When it needs a page which was not downloaded yet, the page is awaited (and parsed in executor)
+    and the operation is replayed from the beginning with all collected responses - no request is sent twice
+    and no page is parsed twice. One web controller is kept for switch, so opened tab and confirmed session
+    are reused by following operations.
+    """
+
+    _CONTROL_FIELDS = {
+        'system': SystemControlField,
+        'switching': SwitchingControlField,
+        'monitoring': MonitoringControlField,
+        'VLAN': VLANControlField,
+        'QoS': QoSControlField,
+        'PoE': PoEControlField,
+    }
+
+    def __init__(self) -> None:
+        self.host = None
+        self.login = None
+        self.password = None
+        self.is_connected = False
+        self._client = None
+        self._web_controller = None
+        self._state = None
+        self._lock = None
+
+    async def connect(self, host: str, login: str, password: str, client: AsyncHttpClient = None) -> None:
+        """
+        Connects AsyncSwitchManager to admin web page of switch.
+
+        :param host: host address of switch
+        :param login: name of login
+        :param password: secret password
+        :param client: custom non-blocking HTTP client
+        :return: None
+        """
+        self.host = host
+        self.login = login
+        self.password = password
+        self._client = client if client is not None else AsyncHttpClient(host)
+        self._web_controller = HttpWebController(host, login, password, client=_ReplayClient(host, login, password))
+        self._state = self._web_controller.save_state()
+        self._lock = asyncio.Lock()
+        await self.run(lambda web_controller: web_controller.login())
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        """
+        Disconnects AsyncSwitchManager from admin web page of switch.
+
+        :return: None
+        """
+        try:
+            await self.run(lambda web_controller: web_controller.logout())
+        finally:
+            await self._client.close()
+            self.host = None
+            self.login = None
+            self.password = None
+            self.is_connected = False
+            self._client = None
+            self._web_controller = None
+            self._state = None
+
+    def control(self, control_field: str) -> AsyncControlField:
+        """
+        Returns object to control particular section in admin web page - control field.
+        There are 6 control sections: system, switching, monitoring, VLAN, QoS, PoE
+
+        :param control_field: name of control field (according to sidebar navigation in admin web page)
+        :return: given control field
+        """
+        if control_field not in self._CONTROL_FIELDS:
+            raise UnknownControlFieldException(f'"{control_field}" control filed is not recognised. '
+                                               f'Possible control fields: {", ".join(self._CONTROL_FIELDS.keys())}')
+        if not self.is_connected:
+            raise SwitchManagerNotConnectedException(
+                'Switch manager is not connected. Please call connect() method first.')
+        return AsyncControlField(self, self._CONTROL_FIELDS[control_field])
+
+    def get_control_fields(self) -> List[str]:
+        """
+        Returns list of possible control fields (the same as in SwitchManager).
+
+        :return: control fields
+        """
+        return list(self._CONTROL_FIELDS.keys()) if self.is_connected else []
+
+    async def run(self, operation: Callable[[HttpWebController], Any], deadline: Optional[float] = None) -> Any:
+        """
+        Executes given operation on web controller. Pages required by operation are downloaded asynchronously.
+        Operations of one switch manager are executed one by one.
+
+        :param operation: function which receives web controller
+        :param deadline: maximum time (in seconds) of whole call including downloads and replays
+                         (time of waiting for previous operations is not counted)
+        :raises DeadlineExceededException: if deadline passed
+        :return: result of operation
+        """
+        async with self._lock:
+            journal = []
+            deadline = None if deadline is None else time.monotonic() + deadline
+            try:
+                while True:
+                    self._web_controller.restore_state(self._state)
+                    self._web_controller.client.replay(journal)
+                    self._web_controller.outer_deadline = deadline
+                    try:
+                        result = operation(self._web_controller)
+                    except _RequestRequired as required:
+                        journal.append((required.request, await self._download(*required.request, deadline)))
+                        continue
+                    self._state = self._web_controller.save_state()
+                    return result
+            finally:
+                self._web_controller.outer_deadline = None
+                self._web_controller.webdriver.forget_parsed_pages(self._state['driver'])
+
+    async def _download(self, method: str, url: str, data: Optional[Dict[str, Any]],
+                        deadline: Optional[float]) -> Tuple[str, str]:
+        if deadline is None:
+            final_url, content = await self._client.request(method, url, data)
+        else:
+            try:
+                final_url, content = await asyncio.wait_for(self._client.request(method, url, data),
+                                                            max(deadline - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededException(
+                    f'Request "{method} {url}" not answered: deadline of operation passed') from None
+        parsed_pages = self._web_controller.webdriver.parsed_pages
+        if content not in parsed_pages:
+            parsed_pages[content] = await asyncio.get_running_loop().run_in_executor(None, HtmlDriver.parse, content)
+        return final_url, content
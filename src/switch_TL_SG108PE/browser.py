@@ -0,0 +1,364 @@
+"""
+Contains profiles of Chrome browser started by SwitchManager, chromedriver shared by all browsers of process
+and pool of browsers started in advance. Lean profile turns browser into appliance which loads only documents
+and scripts of admin page of switch, so pages are loaded faster and browser takes less memory.
+"""
+
+import atexit
+import functools
+import threading
+from typing import Callable, Dict, List, Optional
+import urllib3
+from selenium import webdriver as wd
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+
+from .exceptions import BrowserPoolException
+
+
+# Resources not needed to control admin page (its frames, forms and scripts are loaded).
+BLOCKED_URLS = ['*.css', '*.png', '*.gif', '*.jpg', '*.jpeg', '*.ico', '*.svg', '*.woff', '*.woff2', '*.ttf']
+
+LEAN_ARGUMENTS = [
+    '--disable-extensions',
+    '--disable-gpu',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-features=Translate,MediaRouter,OptimizationHints',
+    '--no-first-run',
+    '--mute-audio',
+    '--renderer-process-limit=1',
+    '--disk-cache-size=1048576',
+    '--blink-settings=imagesEnabled=false',
+]
+
+# Errors of browser which is not reachable anymore (errors of connection are raised if its chromedriver crashed).
+BROWSER_ERRORS = (WebDriverException, urllib3.exceptions.HTTPError)
+
+
+class SharedService(ChromeService):
+    """
+    Creates chromedriver service shared by many browsers. It is started by first browser and left running
+    when browsers quit. If chromedriver crashed, it is started again by next browser. It is stopped by shutdown()
+    (service returned by instance() is stopped at exit of process).
+    """
+
+    _instance: Optional['SharedService'] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.restarts = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Starts chromedriver unless it is running already.
+
+        :return: None
+        """
+        with self._lock:
+            process = getattr(self, 'process', None)
+            if process is not None and process.poll() is None:
+                return
+            if process is not None:  # chromedriver crashed or was shut down
+                self.restarts += 1
+            super().start()
+
+    def stop(self) -> None:
+        """
+        Does nothing - browsers call it when they quit, but other browsers still use chromedriver.
+
+        :return: None
+        """
+
+    def shutdown(self) -> None:
+        """
+        Stops chromedriver. Browsers which were not quit are not reachable anymore.
+
+        :return: None
+        """
+        with self._lock:
+            if getattr(self, 'process', None) is not None:
+                super().stop()
+
+    @classmethod
+    def instance(cls) -> 'SharedService':
+        """
+        Returns chromedriver service shared by all browsers of process started by start_chrome().
+
+        :return: shared service
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.shutdown)
+            return cls._instance
+
+
+def chrome_options(headless: bool = True, lean: bool = True) -> wd.ChromeOptions:
+    """
+    Returns options of Chrome browser.
+
+    :param headless: if True browser will be opened in background, otherwise browser will be visible
+    :param lean: if True browser doesn't wait for images and subresources of pages (controller waits for elements
+                 it uses anyway), doesn't load images, runs one renderer process and has small disk cache
+    :return: options of Chrome
+    """
+    options = wd.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    if lean:
+        options.page_load_strategy = 'eager'
+        for argument in LEAN_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    return options
+
+
+def start_chrome(headless: bool = True, lean: bool = True, service: Optional[ChromeService] = None) -> WebDriver:
+    """
+    Starts Chrome browser. Lean browser also doesn't download stylesheets, images and fonts (see BLOCKED_URLS).
+
+    :param headless: if True browser will be opened in background, otherwise browser will be visible
+    :param lean: if True browser is started with lean profile (see chrome_options())
+    :param service: chromedriver service of browser, by default browser is attached to chromedriver
+                    shared by all browsers of process (see SharedService.instance())
+    :return: web driver of started browser
+    """
+    webdriver = wd.Chrome(options=chrome_options(headless, lean), service=service or SharedService.instance())
+    if lean:
+        block_urls(webdriver)
+    return webdriver
+
+
+def block_urls(webdriver: WebDriver) -> None:
+    """
+    Makes browser drop requests of resources not needed to control admin page.
+
+    :param webdriver: web driver of Chrome browser
+    :return: None
+    """
+    webdriver.execute_cdp_cmd('Network.enable', {})
+    webdriver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+
+
+class BrowserPool:
+    """
+    Creates pool of web browsers started in background, so SwitchManager.connect() leased browser doesn't wait
+    for its startup (only for login). Browser returned by SwitchManager.disconnect() is cleared (cookies, loaded
+    pages) and leased again.
+    """
+
+    def __init__(self, size: int = 1, headless: bool = True, lean: bool = True,
+                 factory: Optional[Callable[[], WebDriver]] = None) -> None:
+        self.size = size  # number of browsers kept ready
+        self.factory = factory if factory is not None else functools.partial(start_chrome, headless, lean)
+        self.failures = 0
+        self._idle: List[WebDriver] = []
+        self._launching: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = True
+
+    def start(self) -> 'BrowserPool':
+        """
+        Starts browsers in background.
+
+        :return: browser pool
+        """
+        with self._lock:
+            self._closed = False
+        self._fill()
+        return self
+
+    def lease(self) -> WebDriver:
+        """
+        Returns started browser. If no browser is ready, new one is started at once. Browser is started
+        in background in place of leased one.
+
+        :raises BrowserPoolException: if pool is closed
+        :return: web driver of browser
+        """
+        with self._lock:
+            if self._closed:
+                raise BrowserPoolException('Browser pool is closed.')
+            webdriver = self._idle.pop() if self._idle else None
+        if webdriver is None:
+            webdriver = self.factory()
+        self._fill()
+        return webdriver
+
+    def release(self, webdriver: WebDriver) -> None:
+        """
+        Returns browser to pool. Its cookies are deleted and pages are unloaded. Browser is quit if it cannot be
+        cleared or pool is full.
+
+        :param webdriver: web driver of leased browser
+        :return: None
+        """
+        try:
+            webdriver.delete_all_cookies()
+            webdriver.get('about:blank')
+        except BROWSER_ERRORS:
+            self._quit(webdriver)
+            self._fill()
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(webdriver)
+                return
+        self._quit(webdriver)
+
+    def close(self) -> None:
+        """
+        Quits browsers which are ready and browsers being started. Leased browsers are quit when they are released.
+
+        :return: None
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            launching = list(self._launching)
+        for webdriver in idle:
+            self._quit(webdriver)
+        for thread in launching:
+            thread.join()
+
+    def __enter__(self) -> 'BrowserPool':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fill(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            threads = [threading.Thread(target=self._launch, daemon=True)
+                       for _ in range(self.size - len(self._idle) - len(self._launching))]
+            self._launching.extend(threads)
+        for thread in threads:
+            thread.start()
+
+    def _launch(self) -> None:
+        try:
+            webdriver = self.factory()
+        except BROWSER_ERRORS:
+            webdriver = None
+        with self._lock:
+            self._launching.remove(threading.current_thread())
+            if webdriver is None:
+                self.failures += 1  # browser will be started by lease() if pool is empty
+                return
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(webdriver)
+                return
+        self._quit(webdriver)
+
+    @staticmethod
+    def _quit(webdriver: WebDriver) -> None:
+        try:
+            webdriver.quit()
+        except BROWSER_ERRORS:
+            pass
+
+
+class SharedBrowser:
+    """
+    Creates web browser shared by many web controllers (e.g. of many switches). Each web controller has its own
+    window and uses browser only while it holds lock of browser, so memory grows with windows instead of browsers.
+    Windows share cookies, so web controllers of the same switch share session.
+    """
+
+    def __init__(self, webdriver: Optional[WebDriver] = None, headless: bool = True, lean: bool = True) -> None:
+        self.webdriver = webdriver if webdriver is not None else start_chrome(headless, lean)
+        self.lock = threading.RLock()  # held by web controller using browser
+        self._current_window = self.webdriver.current_window_handle
+        self._spare_window: Optional[str] = self._current_window  # window of browser which is not used yet
+        self._windows: List[str] = []
+        self._hosts: Dict[str, str] = {}  # switches by windows of web controllers
+
+    def open_window(self, tab: bool = False, host: Optional[str] = None) -> str:
+        """
+        Opens new window (first window of browser is used first) and activates it.
+
+        :param tab: if True new tab is opened next to current window instead (e.g. for pinned tab of web controller
+                    which has its window already), window of browser which is not used yet is left spare
+        :param host: host address of switch controlled in window (see shares_session())
+        :return: handle of window
+        """
+        with self.lock:
+            if self._spare_window is not None and not tab:
+                window, self._spare_window = self._spare_window, None
+                self.activate(window)
+            else:
+                self.webdriver.switch_to.new_window('tab' if tab else 'window')
+                window = self._current_window = self.webdriver.current_window_handle
+            self._windows.append(window)
+            if host is not None:
+                self._hosts[window] = host
+            return window
+
+    def shares_session(self, window: str) -> bool:
+        """
+        Checks if other window controls the same switch as given window. Windows share cookies, so logging out
+        in given window would end session of the other one too.
+
+        :param window: handle of window
+        :return: True if switch of window is controlled in other window too, otherwise False
+        """
+        host = self._hosts.get(window)
+        return host is not None and any(other != window and other_host == host
+                                        for other, other_host in self._hosts.items())
+
+    def activate(self, window: str) -> bool:
+        """
+        Switches browser to given window unless it is current window already. Caller must hold lock.
+
+        :param window: handle of window
+        :return: True if browser was switched (top level document of window is active then), otherwise False
+        """
+        if window == self._current_window:
+            return False
+        self.webdriver.switch_to.window(window)
+        self._current_window = window
+        return True
+
+    def close_window(self, window: str) -> None:
+        """
+        Closes given window. Last window is not closed (it would quit browser), its page is unloaded instead.
+
+        :param window: handle of window
+        :return: None
+        """
+        with self.lock:
+            self._windows.remove(window)
+            self._hosts.pop(window, None)
+            self.activate(window)
+            if self._windows or self._spare_window is not None:
+                self.webdriver.close()
+                self._current_window = None
+            else:
+                self.webdriver.get('about:blank')
+                self._spare_window = window
+
+    def quit(self) -> None:
+        """
+        Quits browser with all its windows.
+
+        :return: None
+        """
+        with self.lock:
+            self.webdriver.quit()
+            self._windows = []
+            self._hosts = {}
+
+    def __enter__(self) -> 'SharedBrowser':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.quit()
@@ -1,11 +1,15 @@
 """Contains code to manage elements visible on given section form menu. It is common for all sections."""
 
-from typing import Callable
+from typing import Callable, Dict, List, Optional, Union
 from functools import wraps
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 
-from ..utils import Frame
-from ..exceptions import TpLinkSwitchException
+from ..utils import Frame, PAGES
+from ..exceptions import TpLinkSwitchException, DeadlineExceededException
+
+
+TIP_QUERY = "//span[@id='sp_tip_svr']/span[@class='TIP_CONTENT']"
 
 
 class ControlField:
@@ -18,37 +22,66 @@ class ControlField:
     def login_required(func: Callable) -> Callable:
         """
         Decorator to check if client is login. If client is not login it will try login again.
+        If method failed because session expired, client is logged in again and method is retried once.
+        Read only method is also retried if admin page was loaded again in the meantime.
+        Decorated method accepts keyword argument ``deadline`` - maximum time (in seconds) of whole call
+        (including login and retry). Its waits don't last longer and DeadlineExceededException is raised
+        when it passes.
 
         :param func: function to decorate
         :return: internal wrapper
         """
         @wraps(func)
-        def inner(self, *args, **kwargs):
-            if not self.web_controller.is_logged_in():
-                self.web_controller.login()
-            return func(self, *args, **kwargs)
+        def inner(self, *args, deadline: Optional[float] = None, **kwargs):
+            self.web_controller.begin_operation(read_only=getattr(func, 'read_only', False), deadline=deadline)
+            try:
+                self.web_controller.ensure_logged_in()
+                try:
+                    result = func(self, *args, **kwargs)
+                except DeadlineExceededException:
+                    raise
+                except (TpLinkSwitchException, WebDriverException):
+                    if not self.web_controller.recover_session():
+                        raise
+                    result = func(self, *args, **kwargs)
+            except BaseException:
+                self.web_controller.end_operation(failed=True)
+                raise
+            self.web_controller.end_operation()
+            return result
         return inner
 
+    @staticmethod
+    def read_only(func: Callable) -> Callable:
+        """
+        Decorator to mark method which only reads settings (it does not change configuration of switch).
+        Web controller may run such method over faster read path (e.g. plain HTTP in hybrid mode).
+        It has to be placed below login_required decorator.
+
+        :param func: function to decorate
+        :return: the same function
+        """
+        func.read_only = True
+        return func
+
     def open_tab(self, section: str, tab: str) -> None:
         """
-        Opens given tab from menu in admin page of switch.
+        Opens given tab from menu in admin page of switch. Page of known tab is loaded directly into main frame,
+        other tabs are opened by clicking links in sidebar navigation. Pinned tab is opened in its own window
+        (see WebController.use_tab_window()).
 
         :param section: main manu section (e.g. System)
         :param tab: subsection from menu (e.g. System Info)
         :return: None
         """
-        self.web_controller.switch_to_frame(Frame.MENU)
-        system_info_link_details = (By.XPATH, f"//ul[@id='menu']//li//a[contains(text(), '{tab}')]")
-        system_info_link = self.web_controller.webdriver.find_element(*system_info_link_details)
-        if not system_info_link.is_displayed():
-            system_link_details = (By.XPATH,
-                                   f"//ul[@id='menu']//a[@class='menulink' and contains(text(), '{section}')]")
-            self.web_controller.wait_until_element_is_present(*system_link_details)
-            system_link = self.web_controller.webdriver.find_element(*system_link_details)
-            system_link.click()
-        self.web_controller.wait_until_element_is_present(*system_info_link_details)
-        system_info_link = self.web_controller.webdriver.find_element(*system_info_link_details)
-        system_info_link.click()
+        self.web_controller.use_tab_window((section, tab))
+        if self.web_controller.current_tab == (section, tab):
+            return
+        if (section, tab) in PAGES:
+            self.web_controller.open_page(Frame.MAIN, PAGES[section, tab])
+        else:
+            self._click_menu_link(section, tab)
+        self.web_controller.current_tab = (section, tab)
 
     def wait_for_success_alert(self) -> bool:
         """
@@ -65,16 +98,11 @@ class ControlField:
 
     def get_alert_text(self) -> str:
         """
-        Returns alert text.
+        Returns text of tip (or alert) shown after settings were applied. It returns as soon as outcome is known.
 
-        :return: text
+        :return: text (empty if there is no tip)
         """
-        alert_details = (By.XPATH, "//span[@id='sp_tip_svr']/span[@class='TIP_CONTENT']")
-        try:
-            self.web_controller.wait_until_element_is_visible(*alert_details)
-        except TpLinkSwitchException:
-            return ''
-        return self.web_controller.find_element(*alert_details).text
+        return self.web_controller.wait_until_settings_are_applied(TIP_QUERY)
 
     def apply_settings(self, method: By, query: str, wait_for_confirmation_alert: bool = False) -> None:
         """
@@ -86,10 +114,41 @@ class ControlField:
         :return: None
         """
         apply_button_details = (method, query)
-        self.web_controller.wait_until_element_is_present(*apply_button_details)
-        apply_button = self.web_controller.find_element(*apply_button_details)
+        apply_button = self.web_controller.wait_until_element_is_present(*apply_button_details)
+        self.web_controller.mark_page(TIP_QUERY, query)
         apply_button.click()
         if wait_for_confirmation_alert:
-            self.web_controller.wait_until_alert_is_present()
-            alert = self.web_controller.webdriver.switch_to.alert
-            alert.accept()
+            self._accept_confirmation_alert()
+
+    def apply_form(self, fields: Dict[str, Union[str, bool, List[str]]], query: str,
+                   wait_for_confirmation_alert: bool = False, exception=TpLinkSwitchException) -> None:
+        """
+        Fills form with given values and applies it in one driver command (see WebController.fill_form).
+
+        :param fields: values by XPath queries of fields
+        :param query: XPath query of apply button
+        :param wait_for_confirmation_alert: indicates if method should wait for browser alert to confirm applying
+        :param exception: exception object raised if field cannot be set (e.g. its option is disabled)
+        :return: None
+        """
+        self.web_controller.mark_page(TIP_QUERY, query)
+        self.web_controller.fill_form(fields, submit=query, exception=exception)
+        if wait_for_confirmation_alert:
+            self._accept_confirmation_alert()
+
+    def _click_menu_link(self, section: str, tab: str) -> None:
+        self.web_controller.switch_to_frame(Frame.MENU)
+        system_info_link_details = (By.XPATH, f"//ul[@id='menu']//li//a[contains(text(), '{tab}')]")
+        system_info_link = self.web_controller.webdriver.find_element(*system_info_link_details)
+        if not system_info_link.is_displayed():
+            system_link_details = (By.XPATH,
+                                   f"//ul[@id='menu']//a[@class='menulink' and contains(text(), '{section}')]")
+            system_link = self.web_controller.wait_until_element_is_present(*system_link_details)
+            system_link.click()
+            system_info_link = self.web_controller.wait_until_element_is_present(*system_info_link_details)
+        system_info_link.click()
+        self.web_controller.forget_elements(Frame.MAIN)
+
+    def _accept_confirmation_alert(self) -> None:
+        alert = self.web_controller.wait_until_alert_is_present()
+        alert.accept()
@@ -1,13 +1,10 @@
 """Contains code to manage QoS section from menu tab."""
 
 from typing import Dict
-from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import Select
 
 from .control_field import ControlField
 from ..utils import Frame, validate_port_id
-from ..port import PriorityQueue
+from ..port import PriorityQueue, QOS_MODE_LABELS
 from ..exceptions import QoSModeException, QoSPriorityQueueException
 
 
@@ -17,6 +14,7 @@ class QoSControlField(ControlField):
     _MENU_SECTION = 'QoS'
 
     @ControlField.login_required
+    @ControlField.read_only
     def qos_mode(self) -> str:
         """
         Returns enabled QoS mode.
@@ -26,14 +24,10 @@ class QoSControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'QoS Basic')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        input_ids = ['rd_portbase', 'rd_8021pbase', 'rx_dscp']
-        for iid in input_ids:
-            mode_input = self._find_qos_mode_input(iid)
-            if mode_input.is_selected():
-                td_details = (By.XPATH, '..')
-                td_element = mode_input.find_element(*td_details)
-                return td_element.text.strip()
-        raise QoSModeException('Cannot get QoS mode.')
+        mode = self.web_controller.get_page_variables('qosMode')['qosMode']
+        if mode not in QOS_MODE_LABELS:
+            raise QoSModeException('Cannot get QoS mode.')
+        return QOS_MODE_LABELS[mode]
 
     @ControlField.login_required
     def set_port_base_qos_mode(self) -> None:
@@ -87,23 +81,23 @@ class QoSControlField(ControlField):
             raise QoSModeException(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def priority_queue_port_settings(self) -> Dict[str, str]:
         """
         Return settings of port priorities in Port Base QoS mode.
         :raises QoSModeException: if QoS mode is not set to Port Base
         :return: port settings
         """
-        mode = self.qos_mode()
-        if mode != 'Port Based':
+        self.open_tab(self._MENU_SECTION, 'QoS Basic')
+        self.web_controller.switch_to_frame(Frame.MAIN)
+        variables = self.web_controller.get_page_variables('qosMode', 'portNumber', 'pPri')
+        if QOS_MODE_LABELS.get(variables['qosMode']) != 'Port Based':
             raise QoSModeException(
                 'Priority Queue settings can be read only in Port Base QoS mode. Enable this mode first.')
+        priority_queues = list(PriorityQueue)
         settings = {}
-        tds_details = (By.XPATH, "//form[@name='qos_port_priority_set']/table/tbody/tr[not(@class='TABLE_HEAD')]/td")
-        self.web_controller.wait_until_element_is_present(*tds_details)
-        tds = self.web_controller.find_elements(*tds_details)
-        tds = tds[1:]
-        for i in range(0, 24, 3):
-            settings[tds[i].text] = tds[i+1].text
+        for i in range(variables['portNumber']):
+            settings[f'Port {i + 1}'] = priority_queues[variables['pPri'][i]].value
         return settings
 
     @ControlField.login_required
@@ -120,16 +114,10 @@ class QoSControlField(ControlField):
         if mode != 'Port Based':
             raise QoSModeException('Priority Queue can be set only in Port Base QoS mode. Enable this mode first.')
         validate_port_id(port)
-        select_port_details = (By.XPATH, f"//td/input[@id='sel_{port}']")
-        self.web_controller.wait_until_element_is_present(*select_port_details)
-        select_port = self.web_controller.find_element(*select_port_details)
-        select_port.click()
-        priority_queue_details = (By.XPATH, "//tr[@class='TABLE_HEAD']/td/select[@name='port_queue']")
-        self.web_controller.wait_until_element_is_present(*priority_queue_details)
-        priority_queue_select = Select(self.web_controller.find_element(*priority_queue_details))
-        priority_queue_select.select_by_visible_text(priority_queue.value)
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({
+            f"//td/input[@id='sel_{port}']": True,
+            "//tr[@class='TABLE_HEAD']/td/select[@name='port_queue']": priority_queue.value,
+        }, "//a[@class='BTN']/input[@name='apply']", exception=QoSPriorityQueueException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise QoSPriorityQueueException(f'Cannot set Priority Queue for {port} port due to unknown error.')
@@ -137,13 +125,5 @@ class QoSControlField(ControlField):
             raise QoSPriorityQueueException(alert_info)
 
     def _select_and_apply_qos_mode(self, qos_input_id: str) -> None:
-        mode_input = self._find_qos_mode_input(qos_input_id)
-        mode_input.click()
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='qosmode']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
-
-    def _find_qos_mode_input(self, qos_input_id: str) -> WebElement:
-        input_details = (By.XPATH, f"//td/input[@id='{qos_input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_details)
-        mode_input = self.web_controller.find_element(*input_details)
-        return mode_input
+        self.apply_form({f"//td/input[@id='{qos_input_id}']": True}, "//a[@class='BTN']/input[@name='qosmode']",
+                        exception=QoSModeException)
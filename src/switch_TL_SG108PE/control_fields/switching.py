@@ -2,11 +2,11 @@
 
 from typing import List, Dict
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 from selenium.webdriver.remote.webelement import WebElement
 
 from .control_field import ControlField
-from ..utils import Frame, get_port_label, get_lag_label, validate_port_id, validate_lag_id
+from ..utils import (Frame, get_port_label, get_lag_label, validate_port_id, validate_lag_id,
+                     format_port_list, format_port_settings)
 from ..port import STATUS, SPEED, FLOW_CONTROL
 from ..exceptions import (PortSettingsException, IgmpSnoopingSettings, ReportMessageSuppressionSettings,
                           LAGPortException, OptionDisabledException)
@@ -18,6 +18,7 @@ class SwitchingControlField(ControlField):
     _MENU_SECTION = 'Switching'
 
     @ControlField.login_required
+    @ControlField.read_only
     def ports_settings(self) -> Dict[str, Dict[str, str]]:
         """
         Returns settings of all ports.
@@ -27,17 +28,12 @@ class SwitchingControlField(ControlField):
         self.open_tab(self._MENU_SECTION, 'Port Setting')
         self.web_controller.switch_to_frame(Frame.MAIN)
         ports_settings = {}
-        ports_rows_details = (By.XPATH, "//table[@class='BORDER']/tbody/tr/td[@class='TABLE_HEAD_BOTTOM']")
-        self.web_controller.wait_until_element_is_present(*ports_rows_details)
-        ports_rows = self.web_controller.find_elements(*ports_rows_details)
-        for i in range(0, 48, 6):
-            ports_settings[f'Port {i // 6 + 1}'] = {
-                'Status': ports_rows[i+1].text,
-                'Speed/Duplex Config': ports_rows[i+2].text,
-                'Speed/Duplex Actual': ports_rows[i+3].text,
-                'Flow Control Config': ports_rows[i+4].text,
-                'Flow Control Actual': ports_rows[i+5].text,
-            }
+        variables = self.web_controller.get_page_variables('all_info', 'max_port_num')
+        all_info = variables['all_info']
+        for i in range(variables['max_port_num']):
+            ports_settings[f'Port {i + 1}'] = format_port_settings(
+                all_info['state'][i], all_info['spd_cfg'][i], all_info['spd_act'][i], all_info['fc_cfg'][i],
+                all_info['fc_act'][i])
         return ports_settings
 
     @ControlField.login_required
@@ -58,20 +54,12 @@ class SwitchingControlField(ControlField):
         port_label = get_port_label(port)
         self.open_tab(self._MENU_SECTION, 'Port Setting')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        port_select_details = (By.XPATH, "//select[@id='portSel']")
-        if not self._select_port_setting(*port_select_details, port_label.value):
-            raise OptionDisabledException(f'Option {port_label} is disabled.')
-        status_select_details = (By.XPATH, "//select[@name='state']")
-        if not self._select_port_setting(*status_select_details, status.value):
-            raise OptionDisabledException(f'Option {status} is disabled.')
-        speed_select_details = (By.XPATH, "//select[@name='speed']")
-        if not self._select_port_setting(*speed_select_details, speed.value):
-            raise OptionDisabledException(f'Option {speed} is disabled.')
-        flow_control_select_details = (By.XPATH, "//select[@name='flowcontrol']")
-        if not self._select_port_setting(*flow_control_select_details, flow_control.value):
-            raise OptionDisabledException(f'Option {flow_control} is disabled.')
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({
+            "//select[@id='portSel']": port_label.value,
+            "//select[@name='state']": status.value,
+            "//select[@name='speed']": speed.value,
+            "//select[@name='flowcontrol']": flow_control.value,
+        }, "//td[@class='BTN_WRAPPER']/a/input[@name='apply']", exception=OptionDisabledException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise PortSettingsException(f'Cannot set "{status}", "{speed}", "{flow_control}" options '
@@ -80,6 +68,7 @@ class SwitchingControlField(ControlField):
             raise PortSettingsException(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def igmp_snooping(self) -> Dict[str, str]:
         """
         Returns settings of IGMP settings and Report Message Suppression.
@@ -107,10 +96,8 @@ class SwitchingControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'IGMP Snooping')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        enable_input = self._find_igmp_snooping_input('igmpEn')
-        enable_input.click()
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//input[@id='igmpEn']": True}, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']",
+                        exception=IgmpSnoopingSettings)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IgmpSnoopingSettings('Cannot enable igmp snooping due to unknown error.')
@@ -127,10 +114,8 @@ class SwitchingControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'IGMP Snooping')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        disable_input = self._find_igmp_snooping_input('igmpDis')
-        disable_input.click()
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//input[@id='igmpDis']": True}, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']",
+                        exception=IgmpSnoopingSettings)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IgmpSnoopingSettings('Cannot disable igmp snooping due to unknown error.')
@@ -147,10 +132,8 @@ class SwitchingControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'IGMP Snooping')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        enable_input = self._find_igmp_snooping_input('reportSuEn')
-        enable_input.click()
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//input[@id='reportSuEn']": True}, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']",
+                        exception=ReportMessageSuppressionSettings)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise ReportMessageSuppressionSettings('Cannot enable Report Message Suppression due to unknown error.')
@@ -167,10 +150,8 @@ class SwitchingControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'IGMP Snooping')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        disable_input = self._find_igmp_snooping_input('reportSuDis')
-        disable_input.click()
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//input[@id='reportSuDis']": True}, "//td[@class='BTN_WRAPPER']/a/input[@name='Apply']",
+                        exception=ReportMessageSuppressionSettings)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise ReportMessageSuppressionSettings('Cannot disable Report Message Suppression due to unknown error.')
@@ -178,6 +159,7 @@ class SwitchingControlField(ControlField):
             raise ReportMessageSuppressionSettings(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def lag_settings(self) -> Dict[str, str]:
         """
         Returns information about LAG settings.
@@ -187,14 +169,11 @@ class SwitchingControlField(ControlField):
         self.open_tab(self._MENU_SECTION, 'LAG')
         self.web_controller.switch_to_frame(Frame.MAIN)
         lag_settings = {}
-        lag_td_details = (
-            By.XPATH,
-            "//form[@name='port_trunk_display']/table[@class='BORDER']/tbody/tr/td[not(@class='TD_FIRST_COL')]"
-        )
-        self.web_controller.wait_until_element_is_present(*lag_td_details)
-        lag_tds = self.web_controller.find_elements(*lag_td_details)
-        for i in range(0, 6, 3):
-            lag_settings[lag_tds[i].text] = lag_tds[i+1].text
+        trunk_conf = self.web_controller.get_page_variables('trunk_conf')['trunk_conf']
+        for lag_id in range(1, trunk_conf['maxTrunkNum'] + 1):
+            members = trunk_conf[f'portStr_g{lag_id}'][:trunk_conf['portNum']]
+            ports = [port for port, member in enumerate(members, start=1) if member]
+            lag_settings[f'LAG{lag_id}'] = format_port_list(ports) if ports else '---'
         return lag_settings
 
     @ControlField.login_required
@@ -221,9 +200,10 @@ class SwitchingControlField(ControlField):
             raise LAGPortException('Port can not be selected, available ports of LAG 1: port 5 -- port 8')
         self.open_tab(self._MENU_SECTION, 'LAG')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        self._fill_lag_settings_form(lag_id, ports)
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='setapply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({
+            "//select[@id='trunkSel']": get_lag_label(lag_id).value,
+            "//select[@id='portSel']": [get_port_label(port).value for port in ports],
+        }, "//td[@class='BTN_WRAPPER']/a/input[@name='setapply']", exception=LAGPortException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise LAGPortException('Cannot add port to LAG group due to unknown error.')
@@ -244,12 +224,8 @@ class SwitchingControlField(ControlField):
         self.open_tab(self._MENU_SECTION, 'LAG')
         self.web_controller.switch_to_frame(Frame.MAIN)
         lag_label = get_lag_label(lag_id)
-        input_checkbox_details = (By.XPATH, f"//input[@name='chk_trunk' and @id='chk{lag_label.value.split()[1]}']")
-        self.web_controller.wait_until_element_is_present(*input_checkbox_details)
-        input_checkbox = self.web_controller.find_element(*input_checkbox_details)
-        input_checkbox.click()
-        delete_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='setDelete']")
-        self.apply_settings(*delete_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({f"//input[@name='chk_trunk' and @id='chk{lag_label.value.split()[1]}']": True},
+                        "//td[@class='BTN_WRAPPER']/a/input[@name='setDelete']", exception=LAGPortException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise LAGPortException('Cannot delete LAG group due to unknown error.')
@@ -258,30 +234,4 @@ class SwitchingControlField(ControlField):
 
     def _find_igmp_snooping_input(self, input_id: str) -> WebElement:
         input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_details)
-        return self.web_controller.find_element(*input_details)
-
-    def _select_port_setting(self, method: str, query: str, value: str) -> bool:
-        select_details = (method, query)
-        self.web_controller.wait_until_element_is_present(*select_details)
-        select = Select(self.web_controller.find_element(*select_details))
-        try:
-            select.select_by_visible_text(value)
-        except NotImplementedError:
-            return False
-        return True
-
-    def _fill_lag_settings_form(self, lag_id: int, ports: List[int]) -> None:
-        lag_select_details = (By.XPATH, "//select[@id='trunkSel']")
-        self.web_controller.wait_until_element_is_present(*lag_select_details)
-        lag_select = Select(self.web_controller.find_element(*lag_select_details))
-        lag_label = get_lag_label(lag_id)
-        lag_select.select_by_visible_text(lag_label.value)
-        port_select_details = (By.XPATH, "//select[@id='portSel']")
-        self.web_controller.wait_until_element_is_present(*port_select_details)
-        port_select = self.web_controller.find_element(*port_select_details)
-        for port in ports:
-            port_label = get_port_label(port)
-            option_details = (By.XPATH, f"//option[contains(text(),'{port_label.value}')]")
-            option = port_select.find_element(*option_details)
-            self.web_controller.click_element_with_control_key_pressed(option)
+        return self.web_controller.wait_until_element_is_present(*input_details)
@@ -3,7 +3,6 @@
 import ipaddress
 from typing import Dict
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 
 from .control_field import ControlField
 from ..utils import Frame
@@ -17,30 +16,25 @@ class SystemControlField(ControlField):
     _MENU_SECTION = 'System'
 
     @ControlField.login_required
+    @ControlField.read_only
     def system_info(self) -> Dict[str, str]:
         """
         Gets switch system information.
 
         :return: dict with basic information about switch system
         """
-        system_info = {}
         self.open_tab(self._MENU_SECTION, 'System Info')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        system_info_artifacts_ids = {
-            'Device Description': 'sp_devicetype',
-            'MAC Address': 'sp_macaddress',
-            'IP Address': 'sp_ipaddress',
-            'Subnet Mask': 'sp_netmask',
-            'Default Gateway': 'sp_gateway',
-            'Firmware Version': 'sp_firewareversion',
-            'Hardware Version': 'sp_hardwareversion',
+        info_ds = self.web_controller.get_page_variables('info_ds')['info_ds']
+        return {
+            'Device Description': info_ds['descriStr'][0],
+            'MAC Address': info_ds['macStr'][0],
+            'IP Address': info_ds['ipStr'][0],
+            'Subnet Mask': info_ds['netmaskStr'][0],
+            'Default Gateway': info_ds['gatewayStr'][0],
+            'Firmware Version': info_ds['firmwareStr'][0],
+            'Hardware Version': info_ds['hardwareStr'][0],
         }
-        for key, value in system_info_artifacts_ids.items():
-            artifact_details = (By.XPATH, f"//span[@id='{value}']")
-            self.web_controller.wait_until_element_is_present(*artifact_details)
-            artifact = self.web_controller.find_element(*artifact_details)
-            system_info[key] = artifact.text
-        return system_info
 
     @ControlField.login_required
     def set_device_description(self, description: str) -> None:
@@ -56,13 +50,7 @@ class SystemControlField(ControlField):
             raise DeviceDescriptionException('The length of device description should not be more than 32 characters.')
         self.open_tab(self._MENU_SECTION, 'System Info')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        input_field_details = (By.XPATH, "//input[@id='tDevDscr']")
-        self.web_controller.wait_until_element_is_present(*input_field_details)
-        input_field = self.web_controller.find_element(*input_field_details)
-        input_field.clear()
-        input_field.send_keys(description)
-        apply_button_details = (By.XPATH, "//input[@id='btApply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//input[@id='tDevDscr']": description}, "//input[@id='btApply']")
         alert_info = self.get_alert_text()
         if not alert_info:
             raise DeviceDescriptionException(f'Cannot set "{description}" description due to unknown error.')
@@ -70,27 +58,22 @@ class SystemControlField(ControlField):
             raise DeviceDescriptionException(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def ip_settings(self) -> Dict[str, str]:
         """
         Gets host settings. It shows host assigned to switch in network.
 
         :return: information about host, mask, gateway
         """
-        ip_info = {}
         self.open_tab(self._MENU_SECTION, 'IP Setting')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        ip_settings_artifacts_ids = {
-            'DHCP Setting': {'id': 'check_dhcp', 'ele_type': 'select'},
-            'IP Address': {'id': 'txt_addr', 'ele_type': 'input'},
-            'Subnet Mask': {'id': 'txt_mask', 'ele_type': 'input'},
-            'Default Gateway': {'id': 'txt_gateway', 'ele_type': 'input'},
+        ip_ds = self.web_controller.get_page_variables('ip_ds')['ip_ds']
+        return {
+            'DHCP Setting': 'enable' if ip_ds['state'] else 'disable',
+            'IP Address': ip_ds['ipStr'][0],
+            'Subnet Mask': ip_ds['netmaskStr'][0],
+            'Default Gateway': ip_ds['gatewayStr'][0],
         }
-        for key, value in ip_settings_artifacts_ids.items():
-            artifact_details = (By.XPATH, f"//{value['ele_type']}[@id='{value['id']}']")
-            self.web_controller.wait_until_element_is_present(*artifact_details)
-            artifact = self.web_controller.find_element(*artifact_details)
-            ip_info[key] = artifact.get_attribute('value')
-        return ip_info
 
     @ControlField.login_required
     def enable_dhcp_configuration(self) -> None:
@@ -132,11 +115,12 @@ class SystemControlField(ControlField):
         if ip_settings['DHCP Setting'] != 'disable':
             raise DhcpSettingsException('DHCP settings are enabled. '
                                         'Disable it to set own host. Use "disable_dhcp_settings()" method.')
-        self._enter_text_value_in_input_filed(ip_address, 'txt_addr')
-        self._enter_text_value_in_input_filed(subnet_mask, 'txt_mask')
-        self._enter_text_value_in_input_filed(default_gateway, 'txt_gateway')
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='submit']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        self.apply_form({
+            "//select[@id='check_dhcp']": 'Disable',
+            "//input[@id='txt_addr']": ip_address,
+            "//input[@id='txt_mask']": subnet_mask,
+            "//input[@id='txt_gateway']": default_gateway,
+        }, "//td[@class='BTN_WRAPPER']/a/input[@name='submit']", wait_for_confirmation_alert=True)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IpSettingException(
@@ -165,6 +149,7 @@ class SystemControlField(ControlField):
         self._select_led_radio_in_led_settings('off')
 
     @ControlField.login_required
+    @ControlField.read_only
     def user_account(self) -> Dict[str, str]:
         """
         Returns username of admin account.
@@ -174,8 +159,7 @@ class SystemControlField(ControlField):
         self.open_tab(self._MENU_SECTION, 'User Account')
         self.web_controller.switch_to_frame(Frame.MAIN)
         input_field_details = (By.XPATH, "//input[@id='txt_username']")
-        self.web_controller.wait_until_element_is_present(*input_field_details)
-        input_field = self.web_controller.find_element(*input_field_details)
+        input_field = self.web_controller.wait_until_element_is_present(*input_field_details)
         return {'Current Username': input_field.get_attribute('value')}
 
     @ControlField.login_required
@@ -193,12 +177,12 @@ class SystemControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'User Account')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        self._enter_text_value_in_input_filed(str(username), 'txt_username')
-        self._enter_text_value_in_input_filed(str(current_password), 'txt_oldpwd')
-        self._enter_text_value_in_input_filed(str(new_password), 'txt_userpwd')
-        self._enter_text_value_in_input_filed(str(confirm_password), 'txt_confirmpwd')
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='apply']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        self.apply_form({
+            "//input[@id='txt_username']": str(username),
+            "//input[@id='txt_oldpwd']": str(current_password),
+            "//input[@id='txt_userpwd']": str(new_password),
+            "//input[@id='txt_confirmpwd']": str(confirm_password),
+        }, "//td[@class='BTN_WRAPPER']/a/input[@name='apply']", wait_for_confirmation_alert=True)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise InvalidUserAccountDetailsException(
@@ -208,22 +192,15 @@ class SystemControlField(ControlField):
         if alert_info != 'Operation successful.':
             raise InvalidUserAccountDetailsException(f'Cannot set users details: {alert_info}')
 
-    def _enter_text_value_in_input_filed(self, value: str, input_id: str) -> None:
-        input_field_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_field_details)
-        input_field = self.web_controller.find_element(*input_field_details)
-        input_field.clear()
-        input_field.send_keys(value)
-
     def _select_dhcp_option_in_ip_settings(self, action: str = 'Enable') -> None:
-        self.open_tab(self._MENU_SECTION, 'IP Setting')
-        self.web_controller.switch_to_frame(Frame.MAIN)
-        dhcp_settings_select_details = (By.XPATH, "//select[@id='check_dhcp']")
-        self.web_controller.wait_until_element_is_present(*dhcp_settings_select_details)
-        dhcp_settings_select = Select(self.web_controller.find_element(*dhcp_settings_select_details))
-        dhcp_settings_select.select_by_visible_text(action)
-        apply_button_details = (By.XPATH, "//td[@class='BTN_WRAPPER']/a/input[@name='submit']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        ip_settings = self.ip_settings()
+        self.apply_form({
+            "//select[@id='check_dhcp']": action,
+            "//input[@id='txt_addr']": ip_settings['IP Address'],
+            "//input[@id='txt_mask']": ip_settings['Subnet Mask'],
+            "//input[@id='txt_gateway']": ip_settings['Default Gateway'],
+        }, "//td[@class='BTN_WRAPPER']/a/input[@name='submit']", wait_for_confirmation_alert=True,
+            exception=DhcpSettingsException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise DhcpSettingsException(f'Cannot select "{action}" in dhcp configuration due to unknown error.')
@@ -233,12 +210,8 @@ class SystemControlField(ControlField):
     def _select_led_radio_in_led_settings(self, action: str = 'on') -> None:
         self.open_tab(self._MENU_SECTION, 'LED On/Off')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        led_on_radio_details = (By.XPATH, f"//input[@id='led_{action}']")
-        self.web_controller.wait_until_element_is_present(*led_on_radio_details)
-        led_on_radio = self.web_controller.find_element(*led_on_radio_details)
-        led_on_radio.click()
-        apply_button_details = (By.XPATH, "//td/a[@class='BTN']/input[@name='led_cfg']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({f"//input[@id='led_{action}']": True}, "//td/a[@class='BTN']/input[@name='led_cfg']",
+                        exception=ChangeLedStateException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise ChangeLedStateException(f'Cannot set "{action}" state on LED due to unknown error.')
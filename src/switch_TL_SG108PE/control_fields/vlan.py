@@ -2,10 +2,10 @@
 
 from typing import List, Dict, Union
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 
 from .control_field import ControlField
-from ..utils import Frame, validate_vlan_id, validate_port_id, get_port_label
+from ..utils import (Frame, validate_vlan_id, validate_port_id, get_port_label, format_port_list,
+                     decode_ports_mask)
 from ..port import IEEE8021QPort
 from ..exceptions import (MtuVlanException, VlanConfigurationIsNotEnabledException, WrongNumberOfPortsException,
                           VlanIdException, PortIdException, MtuVlanUplinkPort, PortBaseVlanException,
@@ -18,6 +18,7 @@ class VLANControlField(ControlField):
     _MENU_SECTION = 'VLAN'
 
     @ControlField.login_required
+    @ControlField.read_only
     def mtu_vlan_configuration(self) -> Dict[str, str]:
         """
         Returns mtu VLAN configuration status and current uplink port.
@@ -73,12 +74,8 @@ class VLANControlField(ControlField):
         is_mtu_vlan_configuration_enabled = self._is_vlan_configuration_enabled('mtu_en')
         if not is_mtu_vlan_configuration_enabled:
             raise MtuVlanException('MTU VLAN should be enabled before setting uplink port.')
-        select_port_details = (By.XPATH, "//div[@id='div_sec_title']//select[@name='uplinkPort']")
-        self.web_controller.wait_until_element_is_present(*select_port_details)
-        select_port = Select(self.web_controller.find_element(*select_port_details))
-        select_port.select_by_visible_text(port.value)
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='mtu_uplink']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({"//div[@id='div_sec_title']//select[@name='uplinkPort']": port.value},
+                        "//a[@class='BTN']/input[@name='mtu_uplink']", exception=MtuVlanUplinkPort)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise MtuVlanUplinkPort(f'Cannot set "{port}" as mtu uplink port due to unknown error.')
@@ -86,6 +83,7 @@ class VLANControlField(ControlField):
             raise MtuVlanUplinkPort(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def port_based_vlan_configuration(self) -> Dict[str, Union[List[str], str]]:
         """
         Returns information about port based VLANs.
@@ -94,21 +92,18 @@ class VLANControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, 'Port Based VLAN')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        configuration_enabled = self._is_vlan_configuration_enabled('pvlan_en')
+        pvlan_ds = self.web_controller.get_page_variables('pvlan_ds')['pvlan_ds']
         port_based_vlan_configuration = {
-            'Port Based VLAN Configuration': 'Enable' if configuration_enabled else 'Disable',
+            'Port Based VLAN Configuration': 'Enable' if pvlan_ds['state'] else 'Disable',
             'VLANs': []
         }
-        if not configuration_enabled:
+        if not pvlan_ds['state']:
             return port_based_vlan_configuration
-        vlan_ports_tds_details = (By.XPATH,
-                                  "//div[not(@id='div_sec_title')]/form/table/tbody/tr[not(@class='TABLE_HEAD')]/td")
-        self.web_controller.wait_until_element_is_present(*vlan_ports_tds_details)
-        vlan_ports_tds = self.web_controller.find_elements(*vlan_ports_tds_details)
-        vlan_ports_tds = vlan_ports_tds[18:-3]
-        for i in range(0, len(vlan_ports_tds), 3):
-            port_based_vlan_configuration['VLANs'].append({'VLAN ID': vlan_ports_tds[i].text,
-                                                           'VLAN Member Port': vlan_ports_tds[i+1].text})
+        for vlan_id, members in zip(pvlan_ds['vids'][:pvlan_ds['count']], pvlan_ds['mbrs']):
+            port_based_vlan_configuration['VLANs'].append({
+                'VLAN ID': str(vlan_id),
+                'VLAN Member Port': format_port_list(decode_ports_mask(members))
+            })
         return port_based_vlan_configuration
 
     @ControlField.login_required
@@ -157,9 +152,9 @@ class VLANControlField(ControlField):
         if not self._is_vlan_configuration_enabled('pvlan_en'):
             raise VlanConfigurationIsNotEnabledException(
                 'Port VLAN configuration should be enabled before adding new VLAN.')
-        self._fill_add_port_base_vlan_form(vlan_id, ports)
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='pvlan_add']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+        fields = {"//input[@id='t_vid']": str(vlan_id)}
+        fields.update({f"//input[@id='port_{port_id}']": port_id in ports for port_id in range(1, 9)})
+        self.apply_form(fields, "//a[@class='BTN']/input[@name='pvlan_add']", exception=PortBaseVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise PortBaseVlanException(f'Cannot add "{ports}" to "{vlan_id}" VLAN due to unknown error.')
@@ -186,12 +181,8 @@ class VLANControlField(ControlField):
             raise VlanConfigurationIsNotEnabledException('Port VLAN should be enabled before VLAN deletion.')
         if not any(vlan['VLAN ID'] == str(vlan_id) for vlan in self.port_based_vlan_configuration()['VLANs']):
             raise VlanIdException(f'VLAN {vlan_id} is not added in configuration.')
-        delete_vlan_checkbox_details = (By.XPATH, f"//input[@id='vlan_{vlan_id}']")
-        self.web_controller.wait_until_element_is_present(*delete_vlan_checkbox_details)
-        delete_vlan_checkbox = self.web_controller.find_element(*delete_vlan_checkbox_details)
-        delete_vlan_checkbox.click()
-        delete_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='pvlan_del']")
-        self.apply_settings(*delete_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({f"//input[@id='vlan_{vlan_id}']": True}, "//a[@class='BTN']/input[@name='pvlan_del']",
+                        exception=PortBaseVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise PortBaseVlanException(f'Cannot delete "{vlan_id}" VLAN due to unknown error.')
@@ -199,6 +190,7 @@ class VLANControlField(ControlField):
             raise PortBaseVlanException(alert_info)
 
     @ControlField.login_required
+    @ControlField.read_only
     def ieee_802_1q_vlan_configuration(self) -> Dict[str, str]:
         """
         Returns information about 802.1Q VLANs.
@@ -207,24 +199,22 @@ class VLANControlField(ControlField):
         """
         self.open_tab(self._MENU_SECTION, '802.1Q VLAN')
         self.web_controller.switch_to_frame(Frame.MAIN)
-        configuration_enabled = self._is_vlan_configuration_enabled('qvlan_en')
+        qvlan_ds = self.web_controller.get_page_variables('qvlan_ds')['qvlan_ds']
         ieee_802_1q_vlan_configuration = {
-            '802.1Q VLAN Configuration': 'Enable' if configuration_enabled else 'Disable',
+            '802.1Q VLAN Configuration': 'Enable' if qvlan_ds['state'] else 'Disable',
             'VLANs': []
         }
-        if not configuration_enabled:
+        if not qvlan_ds['state']:
             return ieee_802_1q_vlan_configuration
-        vlan_ports_tds_details = (By.XPATH, "//form/table/tbody/tr[not(@class='TABLE_HEAD')]/td")
-        self.web_controller.wait_until_element_is_present(*vlan_ports_tds_details)
-        vlan_ports_tds = self.web_controller.find_elements(*vlan_ports_tds_details)
-        vlan_ports_tds = vlan_ports_tds[35:-3]
-        for i in range(0, len(vlan_ports_tds), 6):
+        vlans = zip(qvlan_ds['vids'][:qvlan_ds['count']], qvlan_ds['names'], qvlan_ds['tagMbrs'],
+                    qvlan_ds['untagMbrs'])
+        for vlan_id, name, tagged_members, untagged_members in vlans:
             ieee_802_1q_vlan_configuration['VLANs'].append({
-                'VLAN ID': vlan_ports_tds[i].text,
-                'VLAN Name': vlan_ports_tds[i+1].text,
-                'Member Ports': vlan_ports_tds[i+2].text,
-                'Tagged Ports': vlan_ports_tds[i+3].text,
-                'Untagged Ports': vlan_ports_tds[i+4].text,
+                'VLAN ID': str(vlan_id),
+                'VLAN Name': name,
+                'Member Ports': format_port_list(decode_ports_mask(tagged_members | untagged_members)),
+                'Tagged Ports': format_port_list(decode_ports_mask(tagged_members)),
+                'Untagged Ports': format_port_list(decode_ports_mask(untagged_members)),
             })
         return ieee_802_1q_vlan_configuration
 
@@ -275,18 +265,16 @@ class VLANControlField(ControlField):
         if not self._is_vlan_configuration_enabled('qvlan_en'):
             raise VlanConfigurationIsNotEnabledException(
                 '802.1Q VLAN configuration should be enabled before adding new VLAN.')
-        self._enter_value_in_vlan_input('t_vid', str(vlan_id))
+        fields = {"//input[@id='t_vid']": str(vlan_id)}
         if vlan_name:
-            self._enter_value_in_vlan_input('t_vname', vlan_name)
-        selected_port_ids = []
-        for port in ports:
-            selected_port_ids.append(port.port_id)
-            self._select_tagged_or_untagged_port(port)
+            fields["//input[@id='t_vname']"] = vlan_name
+        ports_by_id = {port.port_id: port for port in ports}
         for port_id in range(1, 9):
-            if port_id not in selected_port_ids:
-                self._select_not_member_port(port_id)
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='qvlan_add']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=False)
+            port = ports_by_id.get(port_id)
+            radio_id = f'nonSel_{port_id}' if port is None else \
+                f'tagSel_{port_id}' if port.tagged else f'untagSel_{port_id}'
+            fields[f"//input[@id='{radio_id}']"] = True
+        self.apply_form(fields, "//a[@class='BTN']/input[@name='qvlan_add']", exception=IEEE8021QVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IEEE8021QVlanException(f'Cannot add "{vlan_id}" VLAN due to unknown error.')
@@ -303,67 +291,30 @@ class VLANControlField(ControlField):
         :raises IEEE8021QVlanException: if VLAN deleting failed
         :return: None
         """
-        self.open_tab(self._MENU_SECTION, 'Port Based VLAN')
-        self.web_controller.switch_to_frame(Frame.MAIN)
         vlan_configuration = self.ieee_802_1q_vlan_configuration()
         if vlan_configuration['802.1Q VLAN Configuration'] != 'Enable':
             raise VlanConfigurationIsNotEnabledException(
                 '802.1Q VLAN configuration should be enabled before deleting vlan.')
         if not any(vlan['VLAN ID'] == str(vlan_id) for vlan in vlan_configuration['VLANs']):
             raise VlanIdException(f'VLAN {vlan_id} is not added in configuration.')
-        delete_vlan_checkbox_details = (By.XPATH, f"//input[@id='vlan_{vlan_id}']")
-        self.web_controller.wait_until_element_is_present(*delete_vlan_checkbox_details)
-        delete_vlan_checkbox = self.web_controller.find_element(*delete_vlan_checkbox_details)
-        delete_vlan_checkbox.click()
-        delete_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='qvlan_del']")
-        self.apply_settings(*delete_button_details, wait_for_confirmation_alert=False)
+        self.apply_form({f"//input[@id='vlan_{vlan_id}']": True}, "//a[@class='BTN']/input[@name='qvlan_del']",
+                        exception=IEEE8021QVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IEEE8021QVlanException(f'Cannot delete "{vlan_id}" VLAN due to unknown error.')
         if alert_info != 'Operation successful.':
             raise IEEE8021QVlanException(alert_info)
 
-    def _fill_add_port_base_vlan_form(self, vlan_id: int, ports: List[int]) -> None:
-        self._enter_value_in_vlan_input('t_vid', str(vlan_id))
-        for i in range(1, 9):
-            port_checkbox_details = (By.XPATH, f"//input[@id='port_{i}']")
-            self.web_controller.wait_until_element_is_present(*port_checkbox_details)
-            port_checkbox = self.web_controller.find_element(*port_checkbox_details)
-            if port_checkbox.is_selected() and i not in ports or not port_checkbox.is_selected() and i in ports:
-                port_checkbox.click()
-
-    def _enter_value_in_vlan_input(self, input_id: str, value: str) -> None:
-        vlan_id_input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*vlan_id_input_details)
-        vlan_id_input = self.web_controller.find_element(*vlan_id_input_details)
-        vlan_id_input.clear()
-        vlan_id_input.send_keys(value)
-
     def _is_vlan_configuration_enabled(self, input_id: str) -> bool:
         enable_input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*enable_input_details)
-        enable_input = self.web_controller.find_element(*enable_input_details)
+        enable_input = self.web_controller.wait_until_element_is_present(*enable_input_details)
         return enable_input.is_selected()
 
     def _get_current_uplink_port(self) -> str:
         current_uplink_port_div_details = (By.XPATH, "//div[@id='div_sec_title']//td/div")
-        self.web_controller.wait_until_element_is_present(*current_uplink_port_div_details)
-        current_uplink_port_div = self.web_controller.find_element(*current_uplink_port_div_details)
+        current_uplink_port_div = self.web_controller.wait_until_element_is_present(*current_uplink_port_div_details)
         return current_uplink_port_div.text
 
-    def _select_tagged_or_untagged_port(self, port: IEEE8021QPort) -> None:
-        tagged_input_id = f'tagSel_{port.port_id}' if port.tagged else f'untagSel_{port.port_id}'
-        port_radio_details = (By.XPATH, f"//input[@id='{tagged_input_id}']")
-        self.web_controller.wait_until_element_is_present(*port_radio_details)
-        port_radio = self.web_controller.find_element(*port_radio_details)
-        port_radio.click()
-
-    def _select_not_member_port(self, port_id: int) -> None:
-        not_member_radio_details = (By.XPATH, f"//input[@id='nonSel_{port_id}']")
-        self.web_controller.wait_until_element_is_present(*not_member_radio_details)
-        not_member_radio = self.web_controller.find_element(*not_member_radio_details)
-        not_member_radio.click()
-
     def _select_mtu_vlan_configuration(self, action: str = 'Enable') -> None:
         self.open_tab(self._MENU_SECTION, 'MTU VLAN')
         self.web_controller.switch_to_frame(Frame.MAIN)
@@ -372,12 +323,8 @@ class VLANControlField(ControlField):
                 not is_mtu_vlan_configuration_enabled and action == 'Disable':
             return
         input_id = dict(Enable='mtu_en', Disable='mtu_dis').get(action)
-        input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_details)
-        input_ = self.web_controller.find_element(*input_details)
-        input_.click()
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='mtu_mode']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        self.apply_form({f"//input[@id='{input_id}']": True}, "//a[@class='BTN']/input[@name='mtu_mode']",
+                        wait_for_confirmation_alert=True, exception=MtuVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise MtuVlanException(f'Cannot select "{action}" in mtu vlan configuration due to unknown error.')
@@ -391,12 +338,8 @@ class VLANControlField(ControlField):
         if configuration_enabled and action == 'Enable' or not configuration_enabled and action == 'Disable':
             return
         input_id = dict(Enable='pvlan_en', Disable='pvlan_dis').get(action)
-        input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_details)
-        input_ = self.web_controller.find_element(*input_details)
-        input_.click()
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='pvlan_mode']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        self.apply_form({f"//input[@id='{input_id}']": True}, "//a[@class='BTN']/input[@name='pvlan_mode']",
+                        wait_for_confirmation_alert=True, exception=PortBaseVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise PortBaseVlanException(
@@ -411,12 +354,8 @@ class VLANControlField(ControlField):
         if configuration_enabled and action == 'Enable' or not configuration_enabled and action == 'Disable':
             return
         input_id = dict(Enable='qvlan_en', Disable='qvlan_dis').get(action)
-        input_details = (By.XPATH, f"//input[@id='{input_id}']")
-        self.web_controller.wait_until_element_is_present(*input_details)
-        input_ = self.web_controller.find_element(*input_details)
-        input_.click()
-        apply_button_details = (By.XPATH, "//a[@class='BTN']/input[@name='qvlan_mode']")
-        self.apply_settings(*apply_button_details, wait_for_confirmation_alert=True)
+        self.apply_form({f"//input[@id='{input_id}']": True}, "//a[@class='BTN']/input[@name='qvlan_mode']",
+                        wait_for_confirmation_alert=True, exception=IEEE8021QVlanException)
         alert_info = self.get_alert_text()
         if not alert_info:
             raise IEEE8021QVlanException(
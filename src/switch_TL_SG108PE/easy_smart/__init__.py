@@ -0,0 +1,16 @@
+"""Contains code to read switch settings via Easy Smart Configuration Utility protocol (UDP)."""
+
+from .client import EasySmartClient
+from .discovery import discover
+from .stand_in import EasySmartStandIn, StandInSwitch
+from . import protocol, control_fields
+
+
+__all__ = [
+    'EasySmartClient',
+    'discover',
+    'EasySmartStandIn',
+    'StandInSwitch',
+    'protocol',
+    'control_fields'
+]
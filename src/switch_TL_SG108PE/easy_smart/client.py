@@ -0,0 +1,261 @@
+"""Contains UDP transport used to communicate with switch via Easy Smart protocol."""
+
+import socket
+import time
+import uuid
+from typing import Callable, List, Optional
+
+from . import protocol
+from .protocol import ErrorCode, Field, OpCode, Packet
+from ..exceptions import EasySmartProtocolException, LoginException
+
+
+class EasySmartClient:
+    """
+    Creates object to communicate with switch via Easy Smart Configuration Utility protocol (UDP).
+    Switch answers by broadcast, so requests are sent to broadcast address and switch is recognised
+    by its MAC address (found once by its IP address).
+    """
+
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(self, host: str, username: str, password: str, *, timeout: float = 1.0,
+                 broadcast: str = protocol.BROADCAST_ADDRESS, switch_port: int = protocol.SWITCH_PORT,
+                 client_port: int = protocol.CLIENT_PORT) -> None:
+        self.host = host
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.broadcast = broadcast
+        self.switch_port = switch_port
+        self.client_port = client_port
+        self.host_mac = uuid.getnode().to_bytes(6, 'big')
+        self.switch_mac = None
+        self.token_id = None
+        self._sequence_id = 0
+        self._socket = None
+
+    def login(self) -> None:
+        """
+        Login user in switch.
+
+        :raises LoginException: if switch rejected credentials or did not answer
+        :return: None
+        """
+        try:
+            if self.switch_mac is None:
+                self.switch_mac = self._find_switch_mac()
+            reply = self.request(OpCode.LOGIN, [(Field.USERNAME, protocol.encode_string(self.username)),
+                                                (Field.PASSWORD, protocol.encode_string(self.password))])
+        except EasySmartProtocolException as error:
+            raise LoginException(f'Couldn\'t login to {self.host}: {error}') from None
+        self.token_id = reply.token_id
+
+    def logout(self) -> None:
+        """
+        Logout user from switch. Protocol does not have logout operation, so token is just forgotten.
+
+        :return: None
+        """
+        self.token_id = None
+
+    def is_logged_in(self) -> bool:
+        """
+        Checks if user is logged in. Token is forgotten when switch answers that it is not valid
+        (e.g. switch was restarted), so no datagram is exchanged.
+
+        :return: True if user is logged in, otherwise False
+        """
+        return self.token_id is not None
+
+    def export_session(self) -> List[dict]:
+        """
+        Returns cookies of current session. Protocol does not use cookies, so nothing is exported.
+
+        :return: empty list
+        """
+        return []
+
+    def adopt_session(self, cookies: List[dict]) -> bool:  # pylint: disable=unused-argument
+        """
+        Protocol does not use cookies, so session of other process can't be adopted (logging in is cheap anyway).
+
+        :param cookies: cookies of other process
+        :return: False
+        """
+        return False
+
+    def ensure_logged_in(self) -> None:
+        """
+        Login user if token was not received yet.
+
+        :return: None
+        """
+        if not self.is_logged_in():
+            self.login()
+
+    def recover_session(self) -> bool:
+        """
+        Called after control field method failed. If switch rejected token, user is logged in again
+        and method should be retried.
+
+        :raises LoginException: if switch rejected credentials or did not answer
+        :return: True if user was logged in again, otherwise False
+        """
+        if self.is_logged_in():
+            return False
+        self.login()
+        return True
+
+    def keep_session_alive(self, max_idle: float = 0.0) -> float:
+        """
+        Login user if token was not received yet. Protocol does not allow to check token, so nothing else is done.
+
+        :param max_idle: time (in seconds) after which session should be renewed
+        :return: time (in seconds) after which session should be renewed next time
+        """
+        self.ensure_logged_in()
+        return max_idle
+
+    def begin_operation(self, read_only: bool = False, deadline: Optional[float] = None) -> None:
+        """
+        Marks beginning of control field method. Each read is a separate datagram exchange (bounded by timeout
+        of client), so nothing is done.
+
+        :param read_only: True if operation does not change configuration of switch
+        :param deadline: maximum time (in seconds) of operation
+        :return: None
+        """
+
+    def end_operation(self, failed: bool = False) -> None:
+        """
+        Marks end of control field method.
+
+        :param failed: True if method raised an exception
+        :return: None
+        """
+
+    def shares_session(self) -> bool:
+        """
+        Checks if session is shared with other client. Each client has its own token, so it never is.
+
+        :return: False
+        """
+        return False
+
+    def quit(self, browser: bool = True) -> None:  # pylint: disable=unused-argument
+        """
+        Closes socket.
+
+        :param browser: not used (there is no web browser)
+        :return: None
+        """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def get(self, *fields: Field) -> Packet:
+        """
+        Reads given fields from switch in one datagram exchange.
+
+        :param fields: types of requested records
+        :raises EasySmartProtocolException: if switch did not answer or returned error
+        :return: received packet
+        """
+        return self.request(OpCode.GET, [(field, b'') for field in fields])
+
+    def request(self, op_code: OpCode, records: List[tuple]) -> Packet:
+        """
+        Sends packet to switch and waits for its answer.
+
+        :param op_code: operation code
+        :param records: records sent to switch
+        :raises EasySmartProtocolException: if switch did not answer or returned error
+        :return: received packet
+        """
+        packet = Packet(op_code, self.switch_mac, self.host_mac, self._next_sequence_id(),
+                        token_id=self.token_id or 0, records=records)
+        self.send(packet)
+        reply = self.receive(lambda reply: reply.sequence_id == packet.sequence_id and
+                             reply.switch_mac == self.switch_mac)
+        if reply is None:
+            raise EasySmartProtocolException(f'Switch {self.host} did not answer.')
+        if reply.error_code == ErrorCode.NOT_LOGGED_IN:
+            self.token_id = None
+        if reply.error_code:
+            raise EasySmartProtocolException(f'Switch {self.host} returned error {reply.error_code}.')
+        return reply
+
+    def send(self, packet: Packet) -> None:
+        """
+        Sends packet to broadcast address.
+
+        :param packet: packet to send
+        :return: None
+        """
+        self._get_socket().sendto(protocol.encode(packet), (self.broadcast, self.switch_port))
+
+    def receive(self, accept: Callable[[Packet], bool], timeout: Optional[float] = None) -> Optional[Packet]:
+        """
+        Waits for answer accepted by given function. Other datagrams (e.g. answers for other hosts) are skipped.
+
+        :param accept: function which checks if received packet is expected answer
+        :param timeout: maximal time of waiting (in seconds), default timeout of client is used if not given
+        :return: received packet or None if there was no such answer in given time
+        """
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        sock = self._get_socket()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            sock.settimeout(remaining)
+            try:
+                datagram, _ = sock.recvfrom(0x10000)
+            except socket.timeout:
+                return None
+            try:
+                reply = protocol.decode(datagram)
+            except EasySmartProtocolException:
+                continue
+            if reply.op_code == OpCode.RETURN and reply.host_mac == self.host_mac and accept(reply):
+                return reply
+
+    def discover(self, timeout: Optional[float] = None) -> List[Packet]:
+        """
+        Broadcasts discovery packet once and collects answers of all switches in network segment.
+
+        :param timeout: time of collecting answers (in seconds), default timeout of client is used if not given
+        :return: answers (one per switch)
+        """
+        sequence_id = self._next_sequence_id()
+        self.send(Packet(OpCode.DISCOVERY, host_mac=self.host_mac, sequence_id=sequence_id))
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        replies = {}
+        while True:
+            reply = self.receive(lambda reply: reply.sequence_id == sequence_id and reply.switch_mac not in replies,
+                                 timeout=deadline - time.monotonic())
+            if reply is None:
+                return list(replies.values())
+            replies[reply.switch_mac] = reply
+
+    def _find_switch_mac(self) -> bytes:
+        sequence_id = self._next_sequence_id()
+        self.send(Packet(OpCode.DISCOVERY, host_mac=self.host_mac, sequence_id=sequence_id))
+        address = socket.gethostbyname(self.host)
+        reply = self.receive(lambda reply: reply.sequence_id == sequence_id and
+                             protocol.decode_ip(reply.value(Field.IP_ADDRESS)) == address)
+        if reply is None:
+            raise EasySmartProtocolException(f'Switch {self.host} was not found in network.')
+        return reply.switch_mac
+
+    def _next_sequence_id(self) -> int:
+        self._sequence_id = (self._sequence_id + 1) % 0x10000
+        return self._sequence_id
+
+    def _get_socket(self) -> socket.socket:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self._socket.bind(('', self.client_port))
+        return self._socket
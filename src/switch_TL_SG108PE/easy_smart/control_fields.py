@@ -0,0 +1,165 @@
+"""
+Contains control fields reading switch settings via Easy Smart protocol. They return the same structures
+as control fields of admin web page. Each method needs only one datagram exchange.
+"""
+
+from typing import Dict, List, Union
+
+from . import protocol
+from .protocol import Field
+from ..control_fields.control_field import ControlField
+from ..port import PriorityQueue, QOS_MODE_LABELS
+from ..utils import format_port_list, format_port_settings, format_port_statistics, decode_ports_mask
+from ..exceptions import QoSModeException
+
+
+class EasySmartSystemControlField(ControlField):
+    """Creates object to read system settings of switch via Easy Smart protocol."""
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def system_info(self) -> Dict[str, str]:
+        """
+        Gets switch system information.
+
+        :return: dict with basic information about switch system
+        """
+        reply = self.web_controller.get(*protocol.SYSTEM_INFO_FIELDS)
+        return protocol.decode_system_info(reply)
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def ip_settings(self) -> Dict[str, str]:
+        """
+        Gets host settings. It shows host assigned to switch in network.
+
+        :return: information about host, mask, gateway
+        """
+        reply = self.web_controller.get(Field.DHCP, Field.IP_ADDRESS, Field.SUBNET_MASK, Field.DEFAULT_GATEWAY)
+        return {
+            'DHCP Setting': 'enable' if reply.value(Field.DHCP)[0] else 'disable',
+            'IP Address': protocol.decode_ip(reply.value(Field.IP_ADDRESS)),
+            'Subnet Mask': protocol.decode_ip(reply.value(Field.SUBNET_MASK)),
+            'Default Gateway': protocol.decode_ip(reply.value(Field.DEFAULT_GATEWAY)),
+        }
+
+
+class EasySmartSwitchingControlField(ControlField):
+    """Creates object to read switching settings of switch via Easy Smart protocol."""
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def ports_settings(self) -> Dict[str, Dict[str, str]]:
+        """
+        Returns settings of all ports.
+
+        :return: settings
+        """
+        reply = self.web_controller.get(Field.PORT_SETTINGS)
+        ports_settings = {}
+        for value in reply.values(Field.PORT_SETTINGS):
+            port, status, _, speed_config, speed_actual, flow_control_config, flow_control_actual = \
+                protocol.PORT_SETTINGS.unpack(value)
+            ports_settings[f'Port {port}'] = format_port_settings(status, speed_config, speed_actual,
+                                                                  flow_control_config, flow_control_actual)
+        return ports_settings
+
+
+class EasySmartMonitoringControlField(ControlField):
+    """Creates object to read monitoring settings of switch via Easy Smart protocol."""
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def port_statistics(self, refresh: bool = True) -> Dict[str, Dict[str, str]]:  # pylint: disable=unused-argument
+        """
+        Displays the traffic information of each port,
+        which facilitates you to monitor the traffic and analyze the network abnormity.
+
+        :param refresh: kept for compatibility with web control field (statistics are always up to date)
+        :return: statistics information
+        """
+        reply = self.web_controller.get(Field.PORT_STATISTICS)
+        port_statistics = {}
+        for value in reply.values(Field.PORT_STATISTICS):
+            port, status, link_status, *packets = protocol.PORT_STATISTICS.unpack(value)
+            port_statistics[f'Port {port}'] = format_port_statistics(status, link_status, packets)
+        return port_statistics
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def loop_prevention(self) -> Dict[str, str]:
+        """
+        Returns status of enabling loop prevention.
+
+        :return: info about loop prevention (Enable / Disable)
+        """
+        reply = self.web_controller.get(Field.LOOP_PREVENTION)
+        return {'Loop Prevention': 'Enable' if reply.value(Field.LOOP_PREVENTION)[0] else 'Disable'}
+
+
+class EasySmartVLANControlField(ControlField):
+    """Creates object to read VLAN settings of switch via Easy Smart protocol."""
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def ieee_802_1q_vlan_configuration(self) -> Dict[str, Union[str, List[Dict[str, str]]]]:
+        """
+        Returns information about 802.1Q VLANs.
+
+        :return: downloaded configuration info
+        """
+        reply = self.web_controller.get(Field.IEEE_802_1Q_VLAN_ENABLED, Field.IEEE_802_1Q_VLAN)
+        if not reply.value(Field.IEEE_802_1Q_VLAN_ENABLED)[0]:
+            return {'802.1Q VLAN Configuration': 'Disable', 'VLANs': []}
+        ieee_802_1q_vlan_configuration = {'802.1Q VLAN Configuration': 'Enable', 'VLANs': []}
+        for value in reply.values(Field.IEEE_802_1Q_VLAN):
+            vlan_id, member_mask, tagged_mask = protocol.IEEE_802_1Q_VLAN.unpack_from(value)
+            member_ports = decode_ports_mask(member_mask)
+            tagged_ports = decode_ports_mask(tagged_mask)
+            ieee_802_1q_vlan_configuration['VLANs'].append({
+                'VLAN ID': str(vlan_id),
+                'VLAN Name': protocol.decode_string(value[protocol.IEEE_802_1Q_VLAN.size:]),
+                'Member Ports': format_port_list(member_ports),
+                'Tagged Ports': format_port_list(tagged_ports),
+                'Untagged Ports': format_port_list(port for port in member_ports if port not in tagged_ports),
+            })
+        return ieee_802_1q_vlan_configuration
+
+
+class EasySmartQoSControlField(ControlField):
+    """Creates object to read QoS settings of switch via Easy Smart protocol."""
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def qos_mode(self) -> str:
+        """
+        Returns enabled QoS mode.
+
+        :raise QoSModeException: if qos mode cannot be read
+        :return: mode as string ('Port Based' or '802.1P Based' or 'DSCP/802.1P Based')
+        """
+        reply = self.web_controller.get(Field.QOS_MODE)
+        mode = reply.value(Field.QOS_MODE)[0]
+        if mode not in QOS_MODE_LABELS:
+            raise QoSModeException('Cannot get QoS mode.')
+        return QOS_MODE_LABELS[mode]
+
+    @ControlField.login_required
+    @ControlField.read_only
+    def priority_queue_port_settings(self) -> Dict[str, str]:
+        """
+        Return settings of port priorities in Port Base QoS mode.
+
+        :raises QoSModeException: if QoS mode is not set to Port Base
+        :return: port settings
+        """
+        reply = self.web_controller.get(Field.QOS_MODE, Field.QOS_PORT_PRIORITY)
+        if QOS_MODE_LABELS.get(reply.value(Field.QOS_MODE)[0]) != 'Port Based':
+            raise QoSModeException(
+                'Priority Queue settings can be read only in Port Base QoS mode. Enable this mode first.')
+        priority_queues = list(PriorityQueue)
+        settings = {}
+        for value in reply.values(Field.QOS_PORT_PRIORITY):
+            port, priority = protocol.QOS_PORT_PRIORITY.unpack(value)
+            settings[f'Port {port}'] = priority_queues[priority].value
+        return settings
@@ -0,0 +1,30 @@
+"""Contains function to find all switches in network segment via Easy Smart protocol."""
+
+import ipaddress
+from typing import Dict, List
+
+from . import protocol
+from .client import EasySmartClient
+
+
+def discover(timeout: float = 0.5, broadcast: str = protocol.BROADCAST_ADDRESS,
+             switch_port: int = protocol.SWITCH_PORT, client_port: int = protocol.CLIENT_PORT) -> List[Dict[str, str]]:
+    """
+    Broadcasts one discovery packet and collects answers of all switches in network segment.
+    Login is not required.
+
+    :param timeout: time of collecting answers (in seconds)
+    :param broadcast: address where discovery packet is sent
+    :param switch_port: UDP port on which switches listen
+    :param client_port: UDP port on which answers are received (0 to use any free port)
+    :return: system information of each switch (the same fields as SystemControlField.system_info returns),
+             sorted by IP address
+    """
+    client = EasySmartClient('', '', '', timeout=timeout, broadcast=broadcast, switch_port=switch_port,
+                             client_port=client_port)
+    try:
+        replies = client.discover()
+    finally:
+        client.quit()
+    switches = [protocol.decode_system_info(reply) for reply in replies]
+    return sorted(switches, key=lambda switch: ipaddress.IPv4Address(switch['IP Address']))
@@ -0,0 +1,245 @@
+"""
+Contains encoding of Easy Smart Configuration Utility protocol. Switch listens on UDP port 29808 and answers
+to port 29809. Each datagram consists of 32 bytes header and list of TLV records (type, length, value).
+Whole datagram is scrambled with RC4 cipher with fixed key.
+"""
+
+import struct
+import ipaddress
+from enum import IntEnum
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from ..exceptions import EasySmartProtocolException
+
+
+SWITCH_PORT = 29808
+CLIENT_PORT = 29809
+BROADCAST_ADDRESS = '255.255.255.255'
+
+KEY = (
+    b'Ei2HNryt8ysSdRRI54XNQHBEbOIRqNjQgYxsx3PY8LnXtpqQcMpTWTPJwPbsxTsRLdjklwYgKc7rHcIbudRSlqzSRg33qxWdIkl0d6VDZz'
+    b'8cP1r4N8nK4uh57DOn40KYiN5Op0UlB58ZG7CUTEOdhg2prdNIpT2KrT0Ztbh3jEySpgHqzSFFpq5Ev8qdKQpVYtPL8vAhS9qwXpOY1GGV'
+    b'sdZCzBgr7n8ldkpvZT3Oh6AzxN1yLd9s7uyl6Jgwb6HP0qjtiqcC1yOK3YUzemQ4HDZNHoJoEnOg7DrVhoNabymr5alJjB2XlCO3oLndn6'
+    b'fHdVUw3s33WkWGimJKbJGm0WyXjc1FzA7ai7ivmxtDMjx3WjsHuPiXr6hlA7Lp0VFJ2SXWD5cINC9B9yOavuUlWNfUW61dIyPZESDrPvHE'
+    b'J84dYDDaPn3N8RIdKfgBa0dIfJb9c6pWeDJzKO2gWJGPb8yvERtlrm7shzx21fDn9FZmURRUg6p8bQ6JXaOM8mWrPlCT3zMvdlAoB1Qm4j'
+    b't8pDamZYBw0sWz1bdt7DvowGIrXpSHc0QAdSQUnjbf1PRCm6qRe0YbIDWb7iyOqx0dBC1wgYNYDeXU2EZfbxpNyXxxuS0ALRgsKwzpt99y'
+    b'mkaT28hi6qTq9pgvX0U0jUyZfDR6j0cvuOPQ6fawHcORVETAqwIudS8IBqzQ7YwmbSrAsrnO0S6yeHDUhWHZhZDYo3BWyjT6OpYEw8XGcY'
+    b'5QSnL4xd4TFq0vaRGNs0W0eGygy8YgUWN7dhHt7rfSD7GLb3pY3NTy'
+)
+
+_HEADER = struct.Struct('!BB6s6sHIHHHHI')
+_RECORD = struct.Struct('!HH')
+_END_OF_RECORDS = b'\xff\xff\x00\x00'
+
+
+class OpCode(IntEnum):
+    """Operation codes of datagrams."""
+    DISCOVERY = 0
+    GET = 1
+    SET = 2
+    LOGIN = 3
+    RETURN = 4
+
+
+class ErrorCode(IntEnum):
+    """Error codes of returned datagrams."""
+    WRONG_CREDENTIALS = 1
+    NOT_LOGGED_IN = 2
+
+
+class Field(IntEnum):
+    """Types of TLV records."""
+    DEVICE_TYPE = 1
+    DEVICE_DESCRIPTION = 2
+    MAC_ADDRESS = 3
+    IP_ADDRESS = 4
+    SUBNET_MASK = 5
+    DEFAULT_GATEWAY = 6
+    FIRMWARE_VERSION = 7
+    HARDWARE_VERSION = 8
+    DHCP = 9
+    PORTS_NUMBER = 10
+    USERNAME = 512
+    PASSWORD = 514
+    PORT_SETTINGS = 4096
+    PORT_TRUNK = 4608
+    IGMP_SNOOPING = 4352
+    IEEE_802_1Q_VLAN_ENABLED = 8704
+    IEEE_802_1Q_VLAN = 8705
+    QOS_MODE = 12288
+    QOS_PORT_PRIORITY = 12289
+    PORT_STATISTICS = 16384
+    PORT_MIRROR = 16640
+    LOOP_PREVENTION = 17152
+
+
+@dataclass
+class Packet:
+    """Datagram of Easy Smart protocol."""
+    op_code: OpCode
+    switch_mac: bytes = b'\x00' * 6
+    host_mac: bytes = b'\x00' * 6
+    sequence_id: int = 0
+    error_code: int = 0
+    token_id: int = 0
+    records: List[Tuple[int, bytes]] = field(default_factory=list)
+
+    def values(self, field_type: Field) -> List[bytes]:
+        """
+        Returns values of all records with given type.
+
+        :param field_type: type of record
+        :return: values
+        """
+        return [value for record_type, value in self.records if record_type == field_type]
+
+    def value(self, field_type: Field) -> bytes:
+        """
+        Returns value of first record with given type.
+
+        :param field_type: type of record
+        :raises EasySmartProtocolException: if there is no such record in packet
+        :return: value
+        """
+        values = self.values(field_type)
+        if not values:
+            raise EasySmartProtocolException(f'Switch did not return "{field_type.name}" field.')
+        return values[0]
+
+
+def rc4(data: bytes, key: bytes = KEY) -> bytes:
+    """
+    Scrambles (or unscrambles) data with RC4 cipher.
+
+    :param data: data to scramble
+    :param key: cipher key
+    :return: scrambled data
+    """
+    state = list(range(256))
+    j = 0
+    for i in range(256):
+        j = (j + state[i] + key[i % len(key)]) % 256
+        state[i], state[j] = state[j], state[i]
+    i = j = 0
+    result = bytearray()
+    for byte in data:
+        i = (i + 1) % 256
+        j = (j + state[i]) % 256
+        state[i], state[j] = state[j], state[i]
+        result.append(byte ^ state[(state[i] + state[j]) % 256])
+    return bytes(result)
+
+
+def encode(packet: Packet) -> bytes:
+    """
+    Builds datagram from packet.
+
+    :param packet: packet to send
+    :return: scrambled datagram
+    """
+    payload = b''.join(_RECORD.pack(record_type, len(value)) + value for record_type, value in packet.records)
+    payload += _END_OF_RECORDS
+    header = _HEADER.pack(1, packet.op_code, packet.switch_mac, packet.host_mac, packet.sequence_id,
+                          packet.error_code, _HEADER.size + len(payload), 0, 0, packet.token_id, 0)
+    return rc4(header + payload)
+
+
+def decode(datagram: bytes) -> Packet:
+    """
+    Parses received datagram.
+
+    :param datagram: scrambled datagram
+    :raises EasySmartProtocolException: if datagram is malformed
+    :return: received packet
+    """
+    data = rc4(datagram)
+    if len(data) < _HEADER.size:
+        raise EasySmartProtocolException('Datagram is too short.')
+    _, op_code, switch_mac, host_mac, sequence_id, error_code, length, _, _, token_id, _ = \
+        _HEADER.unpack_from(data)
+    if length != len(data):
+        raise EasySmartProtocolException(f'Datagram length {len(data)} does not match declared {length}.')
+    try:
+        op_code = OpCode(op_code)
+    except ValueError:
+        raise EasySmartProtocolException(f'Unknown operation code {op_code}.') from None
+    records = []
+    offset = _HEADER.size
+    while offset + _RECORD.size <= len(data):
+        record_type, record_length = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        if record_type == 0xffff:
+            break
+        records.append((record_type, data[offset:offset + record_length]))
+        offset += record_length
+    return Packet(op_code, switch_mac, host_mac, sequence_id, error_code, token_id, records)
+
+
+def encode_string(value: str) -> bytes:
+    """
+    Encodes text value of record.
+
+    :param value: text
+    :return: bytes terminated by zero
+    """
+    return value.encode() + b'\x00'
+
+
+def decode_string(value: bytes) -> str:
+    """
+    Decodes text value of record.
+
+    :param value: bytes terminated by zero
+    :return: text
+    """
+    return value.split(b'\x00', 1)[0].decode(errors='replace')
+
+
+def decode_ip(value: bytes) -> str:
+    """
+    Decodes IPv4 address.
+
+    :param value: 4 bytes
+    :return: address in dotted notation
+    """
+    return str(ipaddress.IPv4Address(value))
+
+
+def decode_mac(value: bytes) -> str:
+    """
+    Decodes MAC address.
+
+    :param value: 6 bytes
+    :return: address in the same notation as admin page uses
+    """
+    return ':'.join(f'{byte:02X}' for byte in value)
+
+
+# Structures of binary records.
+PORT_SETTINGS = struct.Struct('!7B')  # port, status, trunk, speed config, speed actual, flow ctrl config, actual
+PORT_STATISTICS = struct.Struct('!3B4I')  # port, status, link status, TxGoodPkt, TxBadPkt, RxGoodPkt, RxBadPkt
+IEEE_802_1Q_VLAN = struct.Struct('!HII')  # vlan id, member ports mask, tagged ports mask (followed by name)
+QOS_PORT_PRIORITY = struct.Struct('!2B')  # port, priority queue (0 - 3)
+
+
+SYSTEM_INFO_FIELDS = (Field.DEVICE_DESCRIPTION, Field.MAC_ADDRESS, Field.IP_ADDRESS, Field.SUBNET_MASK,
+                      Field.DEFAULT_GATEWAY, Field.FIRMWARE_VERSION, Field.HARDWARE_VERSION)
+
+
+def decode_system_info(packet: Packet) -> Dict[str, str]:
+    """
+    Decodes switch system information (the same fields as admin page shows in System Info tab).
+
+    :param packet: packet with SYSTEM_INFO_FIELDS records
+    :return: dict with basic information about switch system
+    """
+    return {
+        'Device Description': decode_string(packet.value(Field.DEVICE_DESCRIPTION)),
+        'MAC Address': decode_mac(packet.value(Field.MAC_ADDRESS)),
+        'IP Address': decode_ip(packet.value(Field.IP_ADDRESS)),
+        'Subnet Mask': decode_ip(packet.value(Field.SUBNET_MASK)),
+        'Default Gateway': decode_ip(packet.value(Field.DEFAULT_GATEWAY)),
+        'Firmware Version': decode_string(packet.value(Field.FIRMWARE_VERSION)),
+        'Hardware Version': decode_string(packet.value(Field.HARDWARE_VERSION)),
+    }
@@ -0,0 +1,171 @@
+"""
+Contains local UDP server which answers Easy Smart protocol queries like TL-SG108PE does.
+It allows to use and test Easy Smart backend without switch.
+"""
+
+import socket
+import struct
+import threading
+import ipaddress
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from . import protocol
+from .protocol import ErrorCode, Field, OpCode, Packet
+from ..exceptions import EasySmartProtocolException
+
+
+# Fields returned in answer for discovery packet.
+DISCOVERY_FIELDS = (Field.DEVICE_TYPE, Field.DEVICE_DESCRIPTION, Field.MAC_ADDRESS, Field.IP_ADDRESS,
+                    Field.SUBNET_MASK, Field.DEFAULT_GATEWAY, Field.FIRMWARE_VERSION, Field.HARDWARE_VERSION,
+                    Field.DHCP, Field.PORTS_NUMBER)
+
+def default_records(ip_address: str, mac_address: str, description: str = 'TL-SG108PE'
+                    ) -> Dict[int, List[bytes]]:
+    """
+    Builds records describing TL-SG108PE with factory settings (with a few packets sent via port 1).
+
+    :param ip_address: IP address of switch
+    :param mac_address: MAC address of switch (e.g. 'E4:C3:2A:BD:FF:F0')
+    :param description: name of switch
+    :return: values of records grouped by their types
+    """
+    return {
+        Field.DEVICE_TYPE: [protocol.encode_string('TL-SG108PE')],
+        Field.DEVICE_DESCRIPTION: [protocol.encode_string(description)],
+        Field.MAC_ADDRESS: [bytes.fromhex(mac_address.replace(':', ''))],
+        Field.IP_ADDRESS: [ipaddress.IPv4Address(ip_address).packed],
+        Field.SUBNET_MASK: [ipaddress.IPv4Address('255.255.255.0').packed],
+        Field.DEFAULT_GATEWAY: [ipaddress.IPv4Address('192.168.1.1').packed],
+        Field.FIRMWARE_VERSION: [protocol.encode_string('1.0.0 Build 20200415 Rel.54962')],
+        Field.HARDWARE_VERSION: [protocol.encode_string('TL-SG108PE 3.0')],
+        Field.DHCP: [b'\x00'],
+        Field.PORTS_NUMBER: [b'\x08'],
+        Field.PORT_SETTINGS: [protocol.PORT_SETTINGS.pack(port, 1, 0, 1, 6 if port == 1 else 0, 0, 0)
+                              for port in range(1, 9)],
+        Field.PORT_STATISTICS: [protocol.PORT_STATISTICS.pack(port, 1, 6 if port == 1 else 0,
+                                                              1000 if port == 1 else 0, 0,
+                                                              2000 if port == 1 else 0, 0)
+                                for port in range(1, 9)],
+        Field.IEEE_802_1Q_VLAN_ENABLED: [b'\x01'],
+        Field.IEEE_802_1Q_VLAN: [protocol.IEEE_802_1Q_VLAN.pack(1, 0xff, 0) + protocol.encode_string('Default_VLAN')],
+        Field.QOS_MODE: [b'\x00'],
+        Field.QOS_PORT_PRIORITY: [protocol.QOS_PORT_PRIORITY.pack(port, 0) for port in range(1, 9)],
+        Field.LOOP_PREVENTION: [b'\x01'],
+    }
+
+
+@dataclass
+class StandInSwitch:
+    """Switch emulated by stand-in."""
+    ip_address: str = '192.168.1.42'
+    mac_address: str = 'E4:C3:2A:BD:FF:F0'
+    username: str = 'admin'
+    password: str = 'admin'
+    records: Dict[int, List[bytes]] = field(default_factory=dict)
+    token_id: Optional[int] = None
+
+    def __post_init__(self):
+        if not self.records:
+            self.records = default_records(self.ip_address, self.mac_address)
+
+    @property
+    def mac(self) -> bytes:
+        """
+        Returns MAC address as bytes.
+
+        :return: MAC address
+        """
+        return bytes.fromhex(self.mac_address.replace(':', ''))
+
+
+class EasySmartStandIn:
+    """
+    Creates local UDP server answering Easy Smart protocol queries of given switches. Answers are sent back to
+    sender address (real switch broadcasts them), so client must send its requests to address of stand-in, e.g.
+    ``EasySmartClient(host, username, password, broadcast=stand_in.host, switch_port=stand_in.port, client_port=0)``.
+    """
+
+    def __init__(self, switches: List[StandInSwitch] = None, host: str = '127.0.0.1', port: int = 0) -> None:
+        self.switches = switches if switches is not None else [StandInSwitch()]
+        self.host = host
+        self.port = port
+        self.received: List[Packet] = []
+        self._socket = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self) -> 'EasySmartStandIn':
+        """
+        Starts answering queries in background thread.
+
+        :return: stand-in
+        """
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((self.host, self.port))
+        self._socket.settimeout(0.05)
+        self.port = self._socket.getsockname()[1]
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops answering queries.
+
+        :return: None
+        """
+        self._stopped.set()
+        self._thread.join()
+        self._socket.close()
+
+    def __enter__(self) -> 'EasySmartStandIn':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _serve(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                datagram, address = self._socket.recvfrom(0x10000)
+                packet = protocol.decode(datagram)
+            except socket.timeout:
+                continue
+            except EasySmartProtocolException:
+                continue
+            self.received.append(packet)
+            for reply in self._answer(packet):
+                self._socket.sendto(protocol.encode(reply), address)
+
+    def _answer(self, packet: Packet) -> List[Packet]:
+        if packet.op_code == OpCode.DISCOVERY:
+            return [self._reply(packet, switch, self._records(switch, DISCOVERY_FIELDS)) for switch in self.switches]
+        switch = next((switch for switch in self.switches if switch.mac == packet.switch_mac), None)
+        if switch is None or packet.op_code not in (OpCode.LOGIN, OpCode.GET):
+            return []
+        if packet.op_code == OpCode.LOGIN:
+            return [self._login(packet, switch)]
+        if switch.token_id is None or packet.token_id != switch.token_id:
+            return [self._reply(packet, switch, [], ErrorCode.NOT_LOGGED_IN)]
+        return [self._reply(packet, switch, self._records(switch, [record_type for record_type, _ in packet.records]))]
+
+    def _login(self, packet: Packet, switch: StandInSwitch) -> Packet:
+        credentials = (protocol.decode_string(packet.value(Field.USERNAME)),
+                       protocol.decode_string(packet.value(Field.PASSWORD)))
+        if credentials != (switch.username, switch.password):
+            return self._reply(packet, switch, [], ErrorCode.WRONG_CREDENTIALS)
+        switch.token_id = struct.unpack('!H', switch.mac[-2:])[0] ^ packet.sequence_id
+        return self._reply(packet, switch, [])
+
+    @staticmethod
+    def _records(switch: StandInSwitch, record_types) -> List[Tuple[int, bytes]]:
+        return [(record_type, value) for record_type in record_types
+                for value in switch.records.get(record_type, [])]
+
+    @staticmethod
+    def _reply(packet: Packet, switch: StandInSwitch, records: List[Tuple[int, bytes]],
+               error_code: int = 0) -> Packet:
+        return Packet(OpCode.RETURN, switch.mac, packet.host_mac, packet.sequence_id, error_code,
+                      switch.token_id or 0, records)
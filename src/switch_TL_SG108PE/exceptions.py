@@ -21,6 +21,30 @@ class UnknownControlFieldException(TpLinkSwitchException):
     """Thrown when user entered wrong control field."""
 
 
+class UnknownBackendException(TpLinkSwitchException):
+    """Thrown when user selected not supported backend."""
+
+
+class HttpRequestException(TpLinkSwitchException):
+    """Thrown when HTTP request to admin web page of switch failed."""
+
+
+class EasySmartProtocolException(TpLinkSwitchException):
+    """Thrown when switch does not answer or answers incorrectly via Easy Smart protocol."""
+
+
+class SessionStoreException(TpLinkSwitchException):
+    """Thrown when file with stored sessions cannot be locked or read."""
+
+
+class DeadlineExceededException(TpLinkSwitchException):
+    """Thrown when control field method didn't finish before its deadline."""
+
+
+class BrowserPoolException(TpLinkSwitchException):
+    """Thrown when web browser is leased from closed browser pool."""
+
+
 class VlanIdException(TpLinkSwitchException):
     """Thrown when user passed wrong VLAN id."""
 
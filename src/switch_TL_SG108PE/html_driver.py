@@ -0,0 +1,945 @@
+"""Contains browserless web driver which serves admin pages of switch fetched over plain HTTP."""
+
+import copy
+import re
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin, urlencode, urlsplit, urlunsplit
+import lxml.html
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (NoSuchElementException, NoSuchFrameException, NoAlertPresentException,
+                                        StaleElementReferenceException, UnexpectedAlertPresentException,
+                                        WebDriverException)
+
+from . import scripts, javascript
+from .http_client import HttpClient
+from .utils import Frame, get_tab_page
+
+
+_SUBMIT_TYPES = ('submit', 'button', 'image')
+_TEXT_TYPES = ('', 'text', 'password', 'hidden', 'number', 'email', 'search', 'tel', 'url')
+_DIALOG = re.compile(r'\b(confirm|alert)\s*\(\s*(?:([\'"])((?:\\.|(?!\2).)*)\2)?')
+_CALL = re.compile(r'([A-Za-z_$][\w$]*)\s*\(')
+_REDIRECT = re.compile(r'\b((?:top|parent|window|self)\.)?location(?:\.href)?\s*=\s*([\'"])(.*?)\2'
+                       r'|\b((?:top|parent|window|self)\.)?location\.(?:replace|assign)\(\s*([\'"])(.*?)\5\s*\)')
+_MAX_REDIRECTS = 3
+
+
+class _Document:  # pylint: disable=too-few-public-methods
+    """Page loaded into browser window or into frame."""
+
+    def __init__(self, url: str, content: str, root: Optional[lxml.html.HtmlElement] = None) -> None:
+        self.url = url
+        self.content = content
+        self.root = root if root is not None else HtmlDriver.parse(content)
+        self.alive = True
+        self.variables: Optional[Dict[str, Any]] = None
+        self.mark: Optional[str] = None  # tip shown before settings were applied (see scripts.MARK_PAGE)
+        self.filled: Set[str] = set()  # names of form fields set since page was loaded
+
+
+class HtmlElement:
+    """Element of page. Implements part of selenium WebElement interface used by control fields."""
+
+    def __init__(self, driver: 'HtmlDriver', document: _Document, element: lxml.html.HtmlElement) -> None:
+        self._driver = driver
+        self._document = document
+        self._element = element
+        driver.elements[self.id] = self
+
+    @property
+    def id(self) -> str:  # pylint: disable=invalid-name
+        """
+        Returns reference of element used by W3C actions.
+
+        :return: reference
+        """
+        return str(id(self._element))
+
+    @property
+    def tag_name(self) -> str:
+        """
+        Returns tag name of element.
+
+        :return: tag name
+        """
+        return self._element.tag
+
+    @property
+    def text(self) -> str:
+        """
+        Returns text of element and its children with collapsed white characters.
+
+        :return: text
+        """
+        self._check_stale()
+        if not self.is_displayed():
+            return ''
+        return ' '.join(self._element.text_content().split())
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        """
+        Returns value of given html attribute.
+
+        :param name: name of attribute
+        :return: value or None if element has no such attribute
+        """
+        self._check_stale()
+        return self._element.get(name)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Returns value of given property or attribute of element (like browser does).
+
+        :param name: name of property or attribute
+        :return: value or None
+        """
+        self._check_stale()
+        if name in ('checked', 'selected'):
+            return 'true' if self.is_selected() else None
+        if name == 'value':
+            return self._value()
+        if name == 'index' and self.tag_name == 'option':
+            return str(self._element.getparent().findall('option').index(self._element))
+        return self._element.get(name)
+
+    def value_of_css_property(self, name: str) -> str:
+        """
+        Returns value of css property declared in style attribute of element.
+
+        :param name: name of css property
+        :return: value
+        """
+        self._check_stale()
+        for declaration in (self._element.get('style') or '').split(';'):
+            key, _, value = declaration.partition(':')
+            if key.strip().lower() == name:
+                return value.strip().lower()
+        return ''
+
+    def is_selected(self) -> bool:
+        """
+        Checks if checkbox, radio or option is selected.
+
+        :return: True if it is, otherwise False
+        """
+        self._check_stale()
+        if self.tag_name == 'option':
+            select = self._element.getparent()
+            if self._element.get('selected') is not None:
+                return True
+            selected = [o for o in select.findall('option') if o.get('selected') is not None]
+            return not selected and select.get('multiple') is None and select.find('option') is self._element
+        return self._element.get('checked') is not None
+
+    def is_enabled(self) -> bool:
+        """
+        Checks if element is enabled.
+
+        :return: True if it is, otherwise False
+        """
+        self._check_stale()
+        return all(e.get('disabled') is None for e in [self._element, *self._element.iterancestors()])
+
+    def is_displayed(self) -> bool:
+        """
+        Checks if element is visible (it is not hidden by its own style or style of its parents).
+
+        :return: True if it is, otherwise False
+        """
+        self._check_stale()
+        if self.tag_name == 'input' and (self._element.get('type') or '').lower() == 'hidden':
+            return False
+        for element in [self._element, *self._element.iterancestors()]:
+            style = (element.get('style') or '').replace(' ', '').lower()
+            if 'display:none' in style or 'visibility:hidden' in style or element.get('hidden') is not None:
+                return False
+        return True
+
+    def find_element(self, method: str, query: str) -> 'HtmlElement':
+        """
+        Finds first element with matching query and returns it.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found element
+        """
+        self._check_stale()
+        return self._driver.find_element_in(self._document, self._element, method, query)
+
+    def find_elements(self, method: str, query: str) -> List['HtmlElement']:
+        """
+        Finds multiple elements with matching query and returns them.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found elements
+        """
+        self._check_stale()
+        return self._driver.find_elements_in(self._document, self._element, method, query)
+
+    def click(self) -> None:
+        """
+        Clicks element like browser does without running scripts: link loads page from its address, button submits
+        form, checkbox is toggled, radio is checked, option is selected (toggled in multiple select).
+        Confirmation dialog opened by onclick handler is shown as alert and action is done when it's accepted.
+
+        :return: None
+        """
+        self._check_stale()
+        if not self.is_enabled():
+            return
+        dialog = self._driver.find_dialog(self._document, self._element)
+        if dialog is None:
+            self._activate()
+        else:
+            self._driver.open_alert(*dialog, self._activate)
+
+    def clear(self) -> None:
+        """
+        Clears text of input or textarea.
+
+        :return: None
+        """
+        self._check_stale()
+        self._set_text('')
+
+    def send_keys(self, *value: str) -> None:
+        """
+        Types given text into input or textarea.
+
+        :param value: text to type
+        :return: None
+        """
+        self._check_stale()
+        self._set_text((self._value() or '') + ''.join(str(v) for v in value))
+
+    def _activate(self) -> None:
+        element_type = (self._element.get('type') or '').lower()
+        if self.tag_name == 'a':
+            self._driver.follow_link(self._document, self._element)
+        elif self._is_submit_control():
+            self._driver.submit_form(self._document, self._element)
+        elif self.tag_name == 'input' and element_type == 'checkbox':
+            self._set_flag(self._element, 'checked', self._element.get('checked') is None)
+            self._mark_filled(self._element)
+        elif self.tag_name == 'input' and element_type == 'radio':
+            self._check_radio()
+        elif self.tag_name == 'option':
+            self._select_option()
+        elif self.tag_name == 'label' and self._element.get('for'):
+            self._driver.find_element_in(self._document, self._document.root, By.ID, self._element.get('for')).click()
+
+    def _check_radio(self) -> None:
+        container = next(self._element.iterancestors('form'), self._document.root)
+        for radio in container.xpath(".//input[@type='radio' and @name=$name]", name=self._element.get('name', '')):
+            self._set_flag(radio, 'checked', False)
+        self._set_flag(self._element, 'checked', True)
+        self._mark_filled(self._element)
+
+    def _select_option(self) -> None:
+        select = next(self._element.iterancestors('select'), None)
+        if select is not None:
+            self._mark_filled(select)
+        if select is not None and select.get('multiple') is not None:
+            self._set_flag(self._element, 'selected', not self.is_selected())
+            return
+        if select is not None:
+            for option in select.iter('option'):
+                self._set_flag(option, 'selected', False)
+        self._set_flag(self._element, 'selected', True)
+
+    def _set_text(self, text: str) -> None:
+        element_type = (self._element.get('type') or '').lower()
+        if self.tag_name == 'textarea':
+            self._element.text = text
+        elif self.tag_name == 'input' and element_type in _TEXT_TYPES:
+            self._element.set('value', text)
+        else:
+            raise WebDriverException(f'Typing into <{self.tag_name}> element is not supported.')
+        self._mark_filled(self._element)
+
+    def _mark_filled(self, element: lxml.html.HtmlElement) -> None:
+        if element.get('name'):
+            self._document.filled.add(element.get('name'))
+
+    @staticmethod
+    def _set_flag(element: lxml.html.HtmlElement, name: str, value: bool) -> None:
+        if value:
+            element.set(name, name)
+        elif name in element.attrib:
+            del element.attrib[name]
+
+    def _is_submit_control(self) -> bool:
+        element_type = (self._element.get('type') or '').lower()
+        return self.tag_name == 'button' or self.tag_name == 'input' and element_type in _SUBMIT_TYPES
+
+    def _value(self) -> Optional[str]:
+        if self.tag_name == 'select':
+            options = [HtmlElement(self._driver, self._document, o) for o in self._element.findall('.//option')]
+            for option in options:
+                if option.is_selected():
+                    return option.get_attribute('value')
+            return ''
+        if self.tag_name == 'option':
+            value = self._element.get('value')
+            return value if value is not None else self._element.text_content().strip()
+        if self.tag_name == 'textarea':
+            return self._element.text_content()
+        if self.tag_name == 'input':
+            return self._element.get('value', '')
+        return self._element.get('value')
+
+    def _check_stale(self) -> None:
+        if not self._document.alive:
+            raise StaleElementReferenceException('Element is not attached to the page document.')
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, HtmlElement) and self._element is other._element
+
+    def __hash__(self) -> int:
+        return id(self._element)
+
+
+WebElement.register(HtmlElement)  # selenium ActionChains accept only web elements
+
+
+class HtmlAlert:
+    """Dialog opened by onclick handler of clicked element. Implements selenium Alert interface."""
+
+    def __init__(self, driver: 'HtmlDriver', kind: str, text: str, action: Callable[[], None]) -> None:
+        self._driver = driver
+        self.kind = kind
+        self.text = text
+        self._action = action
+
+    def accept(self) -> None:
+        """
+        Accepts dialog and does action of clicked element.
+
+        :return: None
+        """
+        self._driver.close_alert()
+        self._action()
+
+    def dismiss(self) -> None:
+        """
+        Dismisses dialog. Action of clicked element is done only if dialog was not confirmation.
+
+        :return: None
+        """
+        self._driver.close_alert()
+        if self.kind == 'alert':
+            self._action()
+
+
+class _SwitchTo:
+    """Changes active document of driver (like selenium SwitchTo object)."""
+
+    def __init__(self, driver: 'HtmlDriver') -> None:
+        self._driver = driver
+
+    @property
+    def alert(self) -> HtmlAlert:
+        """
+        Returns dialog opened by last click.
+
+        :raises NoAlertPresentException: if there is no dialog
+        :return: dialog
+        """
+        if self._driver.alert is None:
+            raise NoAlertPresentException('No alert is present.')
+        return self._driver.alert
+
+    def default_content(self) -> None:
+        """
+        Activates top level document.
+
+        :return: None
+        """
+        self._driver.activate_frame(None)
+
+    def frame(self, frame_reference: Union[str, HtmlElement]) -> None:
+        """
+        Activates document loaded into given frame.
+
+        :param frame_reference: frame element or its name
+        :return: None
+        """
+        if isinstance(frame_reference, HtmlElement):
+            frame_reference = frame_reference.get_dom_attribute('name')
+        self._driver.activate_frame(frame_reference)
+
+
+class HtmlDriver:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
+    """
+    Creates browserless web driver. Pages are downloaded by given client and parsed with lxml.
+    It implements part of selenium WebDriver interface used by WebController and control fields,
+    so they can work without web browser (e.g. ``switch_manager.connect(host, login, password,
+    webdriver=HtmlDriver())``). Clicks and form submits are turned into HTTP requests, scripts are not run.
+    """
+
+    def __init__(self, client: HttpClient = None) -> None:
+        self.client = client if client is not None else HttpClient('', '', '')
+        self.switch_to = _SwitchTo(self)
+        self.alert: Optional[HtmlAlert] = None
+        self.elements: 'weakref.WeakValueDictionary[str, HtmlElement]' = weakref.WeakValueDictionary()
+        self.parsed_pages: Dict[str, lxml.html.HtmlElement] = {}  # pages parsed in advance by their content
+        self._top: Optional[_Document] = None
+        self._frames: Dict[str, _Document] = {}
+        self._active_frame: Optional[str] = None
+
+    @property
+    def current_url(self) -> str:
+        """
+        Returns address of top level document.
+
+        :return: url
+        """
+        return self._top.url if self._top is not None else ''
+
+    @property
+    def page_source(self) -> str:
+        """
+        Returns source of active document.
+
+        :return: html
+        """
+        return self._active_document().content
+
+    def get(self, url: str) -> None:
+        """
+        Loads page from given address as top level document ('about:blank' unloads all documents).
+
+        :param url: address of page
+        :return: None
+        """
+        if url == 'about:blank':
+            self._unload()
+            return
+        self.load(None, 'GET', url)
+
+    def find_element(self, method: str, query: str) -> HtmlElement:
+        """
+        Finds first element with matching query in active document and returns it.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found element
+        """
+        document = self._active_document()
+        return self.find_element_in(document, document.root, method, query)
+
+    def find_elements(self, method: str, query: str) -> List[HtmlElement]:
+        """
+        Finds multiple elements with matching query in active document and returns them.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found elements
+        """
+        document = self._active_document()
+        return self.find_elements_in(document, document.root, method, query)
+
+    def find_element_in(self, document: _Document, context: lxml.html.HtmlElement, method: str,
+                        query: str) -> HtmlElement:
+        """
+        Finds first element with matching query in given context.
+
+        :param document: document of context
+        :param context: element from which search starts
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found element
+        """
+        elements = self.find_elements_in(document, context, method, query)
+        if not elements:
+            raise NoSuchElementException(f'Unable to locate element: ({method}, {query})')
+        return elements[0]
+
+    def find_elements_in(self, document: _Document, context: lxml.html.HtmlElement, method: str,
+                         query: str) -> List[HtmlElement]:
+        """
+        Finds multiple elements with matching query in given context.
+
+        :param document: document of context
+        :param context: element from which search starts
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :return: found elements
+        """
+        xpath = {
+            By.XPATH: lambda: query,
+            By.ID: lambda: f".//*[@id='{query}']",
+            By.NAME: lambda: f".//*[@name='{query}']",
+            By.TAG_NAME: lambda: f'.//{query}',
+            By.CLASS_NAME: lambda: f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {query} ')]",
+            By.LINK_TEXT: lambda: f".//a[normalize-space(.)='{query}']",
+            By.CSS_SELECTOR: lambda: CSSSelector(query).path.replace('descendant-or-self::', './/', 1),
+        }.get(method)
+        if xpath is None:
+            raise WebDriverException(f'Locating elements by "{method}" is not supported.')
+        found = context.xpath(xpath())
+        return [HtmlElement(self, document, e) for e in found if isinstance(e, lxml.html.HtmlElement)]
+
+    def execute(self, driver_command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Executes W3C actions performed by selenium ActionChains. Pointer clicks are done on element
+        which pointer was moved to (keys pressed meanwhile don't change result of click).
+
+        :param driver_command: name of command
+        :param params: parameters of command
+        :raises WebDriverException: if command is not supported
+        :return: response of command
+        """
+        if driver_command == Command.W3C_CLEAR_ACTIONS:
+            return {'value': None}
+        if driver_command != Command.W3C_ACTIONS:
+            raise WebDriverException(f'Command "{driver_command}" is not supported without web browser.')
+        for device in (params or {}).get('actions', []):
+            if device.get('type') != 'pointer':
+                continue
+            target = None
+            for action in device.get('actions', []):
+                if action.get('type') == 'pointerMove' and isinstance(action.get('origin'), dict):
+                    target = self.elements.get(next(iter(action['origin'].values()), None))
+                elif action.get('type') == 'pointerUp' and target is not None:
+                    target.click()
+        return {'value': None}
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        """
+        Runs equivalent of given script of library (see scripts module). Other scripts can't be run
+        without web browser.
+
+        :param script: source of script
+        :param args: arguments of script
+        :raises WebDriverException: if script is unknown
+        :return: result of script
+        """
+        equivalents = {
+            scripts.ELEMENTS_TEXTS: self._elements_texts,
+            scripts.PAGE_VARIABLES: self._page_variables,
+            scripts.FILL_FORM: self._fill_form,
+            scripts.OPEN_PAGE: self._open_page,
+            scripts.FRAMES: self._frame_elements,
+            scripts.SESSION_ALIVE: self._session_alive,
+            scripts.MARK_PAGE: self._mark_page,
+            scripts.APPLY_OUTCOME: self._apply_outcome,
+        }
+        if script not in equivalents:
+            raise WebDriverException('Only scripts of library can be run without web browser.')
+        return equivalents[script](*args)
+
+    def find_dialog(self, document: _Document, element: lxml.html.HtmlElement) -> Optional[Tuple[str, str]]:
+        """
+        Finds dialog (alert or confirm) opened by onclick handler of element. Handler and functions called
+        by handler (declared in scripts of document) are searched.
+
+        :param document: document with element
+        :param element: clicked element
+        :return: kind and text of dialog or None if handler doesn't open dialog
+        """
+        handler = element.get('onclick') or ''
+        sources = [handler]
+        page_scripts = '\n'.join(script.text or '' for script in document.root.iter('script'))
+        for name in _CALL.findall(handler):
+            if name not in ('confirm', 'alert', 'return'):
+                sources.append(self._function_body(page_scripts, name))
+        for source in sources:
+            match = _DIALOG.search(source)
+            if match:
+                return match.group(1), match.group(3) or ''
+        return None
+
+    def open_alert(self, kind: str, text: str, action: Callable[[], None]) -> None:
+        """
+        Shows dialog. Given action is done when dialog is accepted.
+
+        :param kind: 'alert' or 'confirm'
+        :param text: text of dialog
+        :param action: action of clicked element
+        :return: None
+        """
+        self.alert = HtmlAlert(self, kind, text, action)
+
+    def close_alert(self) -> None:
+        """
+        Closes dialog.
+
+        :return: None
+        """
+        self.alert = None
+
+    def get_cookies(self) -> List[Dict[str, str]]:
+        """
+        Returns cookies of current session.
+
+        :return: cookies
+        """
+        return [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+                for c in self.client.session.cookies]
+
+    def add_cookie(self, cookie_dict: Dict[str, Any]) -> None:
+        """
+        Adds cookie to current session.
+
+        :param cookie_dict: cookie (name, value and optionally domain and path)
+        :return: None
+        """
+        self.client.session.cookies.set(cookie_dict['name'], cookie_dict['value'],
+                                        domain=cookie_dict.get('domain', ''), path=cookie_dict.get('path', '/'))
+
+    def delete_all_cookies(self) -> None:
+        """
+        Deletes cookies of current session.
+
+        :return: None
+        """
+        self.client.session.cookies.clear()
+
+    def quit(self) -> None:
+        """
+        Closes connection with switch.
+
+        :return: None
+        """
+        self._unload()
+        self.client.close()
+
+    def save_state(self) -> Dict[str, Any]:
+        """
+        Returns loaded documents and name of active frame. State can be restored in other driver.
+
+        :return: state of driver
+        """
+        return {
+            'top': (self._top.url, self._top.content) if self._top is not None else None,
+            'frames': {name: (document.url, document.content) for name, document in self._frames.items()},
+            'active_frame': self._active_frame,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Loads documents saved by this or other driver (without downloading them again).
+        Elements found in documents loaded before are stale.
+
+        :param state: state returned by save_state()
+        :return: None
+        """
+        self._unload()
+        self.alert = None
+        self._top = self._document(*state['top']) if state['top'] is not None else None
+        self._frames = {name: self._document(*document) for name, document in state['frames'].items()}
+        self._active_frame = state['active_frame']
+
+    def forget_parsed_pages(self, state: Dict[str, Any]) -> None:
+        """
+        Forgets pages parsed in advance except pages of given state.
+
+        :param state: state returned by save_state()
+        :return: None
+        """
+        documents = [state['top'], *state['frames'].values()]
+        contents = {document[1] for document in documents if document is not None}
+        self.parsed_pages = {content: root for content, root in self.parsed_pages.items() if content in contents}
+
+    @staticmethod
+    def parse(content: str) -> lxml.html.HtmlElement:
+        """
+        Parses content of page. Parsed page can be put into parsed_pages, so it is not parsed again
+        when it is loaded (e.g. parsing can be done in other thread before).
+
+        :param content: html
+        :return: root element of page
+        """
+        return lxml.html.fromstring(content or '<html></html>')
+
+    def activate_frame(self, frame_name: Optional[str]) -> None:
+        """
+        Activates document loaded into given frame. Frame content is downloaded when it's activated first time.
+
+        :param frame_name: name of frame or None to activate top level document
+        :return: None
+        """
+        if frame_name is not None and frame_name not in self._frames:
+            frame = self._top.root.xpath(f"//frame[@name='{frame_name}'] | //iframe[@name='{frame_name}']") \
+                if self._top is not None else []
+            if not frame:
+                raise NoSuchFrameException(f'Unable to locate frame: {frame_name}')
+            self.load(frame_name, 'GET', urljoin(self._top.url, frame[0].get('src') or ''))
+        self._active_frame = frame_name
+
+    def load(self, frame_name: Optional[str], method: str, url: str, data: Optional[Dict[str, str]] = None) -> None:
+        """
+        Downloads page and puts it into given frame (or replaces top level document).
+        Pages which only redirect (by meta refresh or script changing location) are followed.
+
+        :param frame_name: name of frame or None for top level document
+        :param method: HTTP method
+        :param url: address of page
+        :param data: form data for POST request
+        :return: None
+        """
+        url, content = self.client.request(method, url, data=data)
+        document = self._document(url, content)
+        for _ in range(_MAX_REDIRECTS):
+            redirect = self._find_redirect(document)
+            if redirect is None:
+                break
+            frame_name = None if redirect[0] else frame_name
+            document = self._document(*self.client.request('GET', urljoin(document.url, redirect[1])))
+        if frame_name is None:
+            for old_document in [self._top, *self._frames.values()]:
+                if old_document is not None:
+                    old_document.alive = False
+            self._top = document
+            self._frames = {}
+            self._active_frame = None
+        else:
+            if frame_name in self._frames:
+                self._frames[frame_name].alive = False
+            self._frames[frame_name] = document
+
+    def follow_link(self, document: _Document, link: lxml.html.HtmlElement) -> None:
+        """
+        Loads page pointed by link. Links handled by javascript are resolved from known tabs of sidebar navigation.
+
+        :param document: document with link
+        :param link: clicked link
+        :return: None
+        """
+        href = (link.get('href') or '').strip()
+        target = link.get('target')
+        if not href or href.startswith('#') or href.lower().startswith('javascript:'):
+            page = get_tab_page(' '.join(link.text_content().split()))
+            if page is None:
+                return
+            href, target = page, Frame.MAIN.value
+        self.load(self._target_frame(document, target), 'GET', urljoin(document.url, href))
+
+    def submit_form(self, document: _Document, submitter: lxml.html.HtmlElement) -> None:
+        """
+        Sends form containing given button to switch and loads returned page. Scripts of page are not run,
+        so form of page which gets settings from script variables is sent only if fields which are left empty
+        by its HTML were set before (otherwise current settings would be overwritten with empty values).
+
+        :param document: document with form
+        :param submitter: clicked button
+        :raises WebDriverException: if button is not placed in form or fields filled by scripts were not set
+        :return: None
+        """
+        form = next(submitter.iterancestors('form'), None)
+        if form is None:
+            raise WebDriverException('Button is not placed in any form.')
+        unset_fields = self._script_filled_fields(document, form)
+        if unset_fields:
+            raise WebDriverException(f'Fields {", ".join(unset_fields)} are filled by scripts of page which are '
+                                     f'not run. Set them before submitting form.')
+        method = (form.get('method') or 'GET').upper()
+        action = urljoin(document.url, form.get('action') or document.url)
+        fields = self._form_fields(form, submitter)
+        if method == 'POST':
+            self.load(self._target_frame(document, form.get('target')), 'POST', action, data=fields)
+        else:
+            scheme, netloc, path, _, _ = urlsplit(action)
+            url = urlunsplit((scheme, netloc, path, urlencode(fields, doseq=True), ''))
+            self.load(self._target_frame(document, form.get('target')), 'GET', url)
+
+    @staticmethod
+    def _form_fields(form: lxml.html.FormElement, submitter: lxml.html.HtmlElement) -> Dict[str, List[str]]:
+        fields: Dict[str, List[str]] = {}
+        for element in form.iter('input', 'select', 'textarea', 'button'):
+            name = element.get('name')
+            if not name or element.get('disabled') is not None:
+                continue
+            element_type = (element.get('type') or '').lower()
+            if element.tag == 'button' or element_type in _SUBMIT_TYPES + ('reset',):
+                values = [element.get('value', '')] if element is submitter else []
+            elif element_type in ('checkbox', 'radio'):
+                values = [element.get('value', 'on')] if element.get('checked') is not None else []
+            elif element.tag == 'select':
+                options = element.findall('.//option')
+                values = [o.get('value', o.text_content().strip()) for o in options if o.get('selected') is not None]
+                if not values and options and element.get('multiple') is None:
+                    values = [options[0].get('value', options[0].text_content().strip())]
+            elif element.tag == 'textarea':
+                values = [element.text_content()]
+            else:
+                values = [element.get('value', '')]
+            fields.setdefault(name, []).extend(values)
+        return fields
+
+    def _document(self, url: str, content: str) -> _Document:
+        root = self.parsed_pages.get(content)
+        return _Document(url, content, copy.deepcopy(root) if root is not None else None)  # copy can be changed
+
+    def _script_filled_fields(self, document: _Document, form: lxml.html.FormElement) -> List[str]:
+        if not self._variables(document):
+            return []
+        names = []
+        for element in form.iter('input', 'select', 'textarea'):
+            name = element.get('name')
+            if not name or name in document.filled or name in names or element.get('disabled') is not None:
+                continue
+            element_type = (element.get('type') or '').lower()
+            if element.tag == 'select':
+                empty = all(option.get('selected') is None for option in element.iter('option'))
+            elif element.tag == 'textarea':
+                empty = not element.text_content()
+            elif element_type == 'radio':
+                empty = not form.xpath(".//input[@type='radio' and @name=$name and @checked]", name=name)
+            else:
+                empty = element_type in _TEXT_TYPES and not element.get('value')
+            if empty:
+                names.append(name)
+        return names
+
+    def _target_frame(self, document: _Document, target: Optional[str]) -> Optional[str]:
+        if target in self._frames or target in [f.value for f in Frame]:
+            return target
+        if target == '_top' or document is self._top:
+            return None
+        return next((name for name, doc in self._frames.items() if doc is document), None)
+
+    def _unload(self) -> None:
+        for document in [self._top, *self._frames.values()]:
+            if document is not None:
+                document.alive = False
+        self._top = None
+        self._frames = {}
+        self._active_frame = None
+
+    def _active_document(self) -> _Document:
+        if self._top is None:
+            raise WebDriverException('No page is loaded.')
+        if self._active_frame is None:
+            return self._top
+        return self._frames[self._active_frame]
+
+    def _elements_texts(self, method: str, query: str) -> List[str]:
+        return [element.text for element in self.find_elements(method, query)]
+
+    def _frame_elements(self) -> Dict[str, HtmlElement]:
+        if self._top is None:
+            return {}
+        return {frame.get('name'): HtmlElement(self, self._top, frame)
+                for frame in self._top.root.xpath('//frame[@name] | //iframe[@name]')}
+
+    def _open_page(self, frame_name: str, page: str) -> Optional[bool]:
+        if self._top is None or not self._top.root.xpath(f"//frame[@name='{frame_name}'] | "
+                                                         f"//iframe[@name='{frame_name}']"):
+            return None
+        self.load(frame_name, 'GET', urljoin(self._top.url, page))
+        return True
+
+    def _session_alive(self, frame_name: str) -> bool:
+        _, content = self.client.request('GET', self.client.base_url)
+        return frame_name in content
+
+    def _mark_page(self, tip_query: str) -> None:
+        self._active_document().mark = self._tip_text(tip_query)
+
+    def _apply_outcome(self, tip_query: str) -> Optional[Dict[str, str]]:
+        if self.alert is not None:  # web browser dismisses alert and reports it
+            text = self.alert.text
+            self.close_alert()
+            raise UnexpectedAlertPresentException(alert_text=text)
+        text = self._tip_text(tip_query)
+        mark = self._active_document().mark
+        if mark is not None:
+            return {'tip': text} if text and text != mark else None
+        return {'tip': text}
+
+    def _tip_text(self, tip_query: str) -> str:
+        return next((element.text for element in self.find_elements(By.XPATH, tip_query) if element.is_displayed()), '')
+
+    def _fill_form(self, fields: List[Tuple[str, Any]], submit: Optional[str]) -> Optional[Dict[str, List[str]]]:
+        elements = [next(iter(self.find_elements(By.XPATH, query)), None) for query, _ in fields]
+        button = None if submit is None else next(iter(self.find_elements(By.XPATH, submit)), None)
+        if any(element is None for element in elements) or submit is not None and button is None:
+            return None
+        failed = [query for (query, value), element in zip(fields, elements) if not self._set_value(element, value)]
+        self._active_document().filled.update(
+            name for name in (element.get_dom_attribute('name') for element in elements) if name)
+        if button is not None and not failed:
+            button.click()
+        return {'failed': failed}
+
+    @staticmethod
+    def _set_value(element: HtmlElement, value: Any) -> bool:
+        if not element.is_enabled():
+            return False
+        if element.tag_name == 'select':
+            texts = value if isinstance(value, list) else [value]
+            options = element.find_elements(By.TAG_NAME, 'option')
+            chosen = [next((option for option in options if option.text == text),
+                           next((option for option in options if option.get_attribute('value') == text), None))
+                      for text in texts]
+            if None in chosen or not all(option.is_enabled() for option in chosen):
+                return False
+            multiple = element.get_dom_attribute('multiple') is not None
+            for option in options:
+                selected = option in chosen
+                if option.is_selected() != selected and (selected or multiple):
+                    option.click()
+        elif (element.get_dom_attribute('type') or '').lower() == 'radio' and isinstance(value, str):
+            group = element.find_elements(By.XPATH, "(ancestor::form | /)[last()]//input[@type='radio']")
+            radio = next((radio for radio in group if radio.get_dom_attribute('name') == element.get_dom_attribute(
+                'name') and radio.get_attribute('value') == value), None)
+            if radio is None or not radio.is_enabled():
+                return False
+            if not radio.is_selected():
+                radio.click()
+        elif (element.get_dom_attribute('type') or '').lower() in ('checkbox', 'radio'):
+            if element.is_selected() != value:
+                element.click()
+        else:
+            element.clear()
+            element.send_keys(value)
+        return True
+
+    def _page_variables(self, names: List[str]) -> Optional[Dict[str, Any]]:
+        variables = self._variables(self._active_document())
+        if any(name not in variables for name in names):
+            return None
+        return {name: variables[name] for name in names}
+
+    @staticmethod
+    def _variables(document: _Document) -> Dict[str, Any]:
+        if document.variables is None:
+            document.variables = javascript.parse_variables(
+                '\n'.join(script.text or '' for script in document.root.iter('script')))
+        return document.variables
+
+    @staticmethod
+    def _find_redirect(document: _Document) -> Optional[Tuple[bool, str]]:
+        root = document.root
+        if root.xpath('//form | //frameset | //frame | //iframe') or \
+                ''.join(root.xpath('//body//text()[not(ancestor::script)]')).strip():
+            return None
+        for meta in root.xpath("//meta[translate(@http-equiv, 'REFSH', 'refsh')='refresh']"):
+            _, _, url = (meta.get('content') or '').partition('=')
+            if url.strip():
+                return False, url.strip().strip('\'"')
+        for script in root.iter('script'):
+            match = _REDIRECT.search(script.text or '')
+            if match:
+                scope = match.group(1) or match.group(4) or ''
+                return scope in ('top.', 'parent.'), match.group(3) if match.group(3) is not None else match.group(6)
+        return None
+
+    @staticmethod
+    def _function_body(source: str, name: str) -> str:
+        match = re.search(r'function\s+' + re.escape(name) + r'\s*\([^)]*\)\s*\{', source)
+        if match is None:
+            return ''
+        depth = 1
+        for position in range(match.end(), len(source)):
+            depth += {'{': 1, '}': -1}.get(source[position], 0)
+            if depth == 0:
+                return source[match.end():position]
+        return source[match.end():]
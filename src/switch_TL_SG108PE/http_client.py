@@ -0,0 +1,105 @@
+"""Contains class to communicate with admin web page of switch over plain HTTP."""
+
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin
+import requests
+
+from .exceptions import LoginException, LogoutException, HttpRequestException, DeadlineExceededException
+from .utils import Frame
+
+
+class HttpClient:
+    """Creates object to send requests to admin web page of switch. Connection is kept alive between requests."""
+
+    def __init__(self, host: str, username: str, password: str, timeout: float = 4) -> None:
+        self.host = host
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.deadline: Optional[float] = None  # time (of time.monotonic()) until which requests must end
+        self.session = requests.Session()
+
+    @property
+    def base_url(self) -> str:
+        """
+        Returns address of admin web page of switch.
+
+        :return: url
+        """
+        return f'http://{self.host}/'
+
+    def url(self, path: str) -> str:
+        """
+        Builds absolute address of given page on switch.
+
+        :param path: path of page (e.g. SystemInfoRpm.htm)
+        :return: url
+        """
+        return urljoin(self.base_url, path)
+
+    def request(self, method: str, url: str, data: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+        """
+        Sends request to switch and returns address and content of received page.
+
+        :param method: HTTP method (GET or POST)
+        :param url: absolute address of page
+        :param data: form data sent in body of POST request
+        :raises HttpRequestException: if switch did not answer
+        :raises DeadlineExceededException: if deadline passed before request was sent
+        :return: final url (after redirects) and content of page
+        """
+        timeout = self.timeout
+        if self.deadline is not None:
+            timeout = min(timeout, self.deadline - time.monotonic())
+            if timeout <= 0:
+                raise DeadlineExceededException(f'Request "{method} {url}" not sent: deadline of operation passed')
+        try:
+            response = self.session.request(method, url, data=data, timeout=timeout)
+        except requests.RequestException as error:
+            raise HttpRequestException(f'Request "{method} {url}" failed: {error}') from None
+        return response.url, response.text
+
+    def login(self) -> None:
+        """
+        Login user in admin web page of switch by posting logon form.
+
+        :raises LoginException: if switch did not accept credentials
+        :return: None
+        """
+        data = {'username': self.username, 'password': self.password, 'cpassword': '', 'logon': 'Login'}
+        try:
+            self.request('POST', self.url('logon.cgi'), data=data)
+        except HttpRequestException:
+            raise LoginException(f'Couldn\'t connect to {self.host}.') from None
+        if not self.is_logged_in():
+            raise LoginException(f'Couldn\'t login to {self.host}. Check credentials.')
+
+    def logout(self) -> None:
+        """
+        Logout user from admin web page of switch.
+
+        :raises LogoutException: if switch did not answer
+        :return: None
+        """
+        try:
+            self.request('GET', self.url('Logout.htm'))
+        except HttpRequestException as error:
+            raise LogoutException(str(error)) from None
+
+    def is_logged_in(self) -> bool:
+        """
+        Checks if client is authenticated. Switch serves page with frames only to authenticated clients.
+
+        :return: True if it is, otherwise False
+        """
+        _, content = self.request('GET', self.base_url)
+        return Frame.TOP.value in content
+
+    def close(self) -> None:
+        """
+        Closes connection with switch.
+
+        :return: None
+        """
+        self.session.close()
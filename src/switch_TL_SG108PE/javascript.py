@@ -0,0 +1,179 @@
+"""
+Contains parser of JavaScript variables declared in scripts of admin pages. Pages of switch render their tables
+from such variables (e.g. ``var all_info = {state:[1,1,...], pkts:[...]};``), so their values can be read
+from page source without running scripts.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+
+_VAR = re.compile(r'\bvar\b')
+_NAME = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER = re.compile(r'[-+]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
+_ESCAPE = re.compile(r'\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|.)', re.S)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+
+
+class _NotLiteral(Exception):
+    """Raised if value of variable is not a literal (e.g. it's a result of function call)."""
+
+
+def parse_variables(source: str) -> Dict[str, Any]:
+    """
+    Parses variables declared with literal values in given script (numbers, strings, arrays and objects).
+    Variables declared with other values (e.g. function calls) are skipped. If variable is declared
+    many times, first declaration is used.
+
+    :param source: source of script
+    :return: values of variables by their names
+    """
+    variables = {}
+    position = 0
+    while True:
+        match = _VAR.search(source, position)
+        if match is None:
+            return variables
+        position = match.end()
+        while True:
+            parser = _Parser(source, position)
+            try:
+                name, value = parser.parse_declaration()
+            except _NotLiteral:
+                break
+            variables.setdefault(name, value)
+            if not parser.consume(','):
+                break
+            position = parser.position
+
+
+class _Parser:
+    """Reads literal values from source of script starting at given position."""
+
+    def __init__(self, source: str, position: int = 0) -> None:
+        self.source = source
+        self.position = position
+
+    def parse_declaration(self) -> Tuple[str, Any]:
+        """
+        Reads declaration of variable (e.g. ``max_port_num = 8``).
+
+        :raises _NotLiteral: if value of variable is not a literal
+        :return: name and value of variable (None if it's declared without value)
+        """
+        name = self._parse_name()
+        if not self.consume('='):
+            return name, None
+        return name, self.parse_value()
+
+    def parse_value(self) -> Any:  # pylint: disable=too-many-return-statements
+        """
+        Reads literal value (number, string, array, object, true, false or null).
+
+        :raises _NotLiteral: if value is not a literal
+        :return: value
+        """
+        self._skip_whitespace()
+        char = self.source[self.position:self.position + 1]
+        if char == '[':
+            self.position += 1
+            return self._parse_items(']')
+        if char == '{':
+            self.position += 1
+            return self._parse_object()
+        if char in ('"', "'"):
+            return self._parse_string()
+        if self.source.startswith('new', self.position):
+            self.position += len('new')
+            if self._parse_name() != 'Array' or not self.consume('('):
+                raise _NotLiteral()
+            return self._parse_items(')')
+        match = _NUMBER.match(self.source, self.position)
+        if match is not None:
+            self.position = match.end()
+            text = match.group()
+            if 'x' in text.lower():
+                return int(text, 16)
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        name = self._parse_name()
+        if name not in _KEYWORDS:
+            raise _NotLiteral()
+        return _KEYWORDS[name]
+
+    def consume(self, char: str) -> bool:
+        """
+        Skips given character if it's next one (after white characters and comments).
+
+        :param char: expected character
+        :return: True if character was skipped, otherwise False
+        """
+        self._skip_whitespace()
+        if self.source.startswith(char, self.position):
+            self.position += len(char)
+            return True
+        return False
+
+    def _parse_items(self, end: str) -> List[Any]:
+        items = []
+        while not self.consume(end):
+            items.append(self.parse_value())
+            if not self.consume(','):
+                if not self.consume(end):
+                    raise _NotLiteral()
+                break
+        return items
+
+    def _parse_object(self) -> Dict[str, Any]:
+        values = {}
+        while not self.consume('}'):
+            self._skip_whitespace()
+            key = self._parse_string() if self.source[self.position:self.position + 1] in ('"', "'") \
+                else self._parse_name()
+            if not self.consume(':'):
+                raise _NotLiteral()
+            values[key] = self.parse_value()
+            if not self.consume(','):
+                if not self.consume('}'):
+                    raise _NotLiteral()
+                break
+        return values
+
+    def _parse_string(self) -> str:
+        quote = self.source[self.position]
+        end = self.position + 1
+        while end < len(self.source) and self.source[end] != quote:
+            end += 2 if self.source[end] == '\\' else 1
+        if end >= len(self.source):
+            raise _NotLiteral()
+        text = self.source[self.position + 1:end]
+        self.position = end + 1
+        return _ESCAPE.sub(self._unescape, text)
+
+    def _parse_name(self) -> str:
+        self._skip_whitespace()
+        match = _NAME.match(self.source, self.position)
+        if match is None:
+            raise _NotLiteral()
+        self.position = match.end()
+        return match.group()
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while self.position < len(self.source) and self.source[self.position].isspace():
+                self.position += 1
+            if self.source.startswith('//', self.position):
+                end = self.source.find('\n', self.position)
+                self.position = len(self.source) if end == -1 else end
+            elif self.source.startswith('/*', self.position):
+                end = self.source.find('*/', self.position)
+                self.position = len(self.source) if end == -1 else end + 2
+            else:
+                return
+
+    @staticmethod
+    def _unescape(match: re.Match) -> str:
+        sequence = match.group(1)
+        if sequence[0] in 'xu' and len(sequence) > 1:
+            return chr(int(sequence[1:], 16))
+        return _ESCAPES.get(sequence, sequence)
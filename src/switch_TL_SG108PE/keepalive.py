@@ -0,0 +1,63 @@
+"""
+Contains keepalive renewing session of switch in background, so control field methods don't have to login again
+after switch dropped idle session.
+"""
+
+import threading
+from typing import Union
+
+from .web_controller import WebController
+from .browser import BROWSER_ERRORS
+from .easy_smart.client import EasySmartClient
+from .exceptions import TpLinkSwitchException
+
+
+class SessionKeepalive:
+    """
+    Creates object renewing session of given web controller in background thread. Session is renewed when it was
+    not used for given interval, which should be shorter than time after which switch drops idle session.
+    """
+
+    def __init__(self, web_controller: Union[WebController, EasySmartClient], interval: float) -> None:
+        self.web_controller = web_controller
+        self.interval = interval
+        self.failures = 0
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self) -> 'SessionKeepalive':
+        """
+        Starts renewing session in background thread.
+
+        :return: keepalive
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops renewing session. Renewal in progress is finished first.
+
+        :return: None
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'SessionKeepalive':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        delay = self.interval
+        while not self._stopped.wait(delay):
+            try:
+                delay = self.web_controller.keep_session_alive(self.interval)
+            except (TpLinkSwitchException, *BROWSER_ERRORS):
+                self.failures += 1  # switch is unreachable, next control field method will login again
+                delay = self.interval
@@ -45,6 +45,14 @@ class FLOW_CONTROL(Enum):  # pylint: disable=invalid-name
     OFF = 'Off'
 
 
+# Labels of codes used by switch to describe state of port and QoS mode (the same codes are used by admin page and
+# by Easy Smart Configuration Utility protocol).
+STATUS_LABELS = {0: 'Disabled', 1: 'Enabled'}
+SPEED_LABELS = {0: 'Link Down', 1: 'Auto', 2: '10MH', 3: '10MF', 4: '100MH', 5: '100MF', 6: '1000MF'}
+FLOW_CONTROL_LABELS = {0: 'Off', 1: 'On'}
+QOS_MODE_LABELS = {0: 'Port Based', 1: '802.1P Based', 2: 'DSCP/802.1P Based'}
+
+
 class PriorityQueue(Enum):
     """QoS Priority Queue for given port."""
     LOWEST_1 = '1(Lowest)'
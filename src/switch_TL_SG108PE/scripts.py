@@ -0,0 +1,171 @@
+"""
+Contains scripts run in web browser by web controller. Each of them replaces many driver commands
+(e.g. reading text of each table cell separately) with one command.
+Browserless driver (HtmlDriver) runs its own equivalents of these scripts.
+"""
+
+# Returns texts (with collapsed white characters) of all elements matching given locator.
+# arguments: method ('xpath' or 'css selector'), query
+ELEMENTS_TEXTS = """
+var method = arguments[0], query = arguments[1], elements = [], texts = [];
+if (method === 'xpath') {
+    var result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) {
+        elements.push(result.snapshotItem(i));
+    }
+} else {
+    elements = document.querySelectorAll(query);
+}
+for (var j = 0; j < elements.length; j++) {
+    texts.push((elements[j].innerText || '').replace(/\\s+/g, ' ').trim());
+}
+return texts;
+"""
+
+# Returns values of given global variables of page (or null if any of them is not declared).
+# arguments: names of variables
+PAGE_VARIABLES = """
+var names = arguments[0], values = {};
+for (var i = 0; i < names.length; i++) {
+    if (typeof window[names[i]] === 'undefined') {
+        return null;
+    }
+    values[names[i]] = window[names[i]];
+}
+return values;
+"""
+
+# Returns frames of top level document by their names. It can be run in any frame.
+FRAMES = """
+var frames = window.top.document.querySelectorAll('frame[name], iframe[name]'), elements = {};
+for (var i = 0; i < frames.length; i++) {
+    elements[frames[i].name] = frames[i];
+}
+return elements;
+"""
+
+# Requests admin page of switch (it also renews session of switch). Returns true if page with frames was served
+# (session is valid), otherwise false.
+# arguments: name of frame present only in admin page
+SESSION_ALIVE = """
+var request = new XMLHttpRequest();
+request.open('GET', '/', false);
+request.send(null);
+return request.status === 200 && request.responseText.indexOf(arguments[0]) >= 0;
+"""
+
+# Loads page into given frame of top level document (address is relative to address of top level document).
+# Returns true or null if frame is not present yet.
+# arguments: name of frame, address of page
+OPEN_PAGE = """
+var frame = window.top.frames[arguments[0]];
+if (!frame) {
+    return null;
+}
+frame.location.href = new URL(arguments[1], window.top.location.href).href;
+return true;
+"""
+
+# Remembers tip shown in page before settings are applied, so their outcome can be told from earlier tip.
+# arguments: XPath query of tip
+MARK_PAGE = """
+var tip = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+window.__switchPageMark = tip && tip.getClientRects().length ? (tip.innerText || '').replace(/\\s+/g, ' ').trim() : '';
+"""
+
+# Returns outcome of applying settings as soon as it is known: object with text of tip when new tip is shown
+# in marked page or when page was reloaded (empty text if reloaded page has no tip). Returns null otherwise.
+# Alert opened by page interrupts the script (web driver reports it).
+# arguments: XPath query of tip
+APPLY_OUTCOME = """
+var tip = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+var text = tip && tip.getClientRects().length ? (tip.innerText || '').replace(/\\s+/g, ' ').trim() : '';
+if (typeof window.__switchPageMark === 'string') {
+    return text && text !== window.__switchPageMark ? {tip: text} : null;
+}
+return document.readyState === 'complete' ? {tip: text} : null;
+"""
+
+# Fills form fields and clicks submit control. Fields are located by XPath and given as [query, value] pairs:
+# text for inputs, true/false for checkboxes and radios, visible text of option (or list of texts for multiple
+# select) for selects. Nothing is changed if any element is not present yet (null is returned). Submit control
+# is clicked after script returns, so confirmation dialog opened by it doesn't block the script. It is not clicked
+# if any field couldn't be set.
+# Returns object with queries of fields which couldn't be set (disabled fields or options, unknown options).
+# arguments: fields, query of submit control (or null)
+FILL_FORM = """
+var fields = arguments[0], submit = arguments[1], elements = [], failed = [];
+function find(query) {
+    return document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+function fire(element, type) {
+    var event = document.createEvent('HTMLEvents');
+    event.initEvent(type, true, true);
+    element.dispatchEvent(event);
+}
+for (var i = 0; i < fields.length; i++) {
+    elements.push(find(fields[i][0]));
+    if (elements[i] === null) {
+        return null;
+    }
+}
+var button = submit === null ? null : find(submit);
+if (submit !== null && button === null) {
+    return null;
+}
+for (var k = 0; k < fields.length; k++) {
+    var element = elements[k], value = fields[k][1], type = (element.type || '').toLowerCase();
+    if (element.disabled) {
+        failed.push(fields[k][0]);
+    } else if (element.tagName.toLowerCase() === 'select') {
+        var texts = [].concat(value), chosen = [], unavailable = false;
+        for (var t = 0; t < texts.length; t++) {
+            var option = null;
+            for (var j = 0; j < element.options.length && option === null; j++) {
+                if (element.options[j].text.replace(/\\s+/g, ' ').trim() === texts[t]) {
+                    option = element.options[j];
+                }
+            }
+            for (var v = 0; v < element.options.length && option === null; v++) {
+                if (element.options[v].value === texts[t]) {
+                    option = element.options[v];
+                }
+            }
+            unavailable = unavailable || option === null || option.disabled;
+            chosen.push(option);
+        }
+        if (unavailable) {
+            failed.push(fields[k][0]);
+            continue;
+        }
+        for (var n = 0; n < element.options.length; n++) {
+            element.options[n].selected = chosen.indexOf(element.options[n]) >= 0;
+        }
+        fire(element, 'change');
+    } else if (type === 'radio' && typeof value === 'string') {
+        var group = (element.form || document).getElementsByTagName('input'), radio = null;
+        for (var r = 0; r < group.length; r++) {
+            if (group[r].type === 'radio' && group[r].name === element.name && group[r].value === value) {
+                radio = group[r];
+            }
+        }
+        if (radio === null || radio.disabled) {
+            failed.push(fields[k][0]);
+        } else if (!radio.checked) {
+            radio.click();
+        }
+    } else if (type === 'checkbox' || type === 'radio') {
+        if (element.checked !== value) {
+            element.click();
+        }
+    } else {
+        element.value = value;
+        fire(element, 'input');
+        fire(element, 'change');
+    }
+}
+if (button !== null && failed.length === 0) {
+    setTimeout(function () { button.click(); }, 0);
+}
+return {failed: failed};
+"""
@@ -0,0 +1,123 @@
+"""
+Contains store of switch sessions kept in local file. Session saved by one process (e.g. CLI run or cron job)
+can be adopted by next one, so it doesn't have to login again while switch still accepts session.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .exceptions import SessionStoreException
+
+
+class SessionStore:
+    """
+    Creates object to save and load session cookies of switches (by host and username). Passwords are not stored.
+    Processes sharing file should access it only while holding lock (see lock()).
+    """
+
+    STALE_LOCK_AGE = 60.0  # lock older than that (in seconds) was left by crashed process and is broken
+
+    def __init__(self, path: str, lock_timeout: float = 10) -> None:
+        self.path = os.path.expanduser(path)
+        self.lock_timeout = lock_timeout
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Locks file for other processes (lock file is created next to it).
+
+        :raises SessionStoreException: if file stays locked by other process for lock_timeout seconds
+        :return: context manager holding lock
+        """
+        lock_path = f'{self.path}.lock'
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+                break
+            except FileExistsError:
+                if self._is_stale(lock_path):
+                    self._remove(lock_path)
+                elif time.monotonic() > deadline:
+                    raise SessionStoreException(f'Couldn\'t lock {self.path}.') from None
+                else:
+                    time.sleep(0.05)
+            except OSError as error:
+                raise SessionStoreException(f'Couldn\'t lock {self.path}: {error}') from None
+        try:
+            yield
+        finally:
+            self._remove(lock_path)
+
+    def load(self, host: str, username: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Returns cookies of session saved for given switch and user.
+
+        :param host: host address of switch
+        :param username: name of login
+        :return: cookies (in format of selenium) or None if session wasn't saved
+        """
+        session = self._read().get(host)
+        if session is None or session.get('username') != username:
+            return None
+        return session.get('cookies')
+
+    def save(self, host: str, username: str, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Saves cookies of session of given switch and user. File is replaced at once, so it is never half-written.
+
+        :param host: host address of switch
+        :param username: name of login
+        :param cookies: cookies (in format of selenium)
+        :return: None
+        """
+        sessions = self._read()
+        sessions[host] = {'username': username, 'cookies': cookies}
+        self._write(sessions)
+
+    def remove(self, host: str) -> None:
+        """
+        Removes session saved for given switch (e.g. after logout).
+
+        :param host: host address of switch
+        :return: None
+        """
+        sessions = self._read()
+        if sessions.pop(host, None) is not None:
+            self._write(sessions)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                sessions = json.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            raise SessionStoreException(f'Couldn\'t read {self.path}: {error}') from None
+        return sessions if isinstance(sessions, dict) else {}
+
+    def _write(self, sessions: Dict[str, Dict[str, Any]]) -> None:
+        temporary_path = f'{self.path}.tmp'
+        try:
+            with open(os.open(temporary_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600), 'w',
+                      encoding='utf-8') as file:
+                json.dump(sessions, file)
+            os.replace(temporary_path, self.path)
+        except OSError as error:
+            raise SessionStoreException(f'Couldn\'t write {self.path}: {error}') from None
+
+    def _is_stale(self, lock_path: str) -> bool:
+        try:
+            return time.time() - os.path.getmtime(lock_path) > self.STALE_LOCK_AGE
+        except OSError:
+            return False
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
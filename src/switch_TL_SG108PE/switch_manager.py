@@ -1,32 +1,47 @@
 """Contains main class to control switch."""
 
-from typing import List, Union
-from selenium import webdriver as wd
+from typing import Iterable, List, Optional, Tuple, Union
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from .web_controller import WebController
+from .web_controller import WebController, HttpWebController, HybridWebController
 from .control_fields.system import SystemControlField
 from .control_fields.switching import SwitchingControlField
 from .control_fields.monitoring import MonitoringControlField
 from .control_fields.vlan import VLANControlField
 from .control_fields.qos import QoSControlField
 from .control_fields.poe import PoEControlField
-from .exceptions import SwitchManagerNotConnectedException, UnknownControlFieldException
+from .easy_smart.client import EasySmartClient
+from .browser import BrowserPool, SharedBrowser, start_chrome
+from .keepalive import SessionKeepalive
+from .session_store import SessionStore
+from .easy_smart.control_fields import (EasySmartSystemControlField, EasySmartSwitchingControlField,
+                                        EasySmartMonitoringControlField, EasySmartVLANControlField,
+                                        EasySmartQoSControlField)
+from .exceptions import SwitchManagerNotConnectedException, UnknownControlFieldException, UnknownBackendException
 
 
-class SwitchManager:
+class SwitchManager:  # pylint: disable=too-many-instance-attributes
     """Creates object to control switch TL-SG108PE."""
 
+    BACKENDS = ('browser', 'http', 'hybrid', 'easy_smart')
+
     def __init__(self) -> None:
         self.host = None
         self.login = None
         self.password = None
         self.is_connected = False
         self._web_controller = None
+        self._keepalive = None
+        self._session_store = None
+        self._browser_pool = None
         self._control_fields = {}
 
     # pylint: disable=too-many-arguments
-    def connect(self, host: str, login: str, password: str, headless: bool = True, webdriver: WebDriver = None) -> None:
+    def connect(self, host: str, login: str, password: str, headless: bool = True, webdriver: WebDriver = None,
+                *, backend: str = 'browser', keepalive: Optional[float] = None,
+                session_file: Optional[str] = None, lean_browser: Optional[bool] = None,
+                browser_pool: Optional[BrowserPool] = None, shared_browser: Optional[SharedBrowser] = None,
+                pinned_tabs: Iterable[Tuple[str, str]] = ()) -> None:
         """
         Connects SwitchManager to admin web page of switch.
 
@@ -35,39 +50,84 @@ class SwitchManager:
         :param password: secret password
         :param headless: if True browser will be opened in background, otherwise browser will be visible
         :param webdriver: custom webdriver object
+        :param backend: 'browser' to control admin page via web browser,
+                        'http' to download pages directly from switch (without web browser),
+                        'hybrid' to login and change settings via web browser and read settings over plain HTTP,
+                        'easy_smart' to read settings via Easy Smart Configuration Utility protocol (UDP, read only)
+        :param keepalive: if given, session is renewed in background when it was not used for given number of seconds
+                          (it should be shorter than time after which switch drops idle session)
+        :param session_file: if given, session is saved in this file and next connection (e.g. from other process)
+                             adopts it instead of logging in again while switch still accepts it
+        :param lean_browser: if True browser started by SwitchManager loads only documents and scripts of admin page
+                             (see browser.start_chrome()), by default lean browser is started if it is headless
+        :param browser_pool: if given, browser is leased from this pool of started browsers (instead of starting new
+                             one) and returned to it by disconnect()
+        :param shared_browser: if given, SwitchManager uses its own window of this browser (shared with other
+                               SwitchManagers) and disconnect() closes the window
+        :param pinned_tabs: tabs (section and tab from menu, e.g. ('Monitoring', 'Port Statistics')) kept open
+                            in their own windows of browser, so their pages are not loaded again when other tab
+                            was used in the meantime
+        :raises UnknownBackendException: if given backend is not supported
+        :raises SessionStoreException: if session file cannot be locked, read or written
         :return: None
         """
+        if backend not in self.BACKENDS:
+            raise UnknownBackendException(f'"{backend}" backend is not recognised. '
+                                          f'Possible backends: {", ".join(self.BACKENDS)}')
         self.host = host
         self.login = login
         self.password = password
-        if webdriver is None:
-            if headless:
-                options = wd.ChromeOptions()
-                options.add_argument("--headless")
-                options.add_experimental_option('excludeSwitches', ['enable-logging'])
-                webdriver = wd.Chrome(options=options)
+        if backend == 'easy_smart':
+            self._web_controller = EasySmartClient(host, login, password)
+        elif backend == 'http':
+            self._web_controller = HttpWebController(host, login, password)
+        else:
+            if shared_browser is not None:
+                webdriver = shared_browser.webdriver
+            elif webdriver is None:
+                webdriver = self._start_browser(headless, lean_browser, browser_pool)
+            if backend == 'hybrid':
+                self._web_controller = HybridWebController(host, login, password, webdriver,
+                                                           shared_browser=shared_browser)
             else:
-                webdriver = wd.Chrome()
-        self._web_controller = WebController(host, login, password, webdriver)
-        self._web_controller.login()
-        self._control_fields = {
-            'system': SystemControlField(self._web_controller),
-            'switching': SwitchingControlField(self._web_controller),
-            'monitoring': MonitoringControlField(self._web_controller),
-            'VLAN': VLANControlField(self._web_controller),
-            'QoS': QoSControlField(self._web_controller),
-            'PoE': PoEControlField(self._web_controller)
-        }
+                self._web_controller = WebController(host, login, password, webdriver, shared_browser=shared_browser)
+            self._web_controller.pinned_tabs = set(pinned_tabs)
+        self._session_store = SessionStore(session_file) if session_file is not None else None
+        try:
+            self._start_session()
+        except Exception:
+            if self._browser_pool is not None or shared_browser is not None:  # browser is left for others
+                self._release_browser()
+            raise
+        self._control_fields = self._create_control_fields(backend)
+        if keepalive is not None:
+            self._keepalive = SessionKeepalive(self._web_controller, keepalive).start()
         self.is_connected = True
 
-    def disconnect(self) -> None:
+    def disconnect(self, logout: Optional[bool] = None) -> None:
         """
         Disconnects SwitchManager from admin web page of switch.
 
+        :param logout: if False user is not logged out and session can be adopted by next connection,
+                       by default user is logged out unless session is saved in session file or other
+                       SwitchManager uses the same switch in shared browser (windows share session)
         :return: None
         """
-        self._web_controller.logout()
-        self._web_controller.quit()
+        if self._keepalive is not None:
+            self._keepalive.stop()
+            self._keepalive = None
+        if logout is None:
+            logout = self._session_store is None and not self._web_controller.shares_session()
+        if logout:
+            self._web_controller.logout()
+        if self._session_store is not None:
+            with self._session_store.lock():
+                if logout:
+                    self._session_store.remove(self.host)
+                else:
+                    self._session_store.save(self.host, self.login, self._web_controller.export_session())
+            self._session_store = None
+        self._release_browser()
         self.host = None
         self.login = None
         self.password = None
@@ -101,6 +161,50 @@ class SwitchManager:
         """
         return list(self._control_fields.keys())
 
+    def _start_session(self) -> None:
+        if self._session_store is None:
+            self._web_controller.login()
+            return
+        with self._session_store.lock():
+            cookies = self._session_store.load(self.host, self.login)
+            if cookies is None or not self._web_controller.adopt_session(cookies):
+                self._web_controller.login()
+                self._session_store.save(self.host, self.login, self._web_controller.export_session())
+
+    def _create_control_fields(self, backend: str) -> dict:
+        if backend == 'easy_smart':
+            return {
+                'system': EasySmartSystemControlField(self._web_controller),
+                'switching': EasySmartSwitchingControlField(self._web_controller),
+                'monitoring': EasySmartMonitoringControlField(self._web_controller),
+                'VLAN': EasySmartVLANControlField(self._web_controller),
+                'QoS': EasySmartQoSControlField(self._web_controller),
+            }
+        return {
+            'system': SystemControlField(self._web_controller),
+            'switching': SwitchingControlField(self._web_controller),
+            'monitoring': MonitoringControlField(self._web_controller),
+            'VLAN': VLANControlField(self._web_controller),
+            'QoS': QoSControlField(self._web_controller),
+            'PoE': PoEControlField(self._web_controller)
+        }
+
+    def _start_browser(self, headless: bool, lean_browser: Optional[bool],
+                       browser_pool: Optional[BrowserPool]) -> WebDriver:
+        if browser_pool is None:
+            return start_chrome(headless, headless if lean_browser is None else lean_browser)
+        self._browser_pool = browser_pool
+        return browser_pool.lease()
+
+    def _release_browser(self) -> None:
+        if self._browser_pool is None:
+            self._web_controller.quit()
+            return
+        webdriver = self._web_controller.webdriver
+        self._web_controller.quit(browser=False)
+        self._browser_pool.release(webdriver)
+        self._browser_pool = None
+
     def _destroy_control_fields(self) -> None:
         del self._control_fields
 
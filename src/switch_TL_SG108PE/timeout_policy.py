@@ -0,0 +1,83 @@
+"""
+Contains policy of timeouts learned from observed latency of switch. Waits for elements, alerts and scripts
+use it when they are called without explicit timeout.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Hashable
+
+
+class TimeoutPolicy:
+    """
+    Creates object recording how long waits for given keys (locators, operations running scripts) took.
+    When enough waits were observed, timeout is a multiple of their 99th percentile and poll interval is a fraction
+    of their median, so fast switch fails fast and slow switch (e.g. under load) has time to answer. Until then
+    default timeouts are used. Waits which timed out are recorded too, so timeout grows when switch slows down.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, factor: float = 3.0, minimum: float = 0.2, maximum: float = 30.0, min_samples: int = 5,
+                 history: int = 100) -> None:
+        self.factor = factor
+        self.minimum = minimum  # seconds
+        self.maximum = maximum  # seconds
+        self.min_samples = min_samples
+        self.history = history
+        self.default_poll_interval = 0.1  # seconds
+        self._latencies: Dict[Hashable, Deque[float]] = {}
+
+    def record(self, key: Hashable, latency: float) -> None:
+        """
+        Records time of wait. Wait which timed out is recorded with time it took (latency was at least that long).
+
+        :param key: locator, script or other key of wait
+        :param latency: time of wait in seconds
+        :return: None
+        """
+        self._latencies.setdefault(key, deque(maxlen=self.history)).append(latency)
+
+    def learned(self, key: Hashable) -> bool:
+        """
+        Checks if enough waits for given key were observed to learn its timeout.
+
+        :param key: locator, script or other key of wait
+        :return: True if timeout is learned, otherwise False (default timeout is used)
+        """
+        return len(self._latencies.get(key, ())) >= self.min_samples
+
+    def timeout(self, key: Hashable, default: float) -> float:
+        """
+        Returns timeout of wait for given key.
+
+        :param key: locator, script or other key of wait
+        :param default: timeout used until enough waits were observed
+        :return: timeout in seconds
+        """
+        if not self.learned(key):
+            return default
+        return min(max(self._percentile(self._latencies[key], 0.99) * self.factor, self.minimum), self.maximum)
+
+    def poll_interval(self, key: Hashable) -> float:
+        """
+        Returns interval in which condition of wait for given key is checked.
+
+        :param key: locator, script or other key of wait
+        :return: interval in seconds
+        """
+        if not self.learned(key):
+            return self.default_poll_interval
+        return min(max(self._percentile(self._latencies[key], 0.5) / 4, 0.02), 0.5)
+
+    def reset(self) -> None:
+        """
+        Forgets observed waits (e.g. after switch was restarted).
+
+        :return: None
+        """
+        self._latencies.clear()
+
+    @staticmethod
+    def _percentile(latencies: Deque[float], fraction: float) -> float:
+        ordered = sorted(latencies)
+        return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
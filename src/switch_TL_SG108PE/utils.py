@@ -1,8 +1,9 @@
 """Contains artifacts common for library."""
 
 from enum import Enum
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
-from .port import PORT_LABEL, LAG_LABEL
+from .port import PORT_LABEL, LAG_LABEL, STATUS_LABELS, SPEED_LABELS, FLOW_CONTROL_LABELS
 from .exceptions import VlanIdException, PortIdException, LagIdException
 
 
@@ -14,6 +15,38 @@ class Frame(Enum):
     TOP = 'topFrame'
 
 
+# Pages loaded into main frame after clicking given (section, tab) link in sidebar navigation.
+PAGES: Dict[Tuple[str, str], str] = {
+    ('System', 'System Info'): 'SystemInfoRpm.htm',
+    ('System', 'IP Setting'): 'IpSettingRpm.htm',
+    ('System', 'LED On/Off'): 'TurnOnLEDRpm.htm',
+    ('System', 'User Account'): 'UserAccountRpm.htm',
+    ('Switching', 'Port Setting'): 'PortSettingRpm.htm',
+    ('Switching', 'IGMP Snooping'): 'IgmpSnoopingRpm.htm',
+    ('Switching', 'LAG'): 'PortTrunkRpm.htm',
+    ('Monitoring', 'Port Statistics'): 'PortStatisticsRpm.htm',
+    ('Monitoring', 'Port Mirror'): 'PortMirrorRpm.htm',
+    ('Monitoring', 'Loop Prevention'): 'LoopPreventionRpm.htm',
+    ('VLAN', 'MTU VLAN'): 'VlanMtuRpm.htm',
+    ('VLAN', 'Port Based VLAN'): 'VlanPortBasicRpm.htm',
+    ('VLAN', '802.1Q VLAN'): 'Vlan8021QRpm.htm',
+    ('QoS', 'QoS Basic'): 'QosBasicRpm.htm',
+}
+
+
+def get_tab_page(tab: str) -> Optional[str]:
+    """
+    Gets page loaded into main frame for given tab from sidebar navigation.
+
+    :param tab: subsection from menu (e.g. System Info)
+    :return: page name or None if tab is unknown
+    """
+    for (_, tab_name), page in PAGES.items():
+        if tab_name == tab:
+            return page
+    return None
+
+
 def get_port_label(port_id: int) -> PORT_LABEL:
     """
     Gets label for given port id. Label is string pattern visible in admin page.
@@ -34,6 +67,86 @@ def get_lag_label(lag_id: int) -> LAG_LABEL:
     return getattr(LAG_LABEL, f'LAG_{lag_id}')
 
 
+def format_port_list(ports: Iterable[int]) -> str:
+    """
+    Formats port numbers in the same way as admin page does (e.g. [1, 2, 3, 5] -> '1-3,5').
+
+    :param ports: port numbers
+    :return: formatted ports
+    """
+    ranges = []
+    for port in sorted(set(ports)):
+        if ranges and ranges[-1][1] == port - 1:
+            ranges[-1][1] = port
+        else:
+            ranges.append([port, port])
+    return ','.join(str(first) if first == last else f'{first}-{last}' for first, last in ranges)
+
+
+def format_port_settings(status: int, speed_config: int, speed_actual: int, flow_control_config: int,
+                         flow_control_actual: int) -> Dict[str, str]:
+    """
+    Formats settings of port given as codes used by switch in the same way as admin page does.
+
+    :param status: code of status
+    :param speed_config: code of configured speed and duplex
+    :param speed_actual: code of actual speed and duplex
+    :param flow_control_config: code of configured flow control
+    :param flow_control_actual: code of actual flow control
+    :return: settings of port
+    """
+    return {
+        'Status': STATUS_LABELS[status],
+        'Speed/Duplex Config': SPEED_LABELS[speed_config],
+        'Speed/Duplex Actual': SPEED_LABELS[speed_actual],
+        'Flow Control Config': FLOW_CONTROL_LABELS[flow_control_config],
+        'Flow Control Actual': FLOW_CONTROL_LABELS[flow_control_actual],
+    }
+
+
+def format_port_statistics(status: int, link_status: int, packets: Sequence[int]) -> Dict[str, str]:
+    """
+    Formats statistics of port given as codes and counters used by switch in the same way as admin page does.
+
+    :param status: code of status
+    :param link_status: code of actual speed and duplex
+    :param packets: numbers of good sent, bad sent, good received and bad received packets
+    :return: statistics of port
+    """
+    tx_good, tx_bad, rx_good, rx_bad = packets
+    return {
+        'Status': STATUS_LABELS[status],
+        'Link Status': SPEED_LABELS[link_status],
+        'TxGoodPkt': str(tx_good),
+        'TxBadPkt': str(tx_bad),
+        'RxGoodPkt': str(rx_good),
+        'RxBadPkt': str(rx_bad),
+    }
+
+
+def decode_ports_mask(mask: int) -> List[int]:
+    """
+    Decodes bit mask of ports (bit 0 is port 1).
+
+    :param mask: bit mask
+    :return: port numbers
+    """
+    return [port for port in range(1, 33) if mask & 1 << (port - 1)]
+
+
+def encode_ports_mask(ports: List[int]) -> int:
+    """
+    Encodes port numbers as bit mask (bit 0 is port 1).
+
+    :param ports: port numbers
+    :return: bit mask
+    """
+    mask = 0
+    for port in ports:
+        mask |= 1 << (port - 1)
+    return mask
+
+
 def validate_vlan_id(vlan_id: int) -> None:
     """
     Validates id of vlan. If id is incorrect, exception will be raised.
@@ -1,30 +1,95 @@
-"""Contains class to control web browser."""
+"""Contains class to control web browser."""  # pylint: disable=too-many-lines
 
-from typing import List
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple, Union
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.common.alert import Alert
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, NoAlertPresentException,
+                                        NoSuchFrameException, StaleElementReferenceException,
+                                        UnexpectedAlertPresentException, WebDriverException)
 
-from .exceptions import LoginException, LogoutException, TpLinkSwitchException
+from . import scripts
+from .exceptions import LoginException, LogoutException, TpLinkSwitchException, DeadlineExceededException
 from .utils import Frame
+from .http_client import HttpClient
+from .html_driver import HtmlDriver, HtmlElement
+from .timeout_policy import TimeoutPolicy
+from .browser import SharedBrowser
 
 
-class WebController:
+def _in_own_window(method: Callable) -> Callable:
+    """Runs method of web controller in its window of shared web browser (other web controllers wait for it)."""
+
+    @functools.wraps(method)
+    def inner(self, *args, **kwargs):
+        with self.own_window():
+            return method(self, *args, **kwargs)
+
+    return inner
+
+
+class _RememberedElement(WebElement):
+    """
+    Element remembered by web controller. It is not checked before it is returned again, if page was loaded again
+    in the meantime, element is found again when it is used and the command is sent once more.
+    """
+
+    def __init__(self, element: WebElement, locate: Callable[[], WebElement]) -> None:
+        super().__init__(element.parent, element.id)
+        self._locate = locate
+
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._id = self._locate().id
+            return super()._execute(command, params)
+
+
+class WebController:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
     """Creates object to control admin web page of switch via selenium library."""
 
     # pylint: disable=invalid-name
-    def __init__(self, host, username: str, password: str, webdriver: WebDriver) -> None:
+    def __init__(self, host, username: str, password: str, webdriver: WebDriver, *,
+                 shared_browser: Optional[SharedBrowser] = None) -> None:
         self.host = host
         self.username = username
         self.password = password
         self.webdriver = webdriver
-        self._active_frame = ''
+        self.shared_browser = shared_browser  # if given, controller uses its own window of shared browser
+        self._active_frame: Union[Frame, str, None] = ''  # empty string if active frame is unknown
+        self._frames: Dict[str, WebElement] = {}
+        self._elements: Dict[Tuple[Union[Frame, None], str, str], WebElement] = {}  # found in current pages
+        self._operations: List[bool] = []
+        self._deadlines: List[Optional[float]] = []
+        self.deadline: Optional[float] = None  # time (of time.monotonic()) until which operation must end
+        self.outer_deadline: Optional[float] = None  # time which no operation exceeds (e.g. of replayed call)
+        self._session_confirmed_at: Optional[float] = None
+        self.current_tab: Optional[Tuple[str, str]] = None
+        self.session_ttl = 30.0  # seconds after confirmation in which session is not checked again
+        self._lock = threading.RLock() if shared_browser is None else shared_browser.lock  # held by outermost operation
+        self._window = shared_browser.open_window(host=host) if shared_browser is not None else None
+        self._current_window = self._window
+        self.pinned_tabs: Set[Tuple[str, str]] = set()  # tabs kept open in their own windows (see use_tab_window())
+        self._tab_windows: Dict[Optional[Tuple[str, str]], str] = {}  # windows by pinned tab (None for other tabs)
+        self._window_states: Dict[str, tuple] = {}  # loaded pages of windows which are not current
+        self._pages_version = 0  # increased when pages loaded before may be outdated (settings changed, login)
+        self._window_version = 0  # version of pages loaded in current window
+        self.timeouts = TimeoutPolicy()
+        self._page_loaded = False  # next wait is first one in newly loaded page (its time includes loading)
+        self._applied_settings: Tuple[Optional[Tuple[str, str]], Optional[str]] = (None, None)  # tab, submit query
+        self.page_load_timeout = 300.0  # seconds, limit of loading page by web browser in operation without deadline
 
+    @_in_own_window
     def login(self) -> None:
         """
         Login user in admin web page of switch.
@@ -32,20 +97,23 @@ class WebController:
         :return: None
         """
         try:
-            self.webdriver.get(f'http://{self.host}')
-            self.wait_until_element_is_present(By.ID, 'logon')
+            self._load_page(f'http://{self.host}')
+            self.forget_loaded_page()
+            page = self.wait_until_element_is_present(
+                By.XPATH, f"//*[@id='logon'] | //frame[@name='{Frame.TOP.value}']", exception=LoginException)
         except WebDriverException:
             raise LoginException(f'Couldn\'t connect to {self.host}.') from None
-        except TpLinkSwitchException:
-            self.logout()
-        self.wait_until_element_is_present(By.ID, 'username', exception=LoginException)
-        self.webdriver.find_element(By.ID, 'username').send_keys(self.username)
-        self.wait_until_element_is_present(By.ID, 'password', exception=LoginException)
-        self.webdriver.find_element(By.ID, 'password').send_keys(self.password)
-        self.wait_until_element_is_present(By.ID, 'logon', exception=LoginException)
-        self.webdriver.find_element(By.ID, 'logon').click()
+        if page.tag_name == 'frame':  # session of web browser is still valid
+            self._confirm_session()
+            return
+        self.wait_until_element_is_present(By.ID, 'username', exception=LoginException).send_keys(self.username)
+        self.wait_until_element_is_present(By.ID, 'password', exception=LoginException).send_keys(self.password)
+        self.wait_until_element_is_present(By.ID, 'logon', exception=LoginException).click()
         self.wait_until_element_is_present(By.XPATH, f"//frame[@name='{Frame.TOP.value}']", exception=LoginException)
+        self._confirm_session()
+        self._change_pages()
 
+    @_in_own_window
     def logout(self) -> None:
         """
         Logout user from admin web page of switch.
@@ -54,48 +122,261 @@ class WebController:
         """
         self.switch_to_frame(Frame.MENU)
         logout_link_details = (By.XPATH, "//div[@id='logout']//a[@class='menulink']")
-        self.wait_until_element_is_present(*logout_link_details, exception=LogoutException)
-        logout_link = self.webdriver.find_element(*logout_link_details)
+        logout_link = self.wait_until_element_is_present(*logout_link_details, exception=LogoutException)
         logout_link.click()
-        self.wait_until_alert_is_present(exception=LogoutException)
-        alert = self.webdriver.switch_to.alert
+        alert = self.wait_until_alert_is_present(exception=LogoutException)
         alert.accept()
+        self.forget_loaded_page()
+        self._session_confirmed_at = None
 
-    def is_logged_in(self) -> bool:
+    @_in_own_window
+    def export_session(self) -> List[Dict[str, Any]]:
         """
-        Checks if client is authenticated.
+        Returns cookies of current session, so it can be adopted by other process.
 
-        :return: True if it is, otherwise False
+        :return: cookies (in format of selenium)
+        """
+        return self.webdriver.get_cookies()
+
+    @_in_own_window
+    def adopt_session(self, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Loads admin web page of switch with cookies of session exported by other process instead of logging in.
+
+        :param cookies: cookies returned by export_session()
+        :raises LoginException: if switch is not reachable
+        :return: True if switch still accepts session, otherwise False (user has to login)
         """
-        self.switch_to_default_content()
-        top_frame_details = (By.XPATH, f"//frame[@name='{Frame.TOP.value}']")
         try:
-            self.webdriver.find_element(*top_frame_details)
-        except NoSuchElementException:
+            self._load_page(f'http://{self.host}')  # cookies can be added only for domain of loaded page
+            for cookie in cookies:
+                self.webdriver.add_cookie(cookie)
+            self._load_page(f'http://{self.host}')
+        except WebDriverException:
+            raise LoginException(f'Couldn\'t connect to {self.host}.') from None
+        self.forget_loaded_page()
+        if not self.is_logged_in():
+            return False
+        self._confirm_session()
+        return True
+
+    @contextmanager
+    def own_window(self) -> Iterator[None]:
+        """
+        Activates window of web controller in shared web browser and holds lock of browser
+        (without shared web browser only lock of web controller is held).
+
+        :return: context manager holding lock
+        """
+        with self._lock:
+            self._activate_window()
+            yield
+
+    def begin_operation(self, read_only: bool = False, deadline: Optional[float] = None) -> None:
+        """
+        Marks beginning of control field method. Operations may be nested (e.g. setter reads current settings).
+        Operation started in other thread (e.g. by keepalive) waits until outermost operation ends.
+        Nested operation can't end later than operation which called it, outermost one can't end later
+        than outer deadline.
+
+        :param read_only: True if operation does not change configuration of switch
+        :param deadline: maximum time (in seconds) of operation, all its waits draw from it
+        :return: None
+        """
+        self._lock.acquire()  # pylint: disable=consider-using-with
+        if not self._operations:
+            self._activate_window()
+        self._operations.append(read_only)
+        outer_deadline = self._deadlines[-1] if self._deadlines else self.outer_deadline
+        if deadline is not None:
+            deadline = time.monotonic() + deadline
+            if outer_deadline is not None:
+                deadline = min(deadline, outer_deadline)
+        else:
+            deadline = outer_deadline
+        self._deadlines.append(deadline)
+        self.set_deadline(deadline)
+
+    def end_operation(self, failed: bool = False) -> None:
+        """
+        Marks end of control field method. If it failed, content of main frame is unknown,
+        so tab is opened again by next operation.
+
+        :param failed: True if method raised an exception
+        :return: None
+        """
+        try:
+            if len(self._operations) == 1 and not self._operations[0]:
+                self._change_pages()  # settings were changed (pages in other windows are outdated)
+            if failed:
+                self.current_tab = None
+                self.forget_elements()
+            elif len(self._operations) == 1:
+                self._confirm_session()
+            self._operations.pop()
+            self._deadlines.pop()
+            self.set_deadline(self._deadlines[-1] if self._deadlines else None)
+        finally:
+            self._lock.release()
+
+    def ensure_logged_in(self) -> None:
+        """
+        Login user if session is not valid. Session is checked only by outermost control field method
+        and only if it was not confirmed (by login or successful method) in last session_ttl seconds.
+
+        :return: None
+        """
+        if len(self._operations) > 1 or self._session_confirmed_at is not None and \
+                time.monotonic() - self._session_confirmed_at < self.session_ttl:
+            return
+        if not self.is_logged_in():
+            self.login()
+        self._confirm_session()
+
+    def recover_session(self) -> bool:
+        """
+        Checks session after control field method failed. If session expired, user is logged in again.
+        Nested methods are not recovered (outermost method is retried as a whole).
+
+        :return: True if user was logged in again or admin page of read only method was reloaded in the meantime
+            (method can be retried), otherwise False (also if deadline of method passed or switch rejected settings
+            submitted by method)
+        """
+        self._session_confirmed_at = None
+        remaining_time = self.remaining_time()
+        if len(self._operations) > 1 or remaining_time is not None and remaining_time <= 0:
             return False
+        current_tab = self.current_tab
+        if self.is_logged_in() and self._has_valid_session():
+            return self._operations[0] and self.current_tab != current_tab
+        self.login()
         return True
 
-    def quit(self) -> None:
+    def set_deadline(self, deadline: Optional[float]) -> None:
         """
-        Quits web browser.
+        Sets time until which running operation must end. Waits don't last longer.
 
+        :param deadline: time (of time.monotonic()) or None if operation has no deadline
         :return: None
         """
-        self.webdriver.quit()
+        self.deadline = deadline
+
+    def remaining_time(self) -> Optional[float]:
+        """
+        Returns time left until deadline of running operation.
+
+        :return: time in seconds (not positive if deadline passed) or None if operation has no deadline
+        """
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def keep_session_alive(self, max_idle: float = 0.0) -> float:
+        """
+        Renews session if it was not confirmed in last max_idle seconds, because switch drops idle sessions.
+        Admin page is requested once and user is logged in again only if session already expired.
+        It can be called from other thread (it waits until running control field method ends).
+
+        :param max_idle: time (in seconds) after which session is renewed
+        :return: time (in seconds) after which session should be renewed next time
+        """
+        with self._lock:
+            if self._session_confirmed_at is not None:
+                idle = time.monotonic() - self._session_confirmed_at
+                if idle < max_idle:
+                    return max_idle - idle
+            self.begin_operation(read_only=True)
+            try:
+                if not self._has_valid_session():
+                    self.login()
+            except BaseException:
+                self.end_operation(failed=True)
+                raise
+            self.end_operation()
+            return max_idle
+
+    def is_logged_in(self) -> bool:
+        """
+        Checks if client is authenticated. Frames of admin page are found at once and active frame is not changed.
+        If admin page was loaded again in the meantime, active frame and opened tab are forgotten.
+
+        :return: True if it is, otherwise False
+        """
+        return Frame.TOP.value in self._find_frames()
+
+    def shares_session(self) -> bool:
+        """
+        Checks if other web controller controls the same switch in shared web browser. Windows of browser share
+        cookies, so logging out would end its session too.
+
+        :return: True if session is shared, otherwise False
+        """
+        return self.shared_browser is not None and self.shared_browser.shares_session(self._window)
+
+    def quit(self, browser: bool = True) -> None:
+        """
+        Quits web browser (or closes window of shared web browser).
+
+        :param browser: if False web browser is left running (e.g. to return it to browser pool)
+        :return: None
+        """
+        with self._lock:
+            if self.shared_browser is not None or not browser:
+                self._close_tab_windows()
+            if self.shared_browser is not None:
+                self.shared_browser.close_window(self._window)
+            elif browser:
+                self.webdriver.quit()
+
+    def use_tab_window(self, tab: Tuple[str, str]) -> None:
+        """
+        Activates window in which given tab is opened. Pinned tabs (see pinned_tabs) are kept open in their own
+        windows (window is opened when tab is used first time), other tabs are opened in main window. If settings
+        were changed or user logged in again since page of window was loaded, tab is opened again by open_tab().
+        Nothing is done if no tab is pinned.
+
+        :param tab: section and tab from menu (e.g. ('Monitoring', 'Port Statistics'))
+        :return: None
+        """
+        if not self.pinned_tabs and not self._tab_windows:
+            return
+        if not self._tab_windows:
+            self._current_window = self._current_window or self.webdriver.current_window_handle
+            self._tab_windows[None] = self._current_window
+        window = self._tab_windows.get(tab if tab in self.pinned_tabs else None)
+        if window is not None and window == self._current_window:
+            return
+        self._window_states[self._current_window] = (self.current_tab, self._frames, self._elements,
+                                                     self._window_version)
+        if window is None:
+            window = self._tab_windows[tab] = self._open_tab_window()
+            self._load_page(f'http://{self.host}')  # admin page (session is shared by windows)
+            state = (None, {}, {}, self._pages_version)
+        else:
+            self._switch_to_window(window)
+            state = self._window_states.pop(window)
+        self.current_tab, self._frames, self._elements, self._window_version = state
+        if self._window_version != self._pages_version:
+            self.current_tab = None
+            self._window_version = self._pages_version
 
     def switch_to_frame(self, frame_name: Frame) -> None:
         """
         Changes current frame. Switch admin page consists of many frames like sidebar navigation frame,
         main content frame... To manipulate content of frame we need to activate it before.
+        Nothing is done if frame is already active. Found frames are reused until admin page is loaded again.
 
         :param frame_name: name of frame
         :return: None
         """
+        if self._active_frame == frame_name:
+            return
         self.switch_to_default_content()
-        frame_details = (By.XPATH, f"//frame[@name='{frame_name.value}']")
-        self.wait_until_element_is_present(*frame_details)
-        frame = self.webdriver.find_element(*frame_details)
-        self.webdriver.switch_to.frame(frame)
+        frame = self._frames.get(frame_name.value)
+        if frame is None or not self._try_switch_to_frame(frame):
+            if frame is not None:
+                self.forget_elements()  # admin page was loaded again
+            frame = self.wait_until_element_is_present(By.XPATH, f"//frame[@name='{frame_name.value}']")
+            self._frames[frame_name.value] = frame
+            self.webdriver.switch_to.frame(frame)
         self._active_frame = frame_name
 
     def switch_to_default_content(self) -> None:
@@ -104,9 +385,37 @@ class WebController:
 
         :return: None
         """
+        if self._active_frame is None:
+            return
         self.webdriver.switch_to.default_content()
         self._active_frame = None
 
+    def forget_loaded_page(self) -> None:
+        """
+        Forgets state of loaded admin page (opened tab, active frame and found frames).
+        It has to be called after top level document was loaded again.
+
+        :return: None
+        """
+        self.current_tab = None
+        self._active_frame = None
+        self._frames = {}
+        self.forget_elements()
+
+    def forget_elements(self, frame_name: Optional[Frame] = None) -> None:
+        """
+        Forgets elements found in pages currently loaded. It should be called after page was loaded again
+        (elements requested after page was loaded again are found again anyway, but it costs failed command).
+
+        :param frame_name: frame to which page was loaded or None if elements of all frames are forgotten
+        :return: None
+        """
+        if frame_name is None:
+            self._elements = {}
+        else:
+            self._elements = {key: element for key, element in self._elements.items() if key[0] != frame_name}
+        self._page_loaded = True
+
     def find_element(self, method: By, query: str) -> WebElement:
         """
         Finds first element with matching query and returns it.
@@ -115,7 +424,7 @@ class WebController:
         :param query: key used to locate elements on a page
         :return: found element
         """
-        return self.webdriver.find_element(method, query)
+        return self._remember_element(method, query, lambda: self.webdriver.find_element(method, query))
 
     def find_elements(self, method: By, query: str) -> List[WebElement]:
         """
@@ -127,6 +436,116 @@ class WebController:
         """
         return self.webdriver.find_elements(method, query)
 
+    def get_table(self, method: By, query: str, columns: int, timeout: Optional[float] = None,
+                  exception=TpLinkSwitchException) -> List[List[str]]:
+        """
+        Reads texts of all table cells matching query in one driver command and groups them into rows.
+        It waits until cells are present on web page. If cells weren't be found an error will be raised.
+
+        :param method: used to specify which attribute is used to locate cells (By.XPATH or By.CSS_SELECTOR)
+        :param query: key used to locate cells on a page
+        :param columns: number of cells in row
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: rows of table with texts of cells
+        """
+        texts = self.wait_until_script_returns_value(scripts.ELEMENTS_TEXTS, method, query, timeout=timeout,
+                                                     exception=exception, key=(scripts.ELEMENTS_TEXTS, method, query))
+        return [texts[i:i+columns] for i in range(0, len(texts), columns)]
+
+    def get_page_variables(self, *names: str, timeout: Optional[float] = None,
+                           exception=TpLinkSwitchException) -> Dict[str, Any]:
+        """
+        Reads values of global JavaScript variables of active frame in one driver command. Admin pages render
+        their tables from such variables, so values are returned as native numbers, strings, lists and dicts.
+        It waits until all variables are declared. If they weren't be found an error will be raised.
+
+        :param names: names of variables
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: values of variables by their names
+        """
+        return self.wait_until_script_returns_value(scripts.PAGE_VARIABLES, list(names), timeout=timeout,
+                                                    exception=exception, key=(scripts.PAGE_VARIABLES, names))
+
+    def open_page(self, frame_name: Frame, page: str, timeout: Optional[float] = None,
+                  exception=TpLinkSwitchException) -> None:
+        """
+        Loads given page into given frame with one driver command (without clicking links in sidebar navigation).
+        Active frame is not changed.
+
+        :param frame_name: name of frame
+        :param page: address of page relative to admin page (e.g. SystemInfoRpm.htm)
+        :param timeout: maximum time of waiting for frame in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: None
+        """
+        self.wait_until_script_returns_value(scripts.OPEN_PAGE, frame_name.value, page, timeout=timeout,
+                                             exception=exception, key=(scripts.OPEN_PAGE, frame_name.value, page))
+        self.forget_elements()
+
+    def fill_form(self, fields: Dict[str, Union[str, bool, List[str]]], submit: Optional[str] = None,
+                  timeout: Optional[float] = None, exception=TpLinkSwitchException) -> None:
+        """
+        Fills form fields and clicks submit control in one driver command. Fields are located by XPath queries.
+        Values are texts for inputs, True / False for checkboxes and radios (or value of radio to check in group
+        of given radio), visible texts or values of options for selects (list of them for multiple select, other
+        options are deselected). It waits until all elements are present.
+
+        :param fields: values by XPath queries of fields (they are set in given order)
+        :param submit: XPath query of control which submits form (form is not submitted if it's not given
+                       or some field cannot be set)
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised if field cannot be set (e.g. its option is disabled)
+        :return: None
+        """
+        if submit is not None:
+            self.forget_elements()
+        result = self.wait_until_script_returns_value(
+            scripts.FILL_FORM, [[query, value] for query, value in fields.items()], submit, timeout=timeout,
+            key=(scripts.FILL_FORM, tuple(fields), submit))
+        if result['failed']:
+            details = ', '.join(f'"{fields[query]}" in field identified as "{query}"' for query in result['failed'])
+            raise exception(f'Cannot set {details} (field or option is disabled or not available).')
+
+    def mark_page(self, tip_query: str, submit: Optional[str] = None) -> None:
+        """
+        Marks page before settings are applied, so tip shown by it earlier is not taken as their outcome.
+
+        :param tip_query: XPath query of tip shown by page
+        :param submit: XPath query of control which applies settings (time of applying is learned separately
+                       for each tab and control)
+        :return: None
+        """
+        self._applied_settings = (self.current_tab, submit)
+        self.webdriver.execute_script(scripts.MARK_PAGE, tip_query)
+        self.forget_elements()  # page is going to be loaded again
+
+    def wait_until_settings_are_applied(self, tip_query: str, timeout: Optional[float] = None) -> str:
+        """
+        Waits until outcome of applying settings in marked page is known: new tip is shown, page is reloaded
+        or alert is opened (it is closed).
+
+        :param tip_query: XPath query of tip shown by page
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :return: text of tip or alert (empty if page was reloaded without tip or outcome is not known in time)
+        """
+        key = (scripts.APPLY_OUTCOME, tip_query) + self._applied_settings
+        try:
+            outcome = self._wait(key, lambda driver: driver.execute_script(scripts.APPLY_OUTCOME, tip_query), timeout,
+                                 6, exception=TpLinkSwitchException, message='Outcome of applied settings is not known')
+        except UnexpectedAlertPresentException as error:
+            try:
+                self.webdriver.switch_to.alert.accept()  # alert is left open if web driver doesn't dismiss it
+            except NoAlertPresentException:
+                pass
+            return error.alert_text or ''
+        except DeadlineExceededException:
+            raise
+        except TpLinkSwitchException:
+            return ''
+        return outcome['tip']
+
     def click_element_with_control_key_pressed(self, element: WebElement) -> None:
         """
         Clicks given element with Ctrl key pressed.
@@ -136,52 +555,602 @@ class WebController:
         """
         ActionChains(self.webdriver).key_down(Keys.CONTROL).click(element).key_up(Keys.CONTROL).perform()
 
-    def wait_until_element_is_present(self, method: By, query: str, timeout: int = 4,
-                                      exception=TpLinkSwitchException) -> None:
+    def wait_until_element_is_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
         """
         Waits until given element is present on web page.
         If element wasn't be found on web page an error will be raised.
 
         :param method: used to specify which attribute is used to locate elements on a page
         :param query: key used to locate elements on a page
-        :param timeout: maximum time of waiting
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
         :param exception: exception object raised in case of error
-        :return: None
+        :return: found element
         """
-        try:
-            WebDriverWait(self.webdriver, int(timeout)).until(EC.presence_of_element_located((method, query)))
-        except TimeoutException:
-            raise exception(f'Element identified as "({method}, {query})" not present after {timeout} seconds') \
-                from None
+        return self._remember_element(method, query, lambda: self._wait(
+            (method, query), EC.presence_of_element_located((method, query)), timeout, 4, exception=exception,
+            message=f'Element identified as "({method}, {query})" not present'))
+
+    def wait_until_elements_are_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException) -> List[WebElement]:
+        """
+        Waits until at least one of given elements is present on web page.
+        If no element was found on web page an error will be raised.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: all found elements
+        """
+        return self._wait((method, query), EC.presence_of_all_elements_located((method, query)), timeout, 4,
+                          exception=exception, message=f'Elements identified as "({method}, {query})" not present')
 
-    def wait_until_element_is_visible(self, method: By, query: str, timeout: int = 6,
-                                      exception=TpLinkSwitchException) -> None:
+    def wait_until_element_is_visible(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
         """
         Waits until given element is visible on web page.
         If element wasn't be found on web page an error will be raised.
 
         :param method: used to specify which attribute is used to locate elements on a page
         :param query: key used to locate elements on a page
-        :param timeout: maximum time of waiting
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
         :param exception: exception object raised in case of error
-        :return: None
+        :return: found element
         """
-        try:
-            WebDriverWait(self.webdriver, int(timeout)).until(EC.visibility_of_element_located((method, query)))
-        except TimeoutException:
-            raise exception(f'Element identified as "({method}, {query})" not visible after {timeout} seconds') \
-                from None
+        return self._wait((method, query), EC.visibility_of_element_located((method, query)), timeout, 6,
+                          exception=exception, message=f'Element identified as "({method}, {query})" not visible')
 
-    def wait_until_alert_is_present(self, timeout: int = 4, exception=TpLinkSwitchException) -> None:
+    def wait_until_alert_is_present(self, timeout: Optional[float] = None, exception=TpLinkSwitchException) -> Alert:
         """
         Waits until given alert is present on web page.
         If alert wasn't be found on web page an error will be raised.
 
-        :param timeout: maximum time of waiting
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
         :param exception: exception object raised in case of error
-        :return: None
+        :return: found alert
         """
+        return self._wait('alert', EC.alert_is_present(), timeout, 4, exception=exception,
+                          message='Alert not present')
+
+    def wait_until_script_returns_value(self, script: str, *args: Any, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException, key: Optional[Hashable] = None) -> Any:
+        """
+        Runs given script until it returns value (anything except empty value like null or empty list).
+        If script didn't return value in given time an error will be raised.
+
+        :param script: source of script
+        :param args: arguments of script
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :param key: operation for which timeout is learned (e.g. script with its locator), script by default
+        :return: value returned by script
+        """
+        return self._wait(script if key is None else key, lambda driver: driver.execute_script(script, *args),
+                          timeout, 4, exception=exception, message=f'Script called with {args} returned no value')
+
+    # pylint: disable=too-many-arguments
+    def _wait(self, key: Hashable, condition: Callable[[WebDriver], Any], timeout: Optional[float], default: float,
+              *, exception, message: str) -> Any:
+        if self._page_loaded:  # waits for loading page are learned apart from waits in page loaded before
+            key = (key, 'page loaded')
+        self._page_loaded = False
+        attempts = 2 if timeout is None and self.timeouts.learned(key) else 1  # learned timeout is doubled once
+        if timeout is None:
+            timeout = self.timeouts.timeout(key, default)
+        started = time.monotonic()
+        for attempt in range(1, attempts + 1):
+            remaining_time = self.remaining_time()
+            cut_by_deadline = remaining_time is not None and remaining_time < timeout
+            if cut_by_deadline:
+                self._check_deadline(message)
+            try:
+                result = WebDriverWait(self.webdriver, remaining_time if cut_by_deadline else timeout,
+                                       poll_frequency=self.timeouts.poll_interval(key)).until(condition)
+                break
+            except TimeoutException:
+                if cut_by_deadline:
+                    raise DeadlineExceededException(f'{message}: deadline of operation passed') from None
+                if attempt == attempts:
+                    if attempts > 1:  # switch slowed down, so time of failed wait raises learned timeout
+                        self.timeouts.record(key, time.monotonic() - started)
+                    raise exception(f'{message} after {timeout * attempts:g} seconds') from None
+        self.timeouts.record(key, time.monotonic() - started)
+        return result
+
+    def _remember_element(self, method: By, query: str, locate: Callable[[], WebElement]) -> WebElement:
+        if self._active_frame == '':
+            return locate()
+        key = (self._active_frame, method, query)
+        element = self._elements.get(key)
+        if element is not None:
+            return element
+        element = locate()
+        if not isinstance(element, HtmlElement):  # elements of browserless driver are found without sending commands
+            element = self._elements[key] = _RememberedElement(element, locate)
+        return element
+
+    def _load_page(self, url: str) -> None:
+        remaining_time = self.remaining_time()
+        if remaining_time is None or isinstance(self.webdriver, HtmlDriver):  # its requests have own timeout
+            self.webdriver.get(url)
+            return
+        self._check_deadline(f'Page "{url}" not loaded')
+        self.webdriver.set_page_load_timeout(remaining_time)
         try:
-            WebDriverWait(self.webdriver, int(timeout)).until(EC.alert_is_present())
+            self.webdriver.get(url)
         except TimeoutException:
-            raise exception(f'Alert not present after {timeout} seconds') from None
+            raise DeadlineExceededException(f'Page "{url}" not loaded: deadline of operation passed') from None
+        finally:
+            self.webdriver.set_page_load_timeout(self.page_load_timeout)
+
+    def _activate_window(self) -> None:
+        if self.shared_browser is not None and self.shared_browser.activate(self._current_window):
+            self._active_frame = None  # top level document of window is active after switch
+
+    def _switch_to_window(self, window: str) -> None:
+        if self.shared_browser is not None:
+            self.shared_browser.activate(window)
+        else:
+            self.webdriver.switch_to.window(window)
+        self._current_window = window
+        self._active_frame = None
+
+    def _open_tab_window(self) -> str:
+        if self.shared_browser is not None:
+            window = self.shared_browser.open_window(tab=True)
+        else:
+            self.webdriver.switch_to.new_window('tab')
+            window = self.webdriver.current_window_handle
+        self._current_window = window
+        self._active_frame = None
+        return window
+
+    def _close_tab_windows(self) -> None:
+        main_window = self._tab_windows.pop(None, None)
+        for window in self._tab_windows.values():
+            if self.shared_browser is not None:
+                self.shared_browser.close_window(window)
+            else:
+                self._switch_to_window(window)
+                self.webdriver.close()
+        if main_window is not None:
+            self._switch_to_window(main_window)
+        self._tab_windows = {}
+        self._window_states = {}
+
+    def _change_pages(self) -> None:
+        self._pages_version += 1
+        self._window_version = self._pages_version
+
+    def _check_deadline(self, message: str) -> None:
+        remaining_time = self.remaining_time()
+        if remaining_time is not None and remaining_time <= 0:
+            raise DeadlineExceededException(f'{message}: deadline of operation passed')
+
+    def _find_frames(self) -> Dict[str, WebElement]:
+        try:
+            frames = self.webdriver.execute_script(scripts.FRAMES)
+        except WebDriverException:
+            self._active_frame = ''
+            self.switch_to_default_content()
+            frames = self.webdriver.execute_script(scripts.FRAMES)
+        # top level document was loaded again (frames are remembered one by one, so only remembered ones are compared)
+        if any(frames.get(name) != frame for name, frame in self._frames.items()):
+            self._active_frame = ''
+            self.current_tab = None
+            self.forget_elements()
+        self._frames = frames
+        return frames
+
+    def _try_switch_to_frame(self, frame: WebElement) -> bool:
+        try:
+            self.webdriver.switch_to.frame(frame)
+        except (StaleElementReferenceException, NoSuchFrameException):
+            return False
+        return True
+
+    def _has_valid_session(self) -> bool:
+        return bool(self.webdriver.execute_script(scripts.SESSION_ALIVE, Frame.TOP.value))
+
+    def _confirm_session(self) -> None:
+        self._session_confirmed_at = time.monotonic()
+
+
+class HttpWebController(WebController):
+    """
+    Creates object to control admin web page of switch via plain HTTP requests. Pages are downloaded directly
+    from switch and parsed without web browser, so control fields work the same way as with selenium.
+    """
+
+    def __init__(self, host, username: str, password: str, client: HttpClient = None) -> None:
+        client = client if client is not None else HttpClient(host, username, password)
+        super().__init__(host, username, password, HtmlDriver(client))
+        self.client = client
+
+    def login(self) -> None:
+        """
+        Login user in admin web page of switch by posting logon form.
+
+        :return: None
+        """
+        self.client.login()
+        self.webdriver.get(self.client.base_url)
+        self.forget_loaded_page()
+        self._confirm_session()
+
+    def logout(self) -> None:
+        """
+        Logout user from admin web page of switch.
+
+        :return: None
+        """
+        self.client.logout()
+        self.forget_loaded_page()
+        self._session_confirmed_at = None
+
+    def set_deadline(self, deadline: Optional[float]) -> None:
+        """
+        Sets time until which running operation must end. Requests sent to switch don't last longer.
+
+        :param deadline: time (of time.monotonic()) or None if operation has no deadline
+        :return: None
+        """
+        super().set_deadline(deadline)
+        self.client.deadline = deadline
+
+    def save_state(self) -> Dict[str, Any]:
+        """
+        Returns loaded pages and what is known about them (opened tab, active frame, confirmation of session).
+        Operation interrupted in the middle can be started again from saved state (see AsyncSwitchManager).
+
+        :return: state of controller
+        """
+        session_age = time.monotonic() - self._session_confirmed_at if self._session_confirmed_at is not None else None
+        return {
+            'driver': self.webdriver.save_state(),
+            'current_tab': self.current_tab,
+            'active_frame': self._active_frame,
+            'session_age': session_age,
+            'applied_settings': self._applied_settings,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Loads pages saved by save_state() (without downloading them again). Session is treated as confirmed
+        as long ago as it was when state was saved, so operation started again decides the same way.
+
+        :param state: state returned by save_state()
+        :return: None
+        """
+        self.webdriver.restore_state(state['driver'])
+        self.current_tab = state['current_tab']
+        self._active_frame = state['active_frame']
+        self._frames = {}
+        self.forget_elements()
+        self._session_confirmed_at = time.monotonic() - state['session_age'] \
+            if state['session_age'] is not None else None
+        self._applied_settings = state['applied_settings']
+
+    # pylint: disable=unused-argument
+    def wait_until_element_is_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
+        """
+        Checks if given element is present on web page. Downloaded pages don't change, so there is no need to wait.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: not used (kept for compatibility)
+        :param exception: exception object raised in case of error
+        :return: found element
+        """
+        try:
+            return self.webdriver.find_element(method, query)
+        except NoSuchElementException:
+            raise exception(f'Element identified as "({method}, {query})" not present') from None
+
+    def wait_until_elements_are_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException) -> List[WebElement]:
+        """
+        Checks if any of given elements is present on web page. Downloaded pages don't change,
+        so there is no need to wait.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: not used (kept for compatibility)
+        :param exception: exception object raised in case of error
+        :return: all found elements
+        """
+        elements = self.webdriver.find_elements(method, query)
+        if not elements:
+            raise exception(f'Elements identified as "({method}, {query})" not present')
+        return elements
+
+    def wait_until_element_is_visible(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
+        """
+        Checks if given element is visible on web page. Downloaded pages don't change, so there is no need to wait.
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: not used (kept for compatibility)
+        :param exception: exception object raised in case of error
+        :return: found element
+        """
+        try:
+            element = self.webdriver.find_element(method, query)
+        except NoSuchElementException:
+            element = None
+        if element is None or not element.is_displayed():
+            raise exception(f'Element identified as "({method}, {query})" not visible')
+        return element
+
+    def wait_until_alert_is_present(self, timeout: Optional[float] = None, exception=TpLinkSwitchException) -> Alert:
+        """
+        Checks if alert is present on web page.
+
+        :param timeout: not used (kept for compatibility)
+        :param exception: exception object raised in case of error
+        :return: found alert
+        """
+        try:
+            return self.webdriver.switch_to.alert
+        except NoAlertPresentException:
+            raise exception('Alert not present') from None
+
+    def wait_until_script_returns_value(self, script: str, *args: Any, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException, key: Optional[Hashable] = None) -> Any:
+        """
+        Runs given script once. Downloaded pages don't change, so there is no need to wait.
+
+        :param script: source of script
+        :param args: arguments of script
+        :param timeout: not used (kept for compatibility)
+        :param exception: exception object raised in case of error
+        :param key: not used (kept for compatibility)
+        :return: value returned by script
+        """
+        value = self.webdriver.execute_script(script, *args)
+        if not value:
+            raise exception(f'Script called with {args} returned no value')
+        return value
+
+    def _has_valid_session(self) -> bool:
+        return self.client.is_logged_in()
+
+
+class HybridWebController(WebController):
+    """
+    Creates object to control admin web page of switch via web browser and plain HTTP at once. User is logged in
+    via web browser and its session is shared with HTTP client. Methods which only read settings are run over
+    plain HTTP, methods which change configuration are run in web browser.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, host, username: str, password: str, webdriver: WebDriver, client: HttpClient = None, *,
+                 shared_browser: Optional[SharedBrowser] = None) -> None:
+        self.reader = HttpWebController(host, username, password, client=client)
+        super().__init__(host, username, password, webdriver, shared_browser=shared_browser)
+
+    @property
+    def webdriver(self) -> Union[WebDriver, HtmlDriver]:
+        """
+        Returns driver of web browser or browserless driver if read only operation is in progress.
+
+        :return: driver
+        """
+        return self.reader.webdriver if self._is_reading() else self._browser
+
+    @webdriver.setter
+    def webdriver(self, webdriver: WebDriver) -> None:
+        self._browser = webdriver
+
+    @property
+    def current_tab(self) -> Optional[Tuple[str, str]]:
+        """
+        Returns section and tab shown in main frame of web browser or of browserless driver
+        if read only operation is in progress.
+
+        :return: section and tab or None if it's unknown
+        """
+        return self.reader.current_tab if self._is_reading() else self._browser_tab
+
+    @current_tab.setter
+    def current_tab(self, tab: Optional[Tuple[str, str]]) -> None:
+        if self._is_reading():
+            self.reader.current_tab = tab
+        else:
+            self._browser_tab = tab
+
+    @_in_own_window
+    def login(self) -> None:
+        """
+        Login user in admin web page of switch via web browser and passes its session to HTTP client.
+
+        :raises LoginException: if session of web browser is not accepted by switch
+        :return: None
+        """
+        self._operations, operations = [], self._operations
+        try:
+            super().login()
+        finally:
+            self._operations = operations
+        self._share_session()
+
+    @_in_own_window
+    def adopt_session(self, cookies: List[Dict[str, Any]]) -> bool:
+        """
+        Loads admin web page in web browser with cookies of session exported by other process
+        and passes session to HTTP client.
+
+        :param cookies: cookies returned by export_session()
+        :raises LoginException: if switch is not reachable or session of web browser is not accepted by switch
+        :return: True if switch still accepts session, otherwise False (user has to login)
+        """
+        self._operations, operations = [], self._operations
+        try:
+            adopted = super().adopt_session(cookies)
+        finally:
+            self._operations = operations
+        if adopted:
+            self._share_session()
+        return adopted
+
+    def end_operation(self, failed: bool = False) -> None:
+        """
+        Marks end of control field method. Pages downloaded over HTTP are outdated after configuration
+        was changed in web browser, so they are downloaded again by next read only operation.
+
+        :param failed: True if method raised an exception
+        :return: None
+        """
+        if self._operations == [False]:
+            self.reader.current_tab = None
+        super().end_operation(failed)
+
+    def set_deadline(self, deadline: Optional[float]) -> None:
+        """
+        Sets time until which running operation must end in web browser and in HTTP client.
+
+        :param deadline: time (of time.monotonic()) or None if operation has no deadline
+        :return: None
+        """
+        super().set_deadline(deadline)
+        self.reader.set_deadline(deadline)
+
+    def quit(self, browser: bool = True) -> None:
+        """
+        Quits web browser and closes HTTP connection.
+
+        :param browser: if False web browser is left running (e.g. to return it to browser pool)
+        :return: None
+        """
+        super().quit(browser)
+        self.reader.quit()
+
+    def wait_until_element_is_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
+        """
+        Waits until given element is present on web page (checks it at once if page was downloaded over HTTP).
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: found element
+        """
+        controller = self.reader if self._is_reading() else super()
+        return controller.wait_until_element_is_present(method, query, timeout, exception)
+
+    def wait_until_elements_are_present(self, method: By, query: str, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException) -> List[WebElement]:
+        """
+        Waits until any of given elements is present on web page (checks it at once if page was downloaded
+        over HTTP).
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: all found elements
+        """
+        controller = self.reader if self._is_reading() else super()
+        return controller.wait_until_elements_are_present(method, query, timeout, exception)
+
+    def wait_until_element_is_visible(self, method: By, query: str, timeout: Optional[float] = None,
+                                      exception=TpLinkSwitchException) -> WebElement:
+        """
+        Waits until given element is visible on web page (checks it at once if page was downloaded over HTTP).
+
+        :param method: used to specify which attribute is used to locate elements on a page
+        :param query: key used to locate elements on a page
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: found element
+        """
+        controller = self.reader if self._is_reading() else super()
+        return controller.wait_until_element_is_visible(method, query, timeout, exception)
+
+    def wait_until_alert_is_present(self, timeout: Optional[float] = None, exception=TpLinkSwitchException) -> Alert:
+        """
+        Waits until given alert is present on web page (checks it at once if page was downloaded over HTTP).
+
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :return: found alert
+        """
+        controller = self.reader if self._is_reading() else super()
+        return controller.wait_until_alert_is_present(timeout, exception)
+
+    def wait_until_script_returns_value(self, script: str, *args: Any, timeout: Optional[float] = None,
+                                        exception=TpLinkSwitchException, key: Optional[Hashable] = None) -> Any:
+        """
+        Runs given script until it returns value (runs it once if page was downloaded over HTTP).
+
+        :param script: source of script
+        :param args: arguments of script
+        :param timeout: maximum time of waiting in seconds (learned from latency of switch by default)
+        :param exception: exception object raised in case of error
+        :param key: operation for which timeout is learned, script by default
+        :return: value returned by script
+        """
+        controller = self.reader if self._is_reading() else super()
+        return controller.wait_until_script_returns_value(script, *args, timeout=timeout, exception=exception, key=key)
+
+    def is_logged_in(self) -> bool:
+        """
+        Checks if client is authenticated (in session of HTTP client if read only operation is in progress).
+
+        :return: True if it is, otherwise False
+        """
+        return self.reader.is_logged_in() if self._is_reading() else super().is_logged_in()
+
+    def use_tab_window(self, tab: Tuple[str, str]) -> None:
+        """
+        Activates window of web browser in which given tab is opened. Nothing is done if read only operation
+        is in progress (pages are downloaded over HTTP then).
+
+        :param tab: section and tab from menu (e.g. ('Monitoring', 'Port Statistics'))
+        :return: None
+        """
+        if not self._is_reading():
+            super().use_tab_window(tab)
+
+    def switch_to_frame(self, frame_name: Frame) -> None:
+        """
+        Changes current frame of web browser or of browserless driver if read only operation is in progress.
+
+        :param frame_name: name of frame
+        :return: None
+        """
+        if self._is_reading():
+            self.reader.switch_to_frame(frame_name)
+        else:
+            super().switch_to_frame(frame_name)
+
+    def switch_to_default_content(self) -> None:
+        """
+        Switches to default content of page in web browser or in browserless driver
+        if read only operation is in progress.
+
+        :return: None
+        """
+        if self._is_reading():
+            self.reader.switch_to_default_content()
+        else:
+            super().switch_to_default_content()
+
+    def _is_reading(self) -> bool:
+        return bool(self._operations) and self._operations[0]
+
+    def _has_valid_session(self) -> bool:
+        return self.reader.client.is_logged_in()
+
+    def _share_session(self) -> None:
+        for cookie in self._browser.get_cookies():
+            self.reader.client.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                                   path=cookie.get('path', '/'))
+        self.reader.webdriver.get(self.reader.client.base_url)
+        self.reader.forget_loaded_page()
+        if not self.reader.is_logged_in():
+            raise LoginException(f'Session of web browser is not accepted by {self.host}.')
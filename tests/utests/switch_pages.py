@@ -0,0 +1,363 @@
+import asyncio
+import os
+import sys
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.http_client import HttpClient
+
+
+INDEX = """
+<html><head><title>TL-SG108PE</title></head>
+<frameset rows="90,*">
+  <frame name="topFrame" src="top.htm">
+  <frameset cols="200,*">
+    <frame name="bottomLeftFrame" src="menu.htm">
+    <frame name="mainFrame" src="SystemInfoRpm.htm">
+  </frameset>
+</frameset>
+</html>
+"""
+
+LOGON = """
+<html><body>
+<form name="logon" action="logon.cgi" method="post">
+  <input type="text" id="username" name="username">
+  <input type="password" id="password" name="password">
+  <input type="hidden" name="cpassword" value="">
+  <input type="submit" id="logon" name="logon" value="Login">
+</form>
+</body></html>
+"""
+
+LOGON_REDIRECT = '<html><head><script type="text/javascript">top.location.href = "/";</script></head><body></body></html>'
+
+TOP = '<html><body><div id="logo">TL-SG108PE</div></body></html>'
+
+MENU = """
+<html><body>
+<ul id="menu">
+  <li><a class="menulink" href="#">System</a>
+    <ul>
+      <li><a href="SystemInfoRpm.htm" target="mainFrame">System Info</a></li>
+      <li><a href="IpSettingRpm.htm" target="mainFrame">IP Setting</a></li>
+    </ul>
+  </li>
+  <li><a class="menulink" href="#">Switching</a>
+    <ul>
+      <li><a href="PortSettingRpm.htm" target="mainFrame">Port Setting</a></li>
+    </ul>
+  </li>
+  <li><a class="menulink" href="#">Monitoring</a>
+    <ul style="display: none">
+      <li><a href="javascript:void(0)">Port Statistics</a></li>
+    </ul>
+  </li>
+  <li><a class="menulink" href="#">VLAN</a>
+    <ul>
+      <li><a href="VlanPortBasicRpm.htm" target="mainFrame">Port Based VLAN</a></li>
+      <li><a href="Vlan8021QRpm.htm" target="mainFrame">802.1Q VLAN</a></li>
+    </ul>
+  </li>
+</ul>
+<div id="logout"><a class="menulink" href="Logout.htm" target="_top"
+  onclick="return confirm('Do you want to logout?')">Logout</a></div>
+</body></html>
+"""
+
+TIP = '<span id="sp_tip_svr"><span class="TIP_CONTENT">{}</span></span>'
+
+
+def system_info_page(description: str = 'TL-SG108PE', tip: str = '') -> str:
+    return f"""
+<html><head><script type="text/javascript">
+var info_ds = {{
+descriStr:["{description}"],
+macStr:["E4:C3:2A:BD:FF:F0"],
+ipStr:["192.168.1.42"],
+netmaskStr:["255.255.255.0"],
+gatewayStr:["192.168.1.1"],
+firmwareStr:["1.0.0 Build 20200415 Rel.54962"],
+hardwareStr:["TL-SG108PE 3.0"]
+}};
+</script></head><body>
+<table>
+  <tr><td>Device Description</td><td><span id="sp_devicetype"></span></td></tr>
+  <tr><td>MAC Address</td><td><span id="sp_macaddress"></span></td></tr>
+  <tr><td>IP Address</td><td><span id="sp_ipaddress"></span></td></tr>
+  <tr><td>Subnet Mask</td><td><span id="sp_netmask"></span></td></tr>
+  <tr><td>Default Gateway</td><td><span id="sp_gateway"></span></td></tr>
+  <tr><td>Firmware Version</td><td><span id="sp_firewareversion"></span></td></tr>
+  <tr><td>Hardware Version</td><td><span id="sp_hardwareversion"></span></td></tr>
+</table>
+<form name="system_info" action="system_name_set.cgi">
+  <input type="text" id="tDevDscr" name="sysName">
+  <input type="button" id="btApply" name="btApply" value="Apply">
+</form>
+{TIP.format(tip) if tip else ''}
+</body></html>
+"""
+
+
+def ip_setting_page(tip: str = '') -> str:
+    return """
+<html><head><script type="text/javascript">
+var ip_ds = {
+state:0,
+vlan:1,
+maxVlan:4094,
+ipStr:["192.168.1.42"],
+netmaskStr:["255.255.255.0"],
+gatewayStr:["192.168.1.1"]
+};
+</script></head><body>
+<form name="ip_setting" action="ip_setting.cgi">
+  <select id="check_dhcp" name="dhcpSetting">
+    <option value="enable">Enable</option>
+    <option value="disable">Disable</option>
+  </select>
+  <input type="text" id="txt_addr" name="ip_address">
+  <input type="text" id="txt_mask" name="ip_netmask">
+  <input type="text" id="txt_gateway" name="ip_gateway">
+  <table><tr><td class="BTN_WRAPPER"><a><input type="button" name="submit" value="Apply"
+    onclick="return confirm('Change IP address?')"></a></td></tr></table>
+</form>
+""" + (TIP.format(tip) if tip else '') + """
+</body></html>
+"""
+
+
+PORT_MIRROR = """
+<html><head><script type="text/javascript">
+var MirrEn = 1;
+var MirrPort = 8;
+var mirr_info = {
+ingress:[1,1,0,0,0,0,0,0],
+egress:[0,1,0,0,0,0,0,0]
+};
+var max_port_num = 8;
+</script></head><body>
+<form name="mirror_enabled_set" action="mirror_enabled_set.cgi"></form>
+<form name="mirrored_port_set" action="mirrored_port_set.cgi"><table class="BORDER"><tbody></tbody></table></form>
+</body></html>
+"""
+
+
+PORT_TRUNK = """
+<html><head><script type="text/javascript">
+var trunk_conf = {
+maxTrunkNum:2,
+portNum:8,
+portStr_g1:[1,1,0,0,0,0,0,0],
+portStr_g2:[0,0,0,0,0,0,0,0]
+};
+</script></head><body>
+<form name="port_trunk_display"><table class="BORDER"><tbody></tbody></table></form>
+</body></html>
+"""
+
+
+QOS_BASIC = """
+<html><head><script type="text/javascript">
+var qosMode = 0;
+var portNumber = 8;
+var pPri = [0,0,3,3,1,1,2,0];
+</script></head><body>
+<form name="qos_port_priority_set" action="qos_port_priority_set.cgi"><table><tbody></tbody></table></form>
+</body></html>
+"""
+
+
+CONTROLS = """
+<html><head><script type="text/javascript">
+function applyMode(form) {
+    if (!confirm("Change mode?")) { return false; }
+    form.submit();
+}
+</script></head><body>
+<form name="controls" action="controls.cgi">
+  <input type="checkbox" id="chk_1" name="port" value="1" checked>
+  <input type="checkbox" id="chk_2" name="port" value="2">
+  <input type="radio" id="rd_on" name="mode" value="on" checked>
+  <input type="radio" id="rd_off" name="mode" value="off">
+  <select id="sel_single" name="single">
+    <option value="1">One</option>
+    <option value="2">Two</option>
+  </select>
+  <select id="sel_multiple" name="multiple" multiple>
+    <option value="1" selected>Port 1</option>
+    <option value="2">Port 2</option>
+    <option value="3" disabled>Port 3</option>
+  </select>
+  <textarea id="txt_note" name="note">old</textarea>
+  <input type="button" id="bt_apply" name="apply" value="Apply" onclick="return applyMode(this.form)">
+</form>
+</body></html>
+"""
+
+
+PORT_SETTING = """
+<html><head><script type="text/javascript">
+var max_port_num = 8;
+var all_info = {
+state:[1,1,1,1,1,1,0,1,0,0],
+trunk_info:[0,0,0,0,0,0,0,0,0,0],
+spd_cfg:[1,1,1,1,1,1,1,5,0,0],
+spd_act:[6,0,0,0,0,0,0,5,0,0],
+fc_cfg:[0,0,0,0,0,0,0,1,0,0],
+fc_act:[0,0,0,0,0,0,0,1,0,0]
+};
+</script></head><body>
+<form name="port_setting" action="port_setting.cgi"><table class="BORDER"><tbody></tbody></table></form>
+</body></html>
+"""
+
+
+PORT_BASED_VLAN = """
+<html><head><script type="text/javascript">
+var pvlan_ds = {
+state:1,
+portNum:8,
+vids:[1,2,0,0],
+mbrs:[0xFC,0x03,0,0],
+count:2
+};
+</script></head><body>
+<input type="radio" id="pvlan_en" name="pvlan_mode" checked><input type="radio" id="pvlan_dis" name="pvlan_mode">
+</body></html>
+"""
+
+
+IEEE_802_1Q_VLAN = """
+<html><head><script type="text/javascript">
+var qvlan_ds = {
+state:1,
+portNum:8,
+vids:[1,10],
+count:2,
+maxVids:32,
+names:['Default_VLAN','cameras'],
+tagMbrs:[0x0,0x4],
+untagMbrs:[0xFF,0xA]
+};
+</script></head><body>
+<input type="radio" id="qvlan_en" name="qvlan_mode" checked><input type="radio" id="qvlan_dis" name="qvlan_mode">
+</body></html>
+"""
+
+
+def port_statistics_page(packets: int = 0) -> str:
+    pkts = ','.join(f'{packets + port},0,{packets + 10 * port},{port % 2}' for port in range(1, 9))
+    return f"""
+<html><head><script type="text/javascript">
+var all_info = {{
+state:[1,1,1,1,1,1,1,1,0,0],
+link_status:[6,0,0,0,0,0,0,0,0,0],
+pkts:[{pkts},0,0,0,0,0,0,0,0]
+}};
+var max_port_num = 8;
+</script></head><body>
+<form name="port_statistics" action="port_statistics_set.cgi">
+<table class="BORDER"><tbody>
+  <tr class="TD_FIRST_ROW"><td class="TABLE_HEAD_BOTTOM">Port</td><td class="TABLE_HEAD_BOTTOM">Status</td></tr>
+</tbody></table>
+<table><tr><td class="BTN_WRAPPER"><a><input type="button" name="refresh" value="Refresh"></a></td></tr></table>
+</form>
+</body></html>
+"""
+
+
+class FakeHttpClient(HttpClient):
+    """HTTP client serving static pages instead of pages downloaded from switch."""
+
+    CREDENTIALS = ('admin', 'admin')
+    SESSION_COOKIE = ('SESSIONID', 'f4k3s3ss10n')
+
+    def __init__(self, host: str = '192.168.1.42', username: str = 'admin', password: str = 'admin',
+                 timeout: float = 4, shared_session: bool = False) -> None:
+        super().__init__(host, username, password, timeout)
+        self.logged_in = False
+        self.shared_session = shared_session  # session cookie set by other client (e.g. web browser) is accepted
+        self.requests = []
+        self.packets = 0
+        self.description = 'TL-SG108PE'
+        self.description_tip = 'Operation successful.'  # tip shown after description was submitted
+
+    def request(self, method, url, data=None):
+        path = urlsplit(url).path.lstrip('/')
+        query = urlsplit(url).query
+        self.requests.append((method, path, query, data))
+        if self.shared_session and self.session.cookies.get(self.SESSION_COOKIE[0]) == self.SESSION_COOKIE[1]:
+            self.logged_in = True
+        if path == 'logon.cgi':
+            credentials = tuple(value[0] if isinstance(value, list) else value
+                                for value in (data['username'], data['password']))
+            self.logged_in = credentials == self.CREDENTIALS
+            if self.logged_in:
+                self.session.cookies.set(*self.SESSION_COOKIE)
+        if path == 'Logout.htm':
+            self.logged_in = False
+            self.session.cookies.clear()
+        if path == 'port_statistics_set.cgi':
+            self.packets += 100
+            path = 'PortStatisticsRpm.htm'
+        if not self.logged_in:
+            return self.url(''), LOGON
+        tip = ''
+        if path == 'system_name_set.cgi':
+            if self.description_tip == 'Operation successful.':
+                self.description = parse_qs(query)['sysName'][0]
+            path, tip = 'SystemInfoRpm.htm', self.description_tip
+        if path == 'ip_setting.cgi':
+            path, tip = 'IpSettingRpm.htm', 'Operation successful.'
+        pages = {
+            '': INDEX,
+            'logon.cgi': LOGON_REDIRECT,
+            'top.htm': TOP,
+            'menu.htm': MENU,
+            'SystemInfoRpm.htm': system_info_page(self.description, tip),
+            'Controls.htm': CONTROLS,
+            'IpSettingRpm.htm': ip_setting_page(tip),
+            'PortStatisticsRpm.htm': port_statistics_page(self.packets),
+            'PortSettingRpm.htm': PORT_SETTING,
+            'PortTrunkRpm.htm': PORT_TRUNK,
+            'PortMirrorRpm.htm': PORT_MIRROR,
+            'QosBasicRpm.htm': QOS_BASIC,
+            'VlanPortBasicRpm.htm': PORT_BASED_VLAN,
+            'Vlan8021QRpm.htm': IEEE_802_1Q_VLAN,
+        }
+        return self.url(path), pages.get(path, '<html><body></body></html>')
+
+
+class FakeAsyncHttpClient:
+    """Non-blocking HTTP client serving static pages instead of pages downloaded from switch."""
+
+    def __init__(self, host: str = '192.168.1.42', delay: float = 0) -> None:
+        self.pages = FakeHttpClient(host)
+        self.delay = delay
+        self.closed = False
+
+    async def request(self, method, url, data=None):
+        await asyncio.sleep(self.delay)
+        return self.pages.request(method, url, data)
+
+    async def close(self):
+        self.closed = True
+
+
+def windowed_webdriver() -> Mock:
+    """Returns mock of web driver which opens windows."""
+    webdriver = Mock(current_window_handle='window-1', window_handles=['window-1'])
+
+    def new_window(kind):
+        webdriver.current_window_handle = f'window-{len(webdriver.window_handles) + 1}'
+        webdriver.window_handles.append(webdriver.current_window_handle)
+
+    def switch_to_window(window):
+        webdriver.current_window_handle = window
+
+    webdriver.switch_to.new_window.side_effect = new_window
+    webdriver.switch_to.window.side_effect = switch_to_window
+    return webdriver
@@ -0,0 +1,138 @@
+import os
+import sys
+import time
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.async_switch_manager import AsyncSwitchManager
+from switch_TL_SG108PE.exceptions import (LoginException, SwitchManagerNotConnectedException,
+                                          DeadlineExceededException)
+from switch_TL_SG108PE.html_driver import HtmlDriver
+from switch_TL_SG108PE.web_controller import HttpWebController
+from switch_TL_SG108PE.control_fields.monitoring import MonitoringControlField
+from tests.utests.switch_pages import FakeHttpClient, FakeAsyncHttpClient
+
+
+class TestAsyncSwitchManager(unittest.TestCase):
+
+    @staticmethod
+    async def _connect(client, password='admin'):
+        switch_manager = AsyncSwitchManager()
+        await switch_manager.connect(client.pages.host, 'admin', password, client=client)
+        return switch_manager
+
+    def test_system_info(self):
+        async def scenario():
+            switch_manager = await self._connect(FakeAsyncHttpClient())
+            system_info = await switch_manager.control('system').system_info()
+            await switch_manager.disconnect()
+            return system_info
+
+        system_info = asyncio.run(scenario())
+        self.assertEqual(system_info['MAC Address'], 'E4:C3:2A:BD:FF:F0')
+        self.assertEqual(system_info['Hardware Version'], 'TL-SG108PE 3.0')
+
+    def test_requests_are_not_repeated(self):
+        client = FakeAsyncHttpClient()
+
+        async def scenario():
+            switch_manager = await self._connect(client)
+            client.pages.requests.clear()
+            return await switch_manager.control('monitoring').port_statistics(refresh=True)
+
+        port_statistics = asyncio.run(scenario())
+        self.assertEqual(port_statistics['Port 2']['TxGoodPkt'], '102')
+        sync_client = FakeHttpClient()
+        web_controller = HttpWebController(sync_client.host, 'admin', 'admin', client=sync_client)
+        web_controller.login()
+        sync_client.requests.clear()
+        MonitoringControlField(web_controller).port_statistics(refresh=True)
+        self.assertEqual(client.pages.requests, sync_client.requests)
+
+    def test_many_switches_in_one_event_loop(self):
+        clients = [FakeAsyncHttpClient(host=f'192.168.1.{i}', delay=0.05) for i in range(1, 51)]
+
+        async def scenario():
+            switch_managers = await asyncio.gather(*(self._connect(client) for client in clients))
+            return await asyncio.gather(*(m.control('system').system_info() for m in switch_managers))
+
+        start = time.perf_counter()
+        results = asyncio.run(scenario())
+        self.assertEqual(len(results), 50)
+        self.assertLess(time.perf_counter() - start, 2)
+
+    def test_pages_are_parsed_once_outside_event_loop(self):
+        client = FakeAsyncHttpClient()
+        threads = []
+        parse = HtmlDriver.parse
+
+        def parse_in_thread(content):
+            threads.append(threading.current_thread())
+            return parse(content)
+
+        async def scenario():
+            switch_manager = await self._connect(client)
+            return await switch_manager.control('monitoring').port_statistics(refresh=True)
+
+        with patch.object(HtmlDriver, 'parse', side_effect=parse_in_thread):
+            asyncio.run(scenario())
+        self.assertLessEqual(len(threads), len(client.pages.requests))
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_opened_tab_and_session_are_reused(self):
+        client = FakeAsyncHttpClient()
+
+        async def scenario():
+            switch_manager = await self._connect(client)
+            system = switch_manager.control('system')
+            await system.system_info()
+            requests = len(client.pages.requests)
+            system_info = await system.system_info()
+            return system_info, len(client.pages.requests) - requests
+
+        system_info, requests = asyncio.run(scenario())
+        self.assertEqual(system_info['Device Description'], 'TL-SG108PE')
+        self.assertEqual(requests, 0)
+
+    def test_deadline_covers_whole_call(self):
+        client = FakeAsyncHttpClient()
+
+        async def scenario():
+            switch_manager = await self._connect(client)
+            client.delay = 0.1
+            started = time.monotonic()
+            with self.assertRaises(DeadlineExceededException):
+                await switch_manager.control('monitoring').port_statistics(refresh=True, deadline=0.15)
+            return time.monotonic() - started
+
+        self.assertLess(asyncio.run(scenario()), 0.3)
+
+    def test_slow_request_is_cut_by_deadline(self):
+        client = FakeAsyncHttpClient()
+
+        async def scenario():
+            switch_manager = await self._connect(client)
+            client.delay = 5
+            started = time.monotonic()
+            with self.assertRaises(DeadlineExceededException):
+                await switch_manager.control('system').ip_settings(deadline=0.1)
+            return time.monotonic() - started
+
+        self.assertLess(asyncio.run(scenario()), 1)
+
+    def test_login_with_wrong_credentials(self):
+        self.assertRaises(LoginException, lambda: asyncio.run(self._connect(FakeAsyncHttpClient(), password='x')))
+
+    def test_not_connected(self):
+        self.assertRaises(SwitchManagerNotConnectedException, lambda: AsyncSwitchManager().control('system'))
+
+    def test_unknown_method(self):
+        async def scenario():
+            switch_manager = await self._connect(FakeAsyncHttpClient())
+            return switch_manager.control('system').no_such_method
+
+        self.assertRaises(AttributeError, lambda: asyncio.run(scenario()))
@@ -0,0 +1,208 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from selenium.common.exceptions import WebDriverException
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.browser import (BrowserPool, SharedBrowser, SharedService, chrome_options, start_chrome,
+                                       BLOCKED_URLS, LEAN_ARGUMENTS)
+from switch_TL_SG108PE.html_driver import HtmlDriver
+from switch_TL_SG108PE.exceptions import BrowserPoolException
+from tests.utests.switch_pages import FakeHttpClient, windowed_webdriver
+
+
+class TestBrowserProfile(unittest.TestCase):
+
+    def test_lean_options(self):
+        options = chrome_options()
+        self.assertEqual(options.page_load_strategy, 'eager')
+        self.assertIn('--headless', options.arguments)
+        self.assertTrue(set(LEAN_ARGUMENTS) <= set(options.arguments))
+        self.assertEqual(options.experimental_options['prefs'], {'profile.managed_default_content_settings.images': 2})
+
+    def test_stock_options(self):
+        options = chrome_options(headless=False, lean=False)
+        self.assertEqual(options.page_load_strategy, 'normal')
+        self.assertEqual(options.arguments, [])
+        self.assertNotIn('prefs', options.experimental_options)
+
+    def test_lean_browser_blocks_subresources(self):
+        with patch('switch_TL_SG108PE.browser.wd.Chrome', Mock()) as chrome:
+            webdriver = start_chrome()
+        self.assertEqual(chrome.call_args.kwargs['options'].page_load_strategy, 'eager')
+        webdriver.execute_cdp_cmd.assert_called_with('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+
+    def test_stock_browser_loads_subresources(self):
+        with patch('switch_TL_SG108PE.browser.wd.Chrome', Mock()):
+            webdriver = start_chrome(lean=False)
+        webdriver.execute_cdp_cmd.assert_not_called()
+
+    def test_browsers_share_chromedriver(self):
+        with patch('switch_TL_SG108PE.browser.wd.Chrome', Mock()) as chrome:
+            start_chrome()
+            start_chrome(lean=False)
+        services = [call.kwargs['service'] for call in chrome.call_args_list]
+        self.assertIs(services[0], services[1])
+        self.assertIs(services[0], SharedService.instance())
+
+
+class TestSharedService(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.processes = []
+        self.service = SharedService(executable_path='chromedriver')
+        patcher = patch.object(SharedService, '_start_process', self._start_process)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(SharedService, 'is_connectable', Mock(return_value=True))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _start_process(self, path):
+        self.service.process = Mock(poll=Mock(return_value=None))
+        self.processes.append(self.service.process)
+
+    def test_chromedriver_is_started_once(self):
+        self.service.start()
+        self.service.start()
+        self.service.stop()  # called by quitting browser
+        self.service.start()
+        self.assertEqual(len(self.processes), 1)
+        self.processes[0].terminate.assert_not_called()
+
+    def test_crashed_chromedriver_is_started_again(self):
+        self.service.start()
+        self.processes[0].poll.return_value = -11
+        self.service.start()
+        self.assertEqual(len(self.processes), 2)
+        self.assertEqual(self.service.restarts, 1)
+
+    def test_shutdown_stops_chromedriver(self):
+        self.service.start()
+        self.service.shutdown()
+        self.processes[0].terminate.assert_called_once_with()
+
+
+class TestBrowserPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.started = []
+        self.pool = BrowserPool(size=2, factory=self._start_browser)
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def _start_browser(self):
+        webdriver = Mock()
+        self.started.append(webdriver)
+        return webdriver
+
+    def _wait_for(self, condition, timeout: float = 2) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_browsers_are_started_in_advance(self):
+        self.pool.start()
+        self._wait_for(lambda: len(self.pool._idle) == 2)
+        webdriver = self.pool.lease()
+        self.assertIn(webdriver, self.started)
+        self._wait_for(lambda: len(self.pool._idle) == 2)
+        self.assertEqual(len(self.started), 3)
+
+    def test_released_browser_is_cleared_and_leased_again(self):
+        self.pool.size = 1
+        self.pool.start()
+        self._wait_for(lambda: len(self.pool._idle) == 1)
+        webdriver = self.pool.lease()
+        self._wait_for(lambda: len(self.pool._idle) == 1)
+        self.pool._idle.clear()  # makes room for released browser in full pool
+        self.pool.release(webdriver)
+        webdriver.delete_all_cookies.assert_called_once_with()
+        webdriver.get.assert_called_once_with('about:blank')
+        webdriver.quit.assert_not_called()
+        self.assertIs(self.pool.lease(), webdriver)
+
+    def test_browser_released_to_full_pool_is_quit(self):
+        self.pool.start()
+        webdriver = self.pool.lease()
+        self._wait_for(lambda: len(self.pool._idle) == 2)
+        self.pool.release(webdriver)
+        webdriver.quit.assert_called_once_with()
+
+    def test_broken_browser_is_quit(self):
+        self.pool.start()
+        webdriver = self.pool.lease()
+        webdriver.get.side_effect = WebDriverException('chrome not reachable')
+        self.pool.release(webdriver)
+        webdriver.quit.assert_called_once_with()
+        self.assertNotIn(webdriver, self.pool._idle)
+
+    def test_close_quits_started_browsers(self):
+        self.pool.start()
+        self._wait_for(lambda: len(self.pool._idle) == 2)
+        self.pool.close()
+        for webdriver in self.started:
+            webdriver.quit.assert_called_once_with()
+        self.assertRaises(BrowserPoolException, self.pool.lease)
+
+    def test_switch_manager_leases_and_returns_browser(self):
+        client = FakeHttpClient()
+        self.pool.factory = lambda: HtmlDriver(client)
+        self.pool.size = 1
+        self.pool.start()
+        self._wait_for(lambda: len(self.pool._idle) == 1)
+        webdriver = self.pool._idle[0]
+        switch_manager = SwitchManager()
+        switch_manager.connect('192.168.1.42', 'admin', 'admin', browser_pool=self.pool)
+        self.assertIs(switch_manager._web_controller.webdriver, webdriver)
+        self.assertEqual(switch_manager.control('system').system_info()['Device Description'], 'TL-SG108PE')
+        self._wait_for(lambda: len(self.pool._idle) == 1)
+        self.pool._idle.clear()  # makes room for released browser in full pool
+        switch_manager.disconnect()
+        self.assertEqual(self.pool._idle, [webdriver])
+        self.assertEqual(webdriver.get_cookies(), [])
+        self.assertEqual(webdriver.current_url, '')
+
+
+class TestSharedBrowser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.webdriver = windowed_webdriver()
+        self.browser = SharedBrowser(self.webdriver)
+
+    def test_each_user_gets_own_window(self):
+        self.assertEqual(self.browser.open_window(), 'window-1')
+        self.assertEqual(self.browser.open_window(), 'window-2')
+        self.webdriver.switch_to.new_window.assert_called_once_with('window')
+
+    def test_tab_does_not_take_spare_window(self):
+        self.assertEqual(self.browser.open_window(tab=True), 'window-2')
+        self.webdriver.switch_to.new_window.assert_called_once_with('tab')
+        self.assertFalse(self.browser.activate('window-2'))
+        self.assertEqual(self.browser.open_window(), 'window-1')
+
+    def test_window_is_activated_only_if_other_one_is_current(self):
+        first, second = self.browser.open_window(), self.browser.open_window()
+        self.assertFalse(self.browser.activate(second))
+        self.assertTrue(self.browser.activate(first))
+        self.assertFalse(self.browser.activate(first))
+        self.webdriver.switch_to.window.assert_called_once_with(first)
+
+    def test_last_window_is_left_open(self):
+        first, second = self.browser.open_window(), self.browser.open_window()
+        self.browser.close_window(first)
+        self.webdriver.close.assert_called_once_with()
+        self.browser.close_window(second)
+        self.webdriver.close.assert_called_once_with()
+        self.webdriver.get.assert_called_once_with('about:blank')
+        self.assertEqual(self.browser.open_window(), second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.easy_smart import EasySmartClient, EasySmartStandIn, StandInSwitch, discover, protocol
+from switch_TL_SG108PE.easy_smart.protocol import Field, OpCode, Packet
+from switch_TL_SG108PE.exceptions import LoginException, QoSModeException, EasySmartProtocolException
+from switch_TL_SG108PE.utils import decode_ports_mask, encode_ports_mask
+
+
+class TestProtocol(unittest.TestCase):
+
+    def test_encode_and_decode(self):
+        packet = Packet(OpCode.GET, b'\x01' * 6, b'\x02' * 6, 7, token_id=9,
+                        records=[(Field.IP_ADDRESS, b''), (Field.PORT_SETTINGS, b'\x01\x02')])
+        datagram = protocol.encode(packet)
+        self.assertNotIn(b'\x01\x01\x01\x01\x01\x01', datagram)
+        self.assertEqual(protocol.decode(datagram), packet)
+
+    def test_decode_malformed_datagram(self):
+        self.assertRaises(EasySmartProtocolException, lambda: protocol.decode(protocol.rc4(b'\x01\x04')))
+
+    def test_ports_mask(self):
+        self.assertEqual(decode_ports_mask(0b10000101), [1, 3, 8])
+        self.assertEqual(encode_ports_mask([1, 3, 8]), 0b10000101)
+
+
+class TestEasySmartBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.stand_in = EasySmartStandIn().start()
+        self.switch_manager = SwitchManager()
+        with patch('switch_TL_SG108PE.switch_manager.EasySmartClient', self._client):
+            self.switch_manager.connect('192.168.1.42', 'admin', 'admin', backend='easy_smart')
+
+    def tearDown(self) -> None:
+        if self.switch_manager.is_connected:
+            self.switch_manager.disconnect()
+        self.stand_in.stop()
+
+    def _client(self, host, login, password):
+        return EasySmartClient(host, login, password, broadcast=self.stand_in.host, switch_port=self.stand_in.port,
+                               client_port=0)
+
+    def test_login_with_wrong_credentials(self):
+        client = EasySmartClient('192.168.1.42', 'admin', 'wrong', broadcast=self.stand_in.host,
+                                 switch_port=self.stand_in.port, client_port=0)
+        self.assertRaises(LoginException, client.login)
+        client.quit()
+
+    def test_login_to_unknown_switch(self):
+        client = EasySmartClient('192.168.1.43', 'admin', 'admin', timeout=0.2, broadcast=self.stand_in.host,
+                                 switch_port=self.stand_in.port, client_port=0)
+        self.assertRaises(LoginException, client.login)
+        client.quit()
+
+    def test_control_fields(self):
+        self.assertEqual(self.switch_manager.get_control_fields(), ['system', 'switching', 'monitoring', 'VLAN', 'QoS'])
+
+    def test_system_info(self):
+        system_info = self.switch_manager.control('system').system_info()
+        self.assertEqual(system_info, {
+            'Device Description': 'TL-SG108PE',
+            'MAC Address': 'E4:C3:2A:BD:FF:F0',
+            'IP Address': '192.168.1.42',
+            'Subnet Mask': '255.255.255.0',
+            'Default Gateway': '192.168.1.1',
+            'Firmware Version': '1.0.0 Build 20200415 Rel.54962',
+            'Hardware Version': 'TL-SG108PE 3.0',
+        })
+
+    def test_ip_settings(self):
+        ip_settings = self.switch_manager.control('system').ip_settings()
+        self.assertEqual(ip_settings['DHCP Setting'], 'disable')
+        self.assertEqual(ip_settings['IP Address'], '192.168.1.42')
+
+    def test_ports_settings(self):
+        ports_settings = self.switch_manager.control('switching').ports_settings()
+        self.assertEqual(len(ports_settings), 8)
+        self.assertEqual(ports_settings['Port 1'], {
+            'Status': 'Enabled',
+            'Speed/Duplex Config': 'Auto',
+            'Speed/Duplex Actual': '1000MF',
+            'Flow Control Config': 'Off',
+            'Flow Control Actual': 'Off',
+        })
+        self.assertEqual(ports_settings['Port 2']['Speed/Duplex Actual'], 'Link Down')
+
+    def test_port_statistics(self):
+        port_statistics = self.switch_manager.control('monitoring').port_statistics()
+        self.assertEqual(len(port_statistics), 8)
+        self.assertEqual(port_statistics['Port 1']['TxGoodPkt'], '1000')
+        self.assertEqual(port_statistics['Port 1']['RxGoodPkt'], '2000')
+        self.assertEqual(port_statistics['Port 2']['Link Status'], 'Link Down')
+
+    def test_port_statistics_in_one_datagram_exchange(self):
+        received = len(self.stand_in.received)
+        start = time.monotonic()
+        self.switch_manager.control('monitoring').port_statistics()
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(len(self.stand_in.received), received + 1)
+
+    def test_session_is_renewed_after_switch_forgot_token(self):
+        self.switch_manager.control('system').ip_settings()
+        self.stand_in.switches[0].token_id = None  # e.g. switch was restarted
+        ip_settings = self.switch_manager.control('system').ip_settings()
+        self.assertEqual(ip_settings['IP Address'], '192.168.1.42')
+        self.assertEqual([packet.op_code for packet in self.stand_in.received[-3:]],
+                         [OpCode.GET, OpCode.LOGIN, OpCode.GET])
+
+    def test_loop_prevention(self):
+        self.assertEqual(self.switch_manager.control('monitoring').loop_prevention(), {'Loop Prevention': 'Enable'})
+
+    def test_ieee_802_1q_vlan_configuration(self):
+        switch = self.stand_in.switches[0]
+        switch.records[Field.IEEE_802_1Q_VLAN].append(
+            protocol.IEEE_802_1Q_VLAN.pack(10, 0b00001110, 0b00000100) + protocol.encode_string('cameras'))
+        configuration = self.switch_manager.control('VLAN').ieee_802_1q_vlan_configuration()
+        self.assertEqual(configuration['802.1Q VLAN Configuration'], 'Enable')
+        self.assertEqual(configuration['VLANs'], [
+            {'VLAN ID': '1', 'VLAN Name': 'Default_VLAN', 'Member Ports': '1-8', 'Tagged Ports': '',
+             'Untagged Ports': '1-8'},
+            {'VLAN ID': '10', 'VLAN Name': 'cameras', 'Member Ports': '2-4', 'Tagged Ports': '3',
+             'Untagged Ports': '2,4'},
+        ])
+
+    def test_ieee_802_1q_vlan_configuration_disabled(self):
+        self.stand_in.switches[0].records[Field.IEEE_802_1Q_VLAN_ENABLED] = [b'\x00']
+        configuration = self.switch_manager.control('VLAN').ieee_802_1q_vlan_configuration()
+        self.assertEqual(configuration, {'802.1Q VLAN Configuration': 'Disable', 'VLANs': []})
+
+    def test_qos(self):
+        qos = self.switch_manager.control('QoS')
+        self.assertEqual(qos.qos_mode(), 'Port Based')
+        self.assertEqual(qos.priority_queue_port_settings()['Port 3'], '1(Lowest)')
+        self.stand_in.switches[0].records[Field.QOS_MODE] = [b'\x01']
+        self.assertEqual(qos.qos_mode(), '802.1P Based')
+        self.assertRaises(QoSModeException, qos.priority_queue_port_settings)
+
+    def test_login_again_after_logout(self):
+        self.switch_manager._web_controller.logout()
+        system_info = self.switch_manager.control('system').system_info()
+        self.assertEqual(system_info['IP Address'], '192.168.1.42')
+
+    def test_switch_is_recognised_by_ip_address(self):
+        self.stand_in.switches.insert(0, StandInSwitch('192.168.1.50', 'E4:C3:2A:00:00:01'))
+        client = self._client('192.168.1.50', 'admin', 'admin')
+        client.login()
+        self.assertEqual(protocol.decode_mac(client.switch_mac), 'E4:C3:2A:00:00:01')
+        client.quit()
+
+
+class TestDiscovery(unittest.TestCase):
+
+    def test_discover_all_switches(self):
+        switches = [StandInSwitch(f'192.168.1.{i}', f'E4:C3:2A:00:00:{i:02X}') for i in range(60, 10, -1)]
+        with EasySmartStandIn(switches) as stand_in:
+            start = time.monotonic()
+            discovered = discover(timeout=0.3, broadcast=stand_in.host, switch_port=stand_in.port, client_port=0)
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertEqual(len(stand_in.received), 1)
+        self.assertEqual(len(discovered), 50)
+        self.assertEqual(discovered[0], {
+            'Device Description': 'TL-SG108PE',
+            'MAC Address': 'E4:C3:2A:00:00:0B',
+            'IP Address': '192.168.1.11',
+            'Subnet Mask': '255.255.255.0',
+            'Default Gateway': '192.168.1.1',
+            'Firmware Version': '1.0.0 Build 20200415 Rel.54962',
+            'Hardware Version': 'TL-SG108PE 3.0',
+        })
+        self.assertEqual(discovered[-1]['IP Address'], '192.168.1.60')
+
+    def test_discover_without_switches(self):
+        with EasySmartStandIn([]) as stand_in:
+            self.assertEqual(discover(timeout=0.1, broadcast=stand_in.host, switch_port=stand_in.port,
+                                      client_port=0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
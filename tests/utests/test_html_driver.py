@@ -0,0 +1,285 @@
+import os
+import sys
+import time
+import unittest
+from collections import Counter
+from unittest.mock import Mock
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.html_driver import HtmlDriver
+from switch_TL_SG108PE.web_controller import WebController
+from switch_TL_SG108PE.exceptions import TpLinkSwitchException, DeadlineExceededException, DeviceDescriptionException
+from switch_TL_SG108PE.control_fields.control_field import TIP_QUERY
+from switch_TL_SG108PE.utils import Frame
+from switch_TL_SG108PE import scripts
+from tests.utests.switch_pages import FakeHttpClient
+
+
+class TestHtmlDriverAsWebdriver(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = FakeHttpClient()
+        self.switch_manager = SwitchManager()
+        self.switch_manager.connect('192.168.1.42', 'admin', 'admin', webdriver=HtmlDriver(self.client))
+
+    def test_login_via_logon_form(self):
+        self.assertIsInstance(self.switch_manager._web_controller, WebController)
+        self.assertTrue(self.client.logged_in)
+        self.assertIn(('POST', 'logon.cgi', '', {'username': ['admin'], 'password': ['admin'], 'cpassword': [''],
+                                                 'logon': ['Login']}), self.client.requests)
+
+    def test_system_info(self):
+        system_info = self.switch_manager.control('system').system_info()
+        self.assertEqual(system_info['Device Description'], 'TL-SG108PE')
+        self.assertEqual(system_info['Hardware Version'], 'TL-SG108PE 3.0')
+
+    def test_login_reuses_valid_session(self):
+        requests = len(self.client.requests)
+        self.switch_manager._web_controller.login()
+        self.assertNotIn('Logout.htm', [request[1] for request in self.client.requests[requests:]])
+        self.assertNotIn('logon.cgi', [request[1] for request in self.client.requests[requests:]])
+        self.assertEqual(self.switch_manager.control('system').system_info()['Device Description'], 'TL-SG108PE')
+
+    def test_set_device_description(self):
+        self.switch_manager.control('system').set_device_description('rack-1')
+        self.assertEqual(self.client.description, 'rack-1')
+        self.assertEqual(self.switch_manager.control('system').system_info()['Device Description'], 'rack-1')
+
+    def test_set_ip_sends_current_dhcp_setting(self):
+        self.switch_manager.control('system').set_ip('192.168.1.43', '255.255.255.0', '192.168.1.1')
+        queries = [parse_qs(request[2]) for request in self.client.requests if request[1] == 'ip_setting.cgi']
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(queries[0]['dhcpSetting'], ['disable'])
+        self.assertEqual(queries[0]['ip_address'], ['192.168.1.43'])
+        self.assertEqual(queries[0]['ip_gateway'], ['192.168.1.1'])
+
+    def test_form_filled_by_scripts_is_not_submitted_with_empty_fields(self):
+        self.switch_manager.control('system').ip_settings()
+        driver = self.switch_manager._web_controller.webdriver
+        driver.find_element(By.ID, 'txt_addr').send_keys('192.168.1.43')
+        driver.find_element(By.NAME, 'submit').click()
+        self.assertRaisesRegex(WebDriverException, 'dhcpSetting, ip_netmask, ip_gateway',
+                               driver.switch_to.alert.accept)
+        self.assertNotIn('ip_setting.cgi', [request[1] for request in self.client.requests])
+
+    def test_rejected_settings_are_submitted_once(self):
+        self.client.description_tip = 'Error: description rejected'
+        self.assertRaises(DeviceDescriptionException, self.switch_manager.control('system').set_device_description,
+                          'rack-1')
+        self.assertEqual([request[1] for request in self.client.requests].count('system_name_set.cgi'), 1)
+        self.assertEqual(self.client.description, 'TL-SG108PE')
+
+    def test_disconnect_accepts_logout_confirmation(self):
+        self.switch_manager.disconnect()
+        self.assertFalse(self.client.logged_in)
+
+    def test_keep_session_alive_logs_in_again_after_session_expired(self):
+        web_controller = self.switch_manager._web_controller
+        self.client.logged_in = False
+        web_controller.keep_session_alive()
+        self.assertTrue(self.client.logged_in)
+        self.assertTrue(web_controller.is_logged_in())
+
+    def test_outcome_of_applied_settings_is_known_at_once(self):
+        web_controller = self.switch_manager._web_controller
+        system = self.switch_manager.control('system')
+        system.set_device_description('rack-1')
+        web_controller.mark_page(TIP_QUERY)
+        self.assertEqual(web_controller.wait_until_settings_are_applied(TIP_QUERY, timeout=0), '')
+        started = time.monotonic()
+        web_controller.webdriver.load(Frame.MAIN.value, 'GET', self.client.url('PortSettingRpm.htm'))
+        self.assertEqual(web_controller.wait_until_settings_are_applied(TIP_QUERY), '')
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_waits_draw_from_deadline_of_operation(self):
+        web_controller = self.switch_manager._web_controller
+        web_controller.begin_operation(deadline=0.2)
+        started = time.monotonic()
+        self.assertRaises(DeadlineExceededException, web_controller.wait_until_element_is_present, By.ID, 'missing')
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertFalse(web_controller.recover_session())
+        web_controller.end_operation(failed=True)
+        self.assertIsNone(web_controller.remaining_time())
+
+    def test_nested_operation_does_not_extend_deadline(self):
+        web_controller = self.switch_manager._web_controller
+        web_controller.begin_operation(deadline=10)
+        web_controller.begin_operation(deadline=60)
+        self.assertLessEqual(web_controller.remaining_time(), 10)
+        web_controller.begin_operation(deadline=1)
+        self.assertLessEqual(web_controller.remaining_time(), 1)
+        web_controller.end_operation()
+        self.assertGreater(web_controller.remaining_time(), 1)
+        web_controller.end_operation()
+        web_controller.end_operation()
+        self.assertIsNone(web_controller.remaining_time())
+
+    def test_control_field_method_accepts_deadline(self):
+        system = self.switch_manager.control('system')
+        self.assertEqual(system.system_info(deadline=5)['Device Description'], 'TL-SG108PE')
+        self.assertIsNone(self.switch_manager._web_controller.remaining_time())
+
+    def test_each_element_is_located_once(self):
+        driver = self.switch_manager._web_controller.webdriver
+        driver.find_element = Mock(wraps=driver.find_element)
+        for name, method in (('system_info', self.switch_manager.control('system').system_info),
+                             ('ip_settings', self.switch_manager.control('system').ip_settings),
+                             ('ports_settings', self.switch_manager.control('switching').ports_settings)):
+            with self.subTest(method=name):
+                driver.find_element.reset_mock()
+                method()
+                locators = Counter(call.args for call in driver.find_element.call_args_list)
+                self.assertLessEqual(max(locators.values(), default=0), 1)
+
+
+class TestHtmlDriver(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = FakeHttpClient()
+        self.client.logged_in = True
+        self.driver = HtmlDriver(self.client)
+        self.driver.get(self.client.url('Controls.htm'))
+
+    def _submitted_fields(self):
+        method, path, query, _ = self.client.requests[-1]
+        self.assertEqual((method, path), ('GET', 'controls.cgi'))
+        return parse_qs(query, keep_blank_values=True)
+
+    def _apply(self):
+        self.driver.find_element(By.ID, 'bt_apply').click()
+        self.driver.switch_to.alert.accept()
+
+    def test_default_form_values(self):
+        self._apply()
+        self.assertEqual(self._submitted_fields(), {'port': ['1'], 'mode': ['on'], 'single': ['1'],
+                                                    'multiple': ['1'], 'note': ['old'], 'apply': ['Apply']})
+
+    def test_confirmation_declared_in_script_function(self):
+        self.driver.find_element(By.ID, 'bt_apply').click()
+        alert = self.driver.switch_to.alert
+        self.assertEqual(alert.text, 'Change mode?')
+        alert.dismiss()
+        self.assertEqual(self.client.requests[-1][1], 'Controls.htm')
+        self.assertRaises(NoAlertPresentException, lambda: self.driver.switch_to.alert)
+
+    def test_checkbox_and_radio(self):
+        self.driver.find_element(By.ID, 'chk_1').click()
+        self.driver.find_element(By.ID, 'chk_2').click()
+        self.driver.find_element(By.ID, 'rd_off').click()
+        self.assertFalse(self.driver.find_element(By.ID, 'rd_on').is_selected())
+        self._apply()
+        fields = self._submitted_fields()
+        self.assertEqual(fields['port'], ['2'])
+        self.assertEqual(fields['mode'], ['off'])
+
+    def test_send_keys_and_clear(self):
+        note = self.driver.find_element(By.ID, 'txt_note')
+        note.send_keys(' and new')
+        self.assertEqual(note.get_attribute('value'), 'old and new')
+        note.clear()
+        note.send_keys('new')
+        self._apply()
+        self.assertEqual(self._submitted_fields()['note'], ['new'])
+
+    def test_select_option(self):
+        select = Select(self.driver.find_element(By.ID, 'sel_single'))
+        select.select_by_visible_text('Two')
+        self.assertEqual(select.first_selected_option.text, 'Two')
+        self._apply()
+        self.assertEqual(self._submitted_fields()['single'], ['2'])
+
+    def test_click_with_control_key_pressed_toggles_option(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        select = self.driver.find_element(By.ID, 'sel_multiple')
+        web_controller.click_element_with_control_key_pressed(select.find_element(By.XPATH, ".//option[@value='2']"))
+        web_controller.click_element_with_control_key_pressed(select.find_element(By.XPATH, ".//option[@value='3']"))
+        self._apply()
+        self.assertEqual(self._submitted_fields()['multiple'], ['1', '2'])
+
+    def test_alert_is_outcome_of_applied_settings(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        web_controller.mark_page(TIP_QUERY)
+        self.driver.find_element(By.ID, 'bt_apply').click()
+        self.assertEqual(web_controller.wait_until_settings_are_applied(TIP_QUERY), 'Change mode?')
+        self.assertRaises(NoAlertPresentException, lambda: self.driver.switch_to.alert)
+
+    def test_elements_texts_script(self):
+        texts = self.driver.execute_script(scripts.ELEMENTS_TEXTS, By.XPATH, "(//select[@id='sel_single']/option)"
+                                                                             "[position() > 1]")
+        self.assertEqual(texts, ['Two'])
+        self.assertEqual(self.driver.execute_script(scripts.ELEMENTS_TEXTS, By.CSS_SELECTOR, '#txt_note'), ['old'])
+
+    def test_unknown_script(self):
+        self.assertRaises(WebDriverException, lambda: self.driver.execute_script('return document.title;'))
+
+    def test_get_table(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        self.assertEqual(web_controller.get_table(By.XPATH, "//select[@id='sel_multiple']/option", columns=2),
+                         [['Port 1', 'Port 2'], ['Port 3']])
+
+    def test_wait_until_element_is_present_returns_element(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        note = web_controller.wait_until_element_is_present(By.ID, 'txt_note')
+        self.assertEqual(note.get_attribute('value'), 'old')
+        options = web_controller.wait_until_elements_are_present(By.XPATH, "//select[@id='sel_single']/option")
+        self.assertEqual([option.text for option in options], ['One', 'Two'])
+        self.assertRaises(TpLinkSwitchException, web_controller.wait_until_elements_are_present, By.ID, 'missing',
+                          timeout=0)
+
+    def test_fill_form(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        web_controller.fill_form({
+            "//input[@id='chk_1']": False,
+            "//input[@id='chk_2']": True,
+            "//input[@id='rd_off']": True,
+            "//select[@id='sel_single']": 'Two',
+            "//select[@id='sel_multiple']": ['Port 2'],
+            "//textarea[@id='txt_note']": 'new',
+        }, submit="//input[@id='bt_apply']")
+        self.driver.switch_to.alert.accept()
+        self.assertEqual(self._submitted_fields(), {'port': ['2'], 'mode': ['off'], 'single': ['2'],
+                                                    'multiple': ['2'], 'note': ['new'], 'apply': ['Apply']})
+
+    def test_fill_form_by_values(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        web_controller.fill_form({
+            "//input[@name='mode']": 'off',
+            "//select[@id='sel_single']": '2',
+            "//select[@id='sel_multiple']": ['2', 'Port 1'],
+        }, submit="//input[@id='bt_apply']")
+        self.driver.switch_to.alert.accept()
+        fields = self._submitted_fields()
+        self.assertEqual((fields['mode'], fields['single'], fields['multiple']), (['off'], ['2'], ['1', '2']))
+
+    def test_fill_form_with_unknown_radio_value(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        self.assertRaises(TpLinkSwitchException, web_controller.fill_form, {"//input[@name='mode']": 'auto'},
+                          submit="//input[@id='bt_apply']", timeout=0)
+        self.assertTrue(self.driver.find_element(By.ID, 'rd_on').is_selected())
+
+    def test_fill_form_with_disabled_option(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        requests = len(self.client.requests)
+        self.assertRaises(TpLinkSwitchException, web_controller.fill_form,
+                          {"//textarea[@id='txt_note']": 'new', "//select[@id='sel_multiple']": ['Port 1', 'Port 3']},
+                          submit="//input[@id='bt_apply']", timeout=0)
+        self.assertRaises(NoAlertPresentException, lambda: self.driver.switch_to.alert)
+        self.assertEqual(self.client.requests[requests:], [])
+
+    def test_fill_form_with_missing_field(self):
+        web_controller = WebController('192.168.1.42', 'admin', 'admin', self.driver)
+        self.assertRaises(TpLinkSwitchException, web_controller.fill_form,
+                          {"//textarea[@id='txt_note']": 'new', "//input[@id='txt_missing']": 'value'},
+                          submit="//input[@id='bt_apply']", timeout=0)
+        self.assertEqual(self.driver.find_element(By.ID, 'txt_note').get_attribute('value'), 'old')
+
+
+if __name__ == '__main__':
+    unittest.main()
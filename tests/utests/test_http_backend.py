@@ -0,0 +1,209 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.web_controller import HttpWebController
+from switch_TL_SG108PE.exceptions import (LoginException, UnknownBackendException, DeadlineExceededException,
+                                          DeviceDescriptionException)
+from switch_TL_SG108PE.http_client import HttpClient
+from switch_TL_SG108PE import scripts
+from tests.utests.switch_pages import FakeHttpClient
+
+
+class TestHttpBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = FakeHttpClient()
+        self.switch_manager = SwitchManager()
+        with patch('switch_TL_SG108PE.switch_manager.HttpWebController',
+                   lambda host, login, password: HttpWebController(host, login, password, client=self.client)):
+            self.switch_manager.connect('192.168.1.42', 'admin', 'admin', backend='http')
+
+    def test_login(self):
+        self.assertTrue(self.client.logged_in)
+        self.assertIn(('POST', 'logon.cgi', '', {'username': 'admin', 'password': 'admin', 'cpassword': '',
+                                                 'logon': 'Login'}), self.client.requests)
+
+    def test_login_with_wrong_credentials(self):
+        web_controller = HttpWebController('192.168.1.42', 'admin', 'wrong', client=FakeHttpClient(password='wrong'))
+        self.assertRaises(LoginException, web_controller.login)
+
+    def test_unknown_backend(self):
+        self.assertRaises(UnknownBackendException,
+                          lambda: SwitchManager().connect('192.168.1.42', 'admin', 'admin', backend='telnet'))
+
+    def test_system_info(self):
+        system_info = self.switch_manager.control('system').system_info()
+        self.assertEqual(system_info, {
+            'Device Description': 'TL-SG108PE',
+            'MAC Address': 'E4:C3:2A:BD:FF:F0',
+            'IP Address': '192.168.1.42',
+            'Subnet Mask': '255.255.255.0',
+            'Default Gateway': '192.168.1.1',
+            'Firmware Version': '1.0.0 Build 20200415 Rel.54962',
+            'Hardware Version': 'TL-SG108PE 3.0',
+        })
+
+    def test_ip_settings(self):
+        ip_settings = self.switch_manager.control('system').ip_settings()
+        self.assertEqual(ip_settings['DHCP Setting'], 'disable')
+        self.assertEqual(ip_settings['IP Address'], '192.168.1.42')
+
+    def test_port_statistics_opened_from_javascript_link(self):
+        port_statistics = self.switch_manager.control('monitoring').port_statistics(refresh=False)
+        self.assertEqual(len(port_statistics.keys()), 8)
+        self.assertEqual(port_statistics['Port 1']['Link Status'], '1000MF')
+        self.assertEqual(port_statistics['Port 3']['TxGoodPkt'], '3')
+
+    def test_port_statistics_read_with_one_script(self):
+        driver = self.switch_manager._web_controller.webdriver
+        self.switch_manager.control('monitoring').port_statistics(refresh=False)
+        with patch.object(driver, 'execute_script', wraps=driver.execute_script) as execute_script:
+            port_statistics = self.switch_manager.control('monitoring').port_statistics(refresh=False)
+        self.assertEqual([call.args[0] for call in execute_script.call_args_list], [scripts.PAGE_VARIABLES])
+        self.assertEqual(port_statistics['Port 3'], {'Status': 'Enabled', 'Link Status': 'Link Down',
+                                                     'TxGoodPkt': '3', 'TxBadPkt': '0', 'RxGoodPkt': '30',
+                                                     'RxBadPkt': '1'})
+
+    def test_ports_settings_read_from_page_variables(self):
+        ports_settings = self.switch_manager.control('switching').ports_settings()
+        self.assertEqual(len(ports_settings), 8)
+        self.assertEqual(ports_settings['Port 1']['Speed/Duplex Actual'], '1000MF')
+        self.assertEqual(ports_settings['Port 7']['Status'], 'Disabled')
+        self.assertEqual(ports_settings['Port 8'], {'Status': 'Enabled', 'Speed/Duplex Config': '100MF',
+                                                    'Speed/Duplex Actual': '100MF', 'Flow Control Config': 'On',
+                                                    'Flow Control Actual': 'On'})
+
+    def test_vlans_read_from_page_variables(self):
+        vlan = self.switch_manager.control('VLAN')
+        self.assertEqual(vlan.port_based_vlan_configuration(), {
+            'Port Based VLAN Configuration': 'Enable',
+            'VLANs': [{'VLAN ID': '1', 'VLAN Member Port': '3-8'}, {'VLAN ID': '2', 'VLAN Member Port': '1-2'}]
+        })
+        self.assertEqual(vlan.ieee_802_1q_vlan_configuration()['VLANs'], [
+            {'VLAN ID': '1', 'VLAN Name': 'Default_VLAN', 'Member Ports': '1-8', 'Tagged Ports': '',
+             'Untagged Ports': '1-8'},
+            {'VLAN ID': '10', 'VLAN Name': 'cameras', 'Member Ports': '2-4', 'Tagged Ports': '3',
+             'Untagged Ports': '2,4'},
+        ])
+
+    def test_port_mirror_read_from_page_variables(self):
+        monitoring = self.switch_manager.control('monitoring')
+        self.assertEqual(monitoring.mirroring_port(), {'Mirroring Port': 'Port 8'})
+        mirrored_ports = monitoring.mirrored_ports()['Mirrored Ports']
+        self.assertEqual(len(mirrored_ports), 8)
+        self.assertEqual(mirrored_ports['Port 1'], {'Ingress': 'Enabled', 'Egress': 'Disabled'})
+        self.assertEqual(mirrored_ports['Port 2'], {'Ingress': 'Enabled', 'Egress': 'Enabled'})
+
+    def test_lag_settings_read_from_page_variables(self):
+        self.assertEqual(self.switch_manager.control('switching').lag_settings(), {'LAG1': '1-2', 'LAG2': '---'})
+
+    def test_qos_read_from_page_variables(self):
+        qos = self.switch_manager.control('QoS')
+        self.assertEqual(qos.qos_mode(), 'Port Based')
+        priority_queues = qos.priority_queue_port_settings()
+        self.assertEqual(len(priority_queues), 8)
+        self.assertEqual(priority_queues['Port 1'], '1(Lowest)')
+        self.assertEqual(priority_queues['Port 3'], '4(Highest)')
+        self.assertEqual(priority_queues['Port 7'], '3(Medium)')
+
+    def test_refresh_port_statistics(self):
+        port_statistics = self.switch_manager.control('monitoring').port_statistics(refresh=True)
+        self.assertEqual(port_statistics['Port 3']['TxGoodPkt'], '103')
+        self.assertIn(('GET', 'port_statistics_set.cgi', 'refresh=Refresh', None), self.client.requests)
+
+    def test_tab_opened_without_sidebar_navigation(self):
+        requests = len(self.client.requests)
+        self.switch_manager.control('switching').ports_settings()
+        self.assertEqual(self.client.requests[requests:], [('GET', 'PortSettingRpm.htm', '', None)])
+
+    def test_opened_tab_is_not_opened_again(self):
+        system = self.switch_manager.control('system')
+        system.system_info()
+        requests = len(self.client.requests)
+        self.assertEqual(system.system_info()['Device Description'], 'TL-SG108PE')
+        self.assertEqual(len(self.client.requests), requests)
+
+    def test_polling_port_statistics_only_refreshes_them(self):
+        monitoring = self.switch_manager.control('monitoring')
+        monitoring.port_statistics()
+        requests = len(self.client.requests)
+        monitoring.port_statistics()
+        self.assertEqual(self.client.requests[requests:], [('GET', 'port_statistics_set.cgi', 'refresh=Refresh', None)])
+
+    def test_tab_is_opened_again_after_failure(self):
+        system = self.switch_manager.control('system')
+        system.system_info()
+        with patch.object(HttpWebController, 'get_page_variables', side_effect=RuntimeError):
+            self.assertRaises(RuntimeError, self.switch_manager.control('switching').ports_settings)
+        self.assertIsNone(self.switch_manager._web_controller.current_tab)
+
+    def test_active_frame_is_not_switched_again(self):
+        system = self.switch_manager.control('system')
+        system.system_info()
+        with patch.object(self.switch_manager._web_controller.webdriver, 'activate_frame') as activate_frame:
+            system.system_info()
+        activate_frame.assert_not_called()
+
+    def test_reloaded_admin_page_is_detected(self):
+        monitoring = self.switch_manager.control('monitoring')
+        monitoring.port_statistics(refresh=False)
+        self.switch_manager._web_controller.webdriver.get(self.client.base_url)
+        self.assertEqual(monitoring.port_statistics(refresh=False)['Port 3']['TxGoodPkt'], '3')
+        self.assertEqual(self.client.requests[-1][1], 'PortStatisticsRpm.htm')
+
+    def test_expired_session_is_renewed_transparently(self):
+        monitoring = self.switch_manager.control('monitoring')
+        monitoring.port_statistics()
+        self.client.logged_in = False
+        requests = len(self.client.requests)
+        self.assertEqual(len(monitoring.port_statistics()), 8)
+        self.assertEqual([request[1] for request in self.client.requests[requests:]].count('logon.cgi'), 1)
+
+    def test_rejected_settings_are_submitted_once(self):
+        self.client.description_tip = 'Error: description rejected'
+        self.assertRaises(DeviceDescriptionException, self.switch_manager.control('system').set_device_description,
+                          'rack-1')
+        self.assertEqual([request[1] for request in self.client.requests].count('system_name_set.cgi'), 1)
+
+    def test_session_is_checked_after_ttl(self):
+        web_controller = self.switch_manager._web_controller
+        web_controller.session_ttl = 0
+        self.switch_manager.control('monitoring').port_statistics(refresh=False)
+        with patch.object(web_controller.webdriver, 'execute_script',
+                          wraps=web_controller.webdriver.execute_script) as execute_script:
+            self.switch_manager.control('monitoring').port_statistics(refresh=False)
+        self.assertEqual([call.args[0] for call in execute_script.call_args_list],
+                         [scripts.FRAMES, scripts.PAGE_VARIABLES])
+
+    def test_requests_are_bounded_by_deadline(self):
+        client = HttpClient('192.168.1.42', 'admin', 'admin')
+        client.deadline = time.monotonic() + 1
+        with patch.object(client.session, 'request') as request:
+            client.request('GET', client.base_url)
+        self.assertLessEqual(request.call_args.kwargs['timeout'], 1)
+        client.deadline = time.monotonic()
+        self.assertRaises(DeadlineExceededException, client.request, 'GET', client.base_url)
+
+    def test_deadline_is_passed_to_http_client(self):
+        web_controller = self.switch_manager._web_controller
+        web_controller.begin_operation(deadline=5)
+        self.assertEqual(self.client.deadline, web_controller.deadline)
+        web_controller.end_operation()
+        self.assertIsNone(self.client.deadline)
+
+    def test_disconnect(self):
+        self.switch_manager.disconnect()
+        self.assertFalse(self.client.logged_in)
+
+    def test_is_logged_in(self):
+        web_controller = self.switch_manager._web_controller
+        self.assertTrue(web_controller.is_logged_in())
+        self.client.logged_in = False
+        web_controller.webdriver.get(self.client.base_url)
+        self.assertFalse(web_controller.is_logged_in())
@@ -0,0 +1,81 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.html_driver import HtmlDriver
+from switch_TL_SG108PE.web_controller import HybridWebController
+from switch_TL_SG108PE.exceptions import LoginException
+from tests.utests.switch_pages import FakeHttpClient
+
+
+class TestHybridBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.browser = FakeHttpClient()
+        self.client = FakeHttpClient(shared_session=True)
+        self.switch_manager = SwitchManager()
+        with patch('switch_TL_SG108PE.switch_manager.HybridWebController',
+                   lambda host, login, password, webdriver, **kwargs: HybridWebController(
+                       host, login, password, webdriver, client=self.client, **kwargs)):
+            self.switch_manager.connect('192.168.1.42', 'admin', 'admin', webdriver=HtmlDriver(self.browser),
+                                        backend='hybrid')
+
+    def _pages(self, client):
+        return [path for _, path, _, _ in client.requests]
+
+    def test_session_of_browser_is_shared(self):
+        self.assertIn('logon.cgi', self._pages(self.browser))
+        self.assertNotIn('logon.cgi', self._pages(self.client))
+        self.assertTrue(self.client.logged_in)
+        self.assertEqual(self.client.session.cookies.get(FakeHttpClient.SESSION_COOKIE[0]),
+                         FakeHttpClient.SESSION_COOKIE[1])
+
+    def test_session_not_accepted(self):
+        web_controller = HybridWebController('192.168.1.42', 'admin', 'admin', HtmlDriver(FakeHttpClient()),
+                                             client=FakeHttpClient())
+        self.assertRaises(LoginException, web_controller.login)
+
+    def test_read_over_http(self):
+        system_info = self.switch_manager.control('system').system_info()
+        self.assertEqual(system_info['Device Description'], 'TL-SG108PE')
+        self.assertIn('SystemInfoRpm.htm', self._pages(self.client))
+        self.assertNotIn('SystemInfoRpm.htm', self._pages(self.browser))
+
+    def test_write_in_browser(self):
+        self.switch_manager.control('system').set_device_description('rack-1')
+        self.assertIn('system_name_set.cgi', self._pages(self.browser))
+        self.assertNotIn('system_name_set.cgi', self._pages(self.client))
+        self.assertEqual(self.browser.description, 'rack-1')
+
+    def test_read_after_write_downloads_page_again(self):
+        system = self.switch_manager.control('system')
+        system.system_info()
+        system.system_info()
+        self.assertEqual(self._pages(self.client).count('SystemInfoRpm.htm'), 1)
+        system.set_device_description('rack-1')
+        system.system_info()
+        self.assertEqual(self._pages(self.client).count('SystemInfoRpm.htm'), 2)
+
+    def test_read_nested_in_write_stays_in_browser(self):
+        web_controller = self.switch_manager._web_controller
+        web_controller.begin_operation(read_only=False)
+        web_controller.begin_operation(read_only=True)
+        self.assertIsInstance(web_controller.webdriver, HtmlDriver)
+        self.assertIs(web_controller.webdriver.client, self.browser)
+        web_controller.end_operation()
+        web_controller.end_operation()
+        web_controller.begin_operation(read_only=True)
+        self.assertIs(web_controller.webdriver.client, self.client)
+        web_controller.end_operation()
+
+    def test_disconnect(self):
+        self.switch_manager.disconnect()
+        self.assertFalse(self.browser.logged_in)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.javascript import parse_variables
+
+
+class TestJavaScript(unittest.TestCase):
+
+    def test_parse_variables(self):
+        variables = parse_variables("""
+            var max_port_num = 8, port_middle_num = 16;
+            var all_info = {
+            state:[1,1,0],  // port states
+            pkts:[0x10, -2, 1.5]
+            };
+            var qvlan_ds = {"names": new Array('Default_VLAN', "it\\'s"), empty: [], nested: {a: null}};
+        """)
+        self.assertEqual(variables, {
+            'max_port_num': 8,
+            'port_middle_num': 16,
+            'all_info': {'state': [1, 1, 0], 'pkts': [16, -2, 1.5]},
+            'qvlan_ds': {'names': ['Default_VLAN', "it's"], 'empty': [], 'nested': {'a': None}},
+        })
+
+    def test_variables_without_literal_values_are_skipped(self):
+        variables = parse_variables("""
+            var tip = document.getElementById('tip');
+            var state = 1;
+            function show() { var state = 2; }
+        """)
+        self.assertEqual(variables, {'state': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.keepalive import SessionKeepalive
+from switch_TL_SG108PE.web_controller import HttpWebController
+from switch_TL_SG108PE.exceptions import TpLinkSwitchException
+from tests.utests.switch_pages import FakeHttpClient
+
+
+class TestSessionKeepalive(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = FakeHttpClient()
+        self.web_controller = HttpWebController('192.168.1.42', 'admin', 'admin', client=self.client)
+        self.web_controller.login()
+
+    def _wait_for(self, condition, timeout: float = 2) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_expired_session_is_renewed_in_background(self):
+        self.client.logged_in = False
+        with SessionKeepalive(self.web_controller, 0.05):
+            self._wait_for(lambda: self.client.logged_in)
+        self.assertTrue(self.client.logged_in)
+        self.assertIn('logon.cgi', [request[1] for request in self.client.requests[1:]])
+
+    def test_used_session_is_not_renewed(self):
+        self.assertGreater(self.web_controller.keep_session_alive(60), 59)
+        requests = len(self.client.requests)
+        self.assertLessEqual(self.web_controller.keep_session_alive(60), 60)
+        self.assertEqual(len(self.client.requests), requests)
+
+    def test_idle_session_is_touched_without_login(self):
+        requests = len(self.client.requests)
+        self.assertEqual(self.web_controller.keep_session_alive(0), 0)
+        self.assertEqual(self.client.requests[requests:], [('GET', '', '', None)])
+
+    def test_failed_renewal_does_not_stop_keepalive(self):
+        web_controller = Mock(keep_session_alive=Mock(side_effect=TpLinkSwitchException('unreachable')))
+        keepalive = SessionKeepalive(web_controller, 0.01).start()
+        self._wait_for(lambda: keepalive.failures >= 2)
+        keepalive.stop()
+        self.assertGreaterEqual(keepalive.failures, 2)
+
+    def test_switch_manager_stops_keepalive_on_disconnect(self):
+        switch_manager = SwitchManager()
+        with patch('switch_TL_SG108PE.switch_manager.HttpWebController',
+                   lambda host, login, password: HttpWebController(host, login, password, client=self.client)):
+            switch_manager.connect('192.168.1.42', 'admin', 'admin', backend='http', keepalive=60)
+        keepalive = switch_manager._keepalive
+        self.assertTrue(keepalive._thread.is_alive())
+        switch_manager.disconnect()
+        self.assertIsNone(keepalive._thread)
+        self.assertFalse(self.client.logged_in)
+
+
+if __name__ == '__main__':
+    unittest.main()
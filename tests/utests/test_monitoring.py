@@ -17,8 +17,19 @@ class TestMonitoring(unittest.TestCase):
         self.monitoring = MonitoringControlField(web_controller=MagicMock())
 
     def test_port_statistics(self):
+        self.monitoring.web_controller.get_page_variables.return_value = {
+            'all_info': {
+                'state': [1] * 8 + [0, 0],
+                'link_status': [6] + [0] * 9,
+                'pkts': [value for port in range(1, 9) for value in (port, 0, 10 * port, port % 2)] + [0] * 8,
+            },
+            'max_port_num': 8,
+        }
         port_statistics = self.monitoring.port_statistics()
         self.assertEqual(len(port_statistics.keys()), 8)
+        self.assertEqual(port_statistics['Port 3']['RxGoodPkt'], '30')
+        self.assertEqual(port_statistics['Port 3']['RxBadPkt'], '1')
+        self.assertEqual(port_statistics['Port 1']['Link Status'], '1000MF')
         for value in port_statistics.values():
             self.assertIsNotNone(value.get('Status'))
             self.assertIsNotNone(value.get('Link Status'))
@@ -28,17 +39,22 @@ class TestMonitoring(unittest.TestCase):
             self.assertIsNotNone(value.get('RxBadPkt'))
 
     def test_mirrored_ports(self):
+        self.monitoring.web_controller.get_page_variables.return_value = {
+            'mirr_info': {'ingress': [1] * 8, 'egress': [0] * 8},
+            'max_port_num': 8,
+        }
         status = self.monitoring.mirrored_ports()
+        self.assertEqual(status['Mirrored Ports']['Port 1'], {'Ingress': 'Enabled', 'Egress': 'Disabled'})
         self.assertEqual(len(status['Mirrored Ports'].keys()), 8)
         for value in status['Mirrored Ports'].values():
             self.assertIsNotNone(value.get('Ingress'))
             self.assertIsNotNone(value.get('Egress'))
 
-    @patch('switch_TL_SG108PE.control_fields.monitoring.Select', MagicMock())
     def test_mirroring_port(self):
-        status = self.monitoring.mirroring_port()
-        self.assertIsNotNone(status.get('Mirroring Port'))
-        self.assertTrue(status['Mirroring Port'])
+        self.monitoring.web_controller.get_page_variables.return_value = {'MirrEn': 1, 'MirrPort': 5}
+        self.assertEqual(self.monitoring.mirroring_port(), {'Mirroring Port': 'Port 5'})
+        self.monitoring.web_controller.get_page_variables.return_value = {'MirrEn': 0, 'MirrPort': 5}
+        self.assertEqual(self.monitoring.mirroring_port(), {'Mirroring Port': ''})
 
     @data(
         {
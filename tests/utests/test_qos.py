@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import Mock, MagicMock, patch, DEFAULT
+from unittest.mock import MagicMock, patch, DEFAULT
 from ddt import ddt, data, unpack
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
@@ -18,7 +18,10 @@ class TestQoS(unittest.TestCase):
         self.qos = QoSControlField(web_controller=MagicMock())
 
     def test_qos_mode(self):
-        self.assertTrue(self.qos.qos_mode())
+        self.qos.web_controller.get_page_variables.return_value = {'qosMode': 2}
+        self.assertEqual(self.qos.qos_mode(), 'DSCP/802.1P Based')
+        self.qos.web_controller.get_page_variables.return_value = {'qosMode': 3}
+        self.assertRaises(QoSModeException, self.qos.qos_mode)
 
     @data(
         {
@@ -92,20 +95,21 @@ class TestQoS(unittest.TestCase):
     @data(
         {
             'error': None,
-            'qos_mode_value': 'Port Based'
+            'qos_mode_value': 0
         },
         {
             'error': QoSModeException,
-            'qos_mode_value': 'sth-other'
+            'qos_mode_value': 1
         },
     )
     @unpack
-    @patch.object(QoSControlField, 'qos_mode')
-    def test_priority_queue_port_settings(self, qos_mode, qos_mode_value, error):
-        qos_mode.return_value = qos_mode_value
+    def test_priority_queue_port_settings(self, qos_mode_value, error):
+        self.qos.web_controller.get_page_variables.return_value = {
+            'qosMode': qos_mode_value, 'portNumber': 8, 'pPri': [0, 0, 0, 0, 0, 0, 0, 3]}
         if error is None:
             settings = self.qos.priority_queue_port_settings()
-            self.assertTrue(settings.keys())
+            self.assertEqual(len(settings), 8)
+            self.assertEqual(settings['Port 8'], '4(Highest)')
         else:
             self.assertRaises(error, lambda: self.qos.priority_queue_port_settings())
 
@@ -150,7 +154,6 @@ class TestQoS(unittest.TestCase):
     @patch.multiple(QoSControlField,
                     get_alert_text=DEFAULT,
                     qos_mode=DEFAULT)
-    @patch('switch_TL_SG108PE.control_fields.qos.Select', Mock())
     def test_set_priority_queue_in_port_based_qos_mode(self, get_alert_text, qos_mode, port, priority_queue,
                                                        alert_text, error, qos_mode_value):
         get_alert_text.return_value = alert_text
@@ -0,0 +1,113 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.session_store import SessionStore
+from switch_TL_SG108PE.web_controller import HttpWebController
+from switch_TL_SG108PE.exceptions import SessionStoreException
+from tests.utests.switch_pages import FakeHttpClient
+
+
+COOKIES = [{'name': 'SESSIONID', 'value': 'f4k3s3ss10n', 'domain': '', 'path': '/'}]
+
+
+class TestSessionStore(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sessions.json')
+        self.store = SessionStore(self.path, lock_timeout=0.2)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_save_and_load(self):
+        with self.store.lock():
+            self.assertIsNone(self.store.load('192.168.1.42', 'admin'))
+            self.store.save('192.168.1.42', 'admin', COOKIES)
+        self.assertEqual(SessionStore(self.path).load('192.168.1.42', 'admin'), COOKIES)
+        self.assertIsNone(SessionStore(self.path).load('192.168.1.42', 'other'))
+        self.assertIsNone(SessionStore(self.path).load('192.168.1.43', 'admin'))
+
+    def test_remove(self):
+        self.store.save('192.168.1.42', 'admin', COOKIES)
+        self.store.remove('192.168.1.42')
+        self.assertIsNone(self.store.load('192.168.1.42', 'admin'))
+
+    def test_lock_is_released(self):
+        with self.store.lock():
+            self.assertTrue(os.path.exists(f'{self.path}.lock'))
+        self.assertFalse(os.path.exists(f'{self.path}.lock'))
+
+    def test_locked_file(self):
+        with self.store.lock():
+            with self.assertRaises(SessionStoreException):
+                with SessionStore(self.path, lock_timeout=0.1).lock():
+                    pass
+
+    def test_stale_lock_is_broken(self):
+        with open(f'{self.path}.lock', 'w', encoding='utf-8'):
+            pass
+        stale = time.time() - SessionStore.STALE_LOCK_AGE - 1
+        os.utime(f'{self.path}.lock', (stale, stale))
+        with self.store.lock():
+            self.store.save('192.168.1.42', 'admin', COOKIES)
+        self.assertEqual(self.store.load('192.168.1.42', 'admin'), COOKIES)
+
+    def test_corrupted_file(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write('{')
+        self.assertRaises(SessionStoreException, self.store.load, '192.168.1.42', 'admin')
+
+
+class TestSessionReuse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'sessions.json')
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _connect(self, client: FakeHttpClient) -> SwitchManager:
+        switch_manager = SwitchManager()
+        with patch('switch_TL_SG108PE.switch_manager.HttpWebController',
+                   lambda host, login, password: HttpWebController(host, login, password, client=client)):
+            switch_manager.connect('192.168.1.42', 'admin', 'admin', backend='http', session_file=self.path)
+        return switch_manager
+
+    def _logons(self, client: FakeHttpClient) -> int:
+        return [request[1] for request in client.requests].count('logon.cgi')
+
+    def test_session_is_adopted_by_next_connection(self):
+        first = FakeHttpClient(shared_session=True)
+        self._connect(first).disconnect()
+        self.assertEqual(self._logons(first), 1)
+        self.assertTrue(first.logged_in)
+        second = FakeHttpClient(shared_session=True)
+        switch_manager = self._connect(second)
+        self.assertEqual(self._logons(second), 0)
+        self.assertEqual(switch_manager.control('system').system_info()['Device Description'], 'TL-SG108PE')
+
+    def test_expired_session_is_replaced(self):
+        SessionStore(self.path).save('192.168.1.42', 'admin', [dict(COOKIES[0], value='expired')])
+        client = FakeHttpClient(shared_session=True)
+        self._connect(client)
+        self.assertEqual(self._logons(client), 1)
+        self.assertEqual(SessionStore(self.path).load('192.168.1.42', 'admin'), COOKIES)
+
+    def test_logout_removes_session(self):
+        client = FakeHttpClient(shared_session=True)
+        self._connect(client).disconnect(logout=True)
+        self.assertFalse(client.logged_in)
+        self.assertIsNone(SessionStore(self.path).load('192.168.1.42', 'admin'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from ddt import ddt, data, unpack
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
@@ -19,6 +19,11 @@ class TestSwitching(unittest.TestCase):
         self.switching = SwitchingControlField(web_controller=MagicMock())
 
     def test_ports_settings(self):
+        self.switching.web_controller.get_page_variables.return_value = {
+            'all_info': {'state': [1] * 10, 'trunk_info': [0] * 10, 'spd_cfg': [1] * 10, 'spd_act': [6] + [0] * 9,
+                         'fc_cfg': [0] * 10, 'fc_act': [0] * 10},
+            'max_port_num': 8,
+        }
         ports_settings = self.switching.ports_settings()
         self.assertEqual(len(ports_settings.keys()), 8)
         for value in ports_settings.values():
@@ -43,7 +48,6 @@ class TestSwitching(unittest.TestCase):
         },
     )
     @unpack
-    @patch('switch_TL_SG108PE.control_fields.switching.Select', Mock())
     @patch.object(SwitchingControlField, 'get_alert_text')
     def test_set_port_settings(self, get_alert_text, alert_text, error):
         get_alert_text.return_value = alert_text
@@ -167,7 +171,10 @@ class TestSwitching(unittest.TestCase):
             )
 
     def test_lag_settings(self):
-        self.assertTrue(self.switching.lag_settings())  # TODO: Consider better checking
+        self.switching.web_controller.get_page_variables.return_value = {'trunk_conf': {
+            'maxTrunkNum': 2, 'portNum': 8, 'portStr_g1': [1, 1, 0, 0, 0, 0, 0, 0], 'portStr_g2': [0] * 8,
+        }}
+        self.assertEqual(self.switching.lag_settings(), {'LAG1': '1-2', 'LAG2': '---'})
 
     @data(
         {
@@ -214,7 +221,6 @@ class TestSwitching(unittest.TestCase):
         },
     )
     @unpack
-    @patch('switch_TL_SG108PE.control_fields.switching.Select', Mock())
     @patch.object(SwitchingControlField, 'get_alert_text')
     def test_set_lag_ports(self, get_alert_text, lag_id, ports, alert_text, error):
         get_alert_text.return_value = alert_text
@@ -228,7 +234,6 @@ class TestSwitching(unittest.TestCase):
 
 
 
-    # @patch('switch_TL_SG108PE.control_fields.switching.Select', Mock())
     # def test_set_lag_ports(self):
     #     self.assertTrue(self.switching.set_lag_ports(1, [1, 2]))
     #
@@ -18,6 +18,11 @@ class TestSystem(unittest.TestCase):
         self.system = SystemControlField(web_controller=Mock())
 
     def test_system_info(self):
+        self.system.web_controller.get_page_variables.return_value = {'info_ds': {
+            'descriStr': ['TL-SG108PE'], 'macStr': ['E4:C3:2A:BD:FF:F0'], 'ipStr': ['192.168.1.42'],
+            'netmaskStr': ['255.255.255.0'], 'gatewayStr': ['192.168.1.1'],
+            'firmwareStr': ['1.0.0 Build 20200415 Rel.54962'], 'hardwareStr': ['TL-SG108PE 3.0'],
+        }}
         system_info = self.system.system_info()
         self.assertIsNotNone(system_info.get('Device Description'))
         self.assertIsNotNone(system_info.get('MAC Address'))
@@ -59,7 +64,12 @@ class TestSystem(unittest.TestCase):
             self.assertRaises(error, lambda: self.system.set_device_description(description))
 
     def test_ip_settings(self):
+        self.system.web_controller.get_page_variables.return_value = {'ip_ds': {
+            'state': 1, 'vlan': 1, 'maxVlan': 4094, 'ipStr': ['192.168.1.42'], 'netmaskStr': ['255.255.255.0'],
+            'gatewayStr': ['192.168.1.1'],
+        }}
         ip_settings = self.system.ip_settings()
+        self.assertEqual(ip_settings['DHCP Setting'], 'enable')
         self.assertIsNotNone(ip_settings.get('DHCP Setting'))
         self.assertIsNotNone(ip_settings.get('IP Address'))
         self.assertIsNotNone(ip_settings.get('Subnet Mask'))
@@ -80,10 +90,10 @@ class TestSystem(unittest.TestCase):
         },
     )
     @unpack
-    @patch.object(SystemControlField, 'get_alert_text')
-    @patch('switch_TL_SG108PE.control_fields.system.Select', Mock())
-    def test_enable_dhcp_configuration(self, get_alert_text, error, alert_text):
+    @patch.multiple(SystemControlField, get_alert_text=DEFAULT, ip_settings=DEFAULT)
+    def test_enable_dhcp_configuration(self, get_alert_text, ip_settings, error, alert_text):
         get_alert_text.return_value = alert_text
+        ip_settings.return_value = {'IP Address': '0.0.0.0', 'Subnet Mask': '1.1.1.1', 'Default Gateway': '2.2.2.2'}
         if error is None:
             self.system.enable_dhcp_configuration()
         else:
@@ -104,10 +114,10 @@ class TestSystem(unittest.TestCase):
         },
     )
     @unpack
-    @patch.object(SystemControlField, 'get_alert_text')
-    @patch('switch_TL_SG108PE.control_fields.system.Select', Mock())
-    def test_disable_dhcp_configuration(self, get_alert_text, error, alert_text):
+    @patch.multiple(SystemControlField, get_alert_text=DEFAULT, ip_settings=DEFAULT)
+    def test_disable_dhcp_configuration(self, get_alert_text, ip_settings, error, alert_text):
         get_alert_text.return_value = alert_text
+        ip_settings.return_value = {'IP Address': '0.0.0.0', 'Subnet Mask': '1.1.1.1', 'Default Gateway': '2.2.2.2'}
         if error is None:
             self.system.disable_dhcp_configuration()
         else:
@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from selenium.webdriver.common.by import By
+
+from switch_TL_SG108PE.html_driver import HtmlDriver
+from switch_TL_SG108PE.timeout_policy import TimeoutPolicy
+from switch_TL_SG108PE.web_controller import WebController
+from switch_TL_SG108PE.exceptions import TpLinkSwitchException
+from switch_TL_SG108PE.control_fields.control_field import TIP_QUERY
+from switch_TL_SG108PE import scripts
+from tests.utests.switch_pages import FakeHttpClient
+
+
+class TestTimeoutPolicy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.policy = TimeoutPolicy(factor=3, minimum=0.5, maximum=10, min_samples=5)
+
+    def test_default_timeout_until_enough_waits_observed(self):
+        for _ in range(4):
+            self.policy.record('key', 0.1)
+        self.assertEqual(self.policy.timeout('key', 4), 4)
+        self.assertEqual(self.policy.poll_interval('key'), self.policy.default_poll_interval)
+
+    def test_timeout_is_multiple_of_99th_percentile(self):
+        for latency in [0.2] * 98 + [0.3, 1.0]:
+            self.policy.record('key', latency)
+        self.assertAlmostEqual(self.policy.timeout('key', 4), 0.9)
+        self.assertAlmostEqual(self.policy.poll_interval('key'), 0.05)
+
+    def test_timeout_is_bounded(self):
+        for _ in range(5):
+            self.policy.record('fast', 0.01)
+            self.policy.record('slow', 5)
+        self.assertEqual(self.policy.timeout('fast', 4), 0.5)
+        self.assertEqual(self.policy.timeout('slow', 4), 10)
+        self.assertEqual(self.policy.poll_interval('slow'), 0.5)
+
+    def test_keys_are_independent(self):
+        for _ in range(5):
+            self.policy.record('key', 1)
+        self.assertEqual(self.policy.timeout('other', 4), 4)
+        self.policy.reset()
+        self.assertEqual(self.policy.timeout('key', 4), 4)
+
+
+class TestLearnedTimeouts(unittest.TestCase):
+
+    def setUp(self) -> None:
+        client = FakeHttpClient()
+        client.logged_in = True
+        driver = HtmlDriver(client)
+        driver.get(client.url('Controls.htm'))
+        self.web_controller = WebController('192.168.1.42', 'admin', 'admin', driver)
+
+    def test_latency_of_wait_is_recorded(self):
+        self.web_controller.timeouts.min_samples = 1
+        self.web_controller.wait_until_element_is_present(By.ID, 'txt_note')
+        self.assertEqual(self.web_controller.timeouts.timeout((By.ID, 'txt_note'), 4),
+                         self.web_controller.timeouts.minimum)
+
+    def test_timeouts_are_learned_per_operation(self):
+        timeouts = self.web_controller.timeouts
+        timeouts.min_samples = 1
+        self.web_controller.get_table(By.XPATH, "//select[@id='sel_single']/option", columns=1)
+        self.assertEqual(timeouts.timeout((scripts.ELEMENTS_TEXTS, By.XPATH, "//select[@id='sel_single']/option"), 4),
+                         timeouts.minimum)
+        self.assertEqual(timeouts.timeout((scripts.ELEMENTS_TEXTS, By.XPATH, "//select[@id='sel_multiple']/option"),
+                                          4), 4)
+
+    def test_slow_apply_is_not_cut_by_quick_ones(self):
+        self.web_controller.timeouts.min_samples = 1
+        self.web_controller.timeouts.record((scripts.APPLY_OUTCOME, TIP_QUERY, None, "//input[@id='bt_quick']"), 0.01)
+        self.web_controller.mark_page(TIP_QUERY, "//input[@id='bt_apply']")
+        with patch('switch_TL_SG108PE.web_controller.WebDriverWait') as wait:
+            wait.return_value.until.return_value = {'tip': 'Operation successful.'}
+            self.web_controller.wait_until_settings_are_applied(TIP_QUERY)
+        self.assertEqual(wait.call_args.args[1], 6)
+
+    def test_fractional_timeout_override(self):
+        started = time.monotonic()
+        with self.assertRaisesRegex(TpLinkSwitchException, 'after 0.2 seconds'):
+            self.web_controller.wait_until_element_is_present(By.ID, 'missing', timeout=0.2)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_learned_timeout_fails_fast(self):
+        self.web_controller.timeouts.min_samples = 1
+        self.web_controller.timeouts.minimum = 0.2
+        self.web_controller.timeouts.record((By.ID, 'missing'), 0.01)
+        started = time.monotonic()
+        self.assertRaises(TpLinkSwitchException, self.web_controller.wait_until_element_is_present, By.ID, 'missing')
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_learned_timeout_is_doubled_once_for_slow_answer(self):
+        timeouts = self.web_controller.timeouts
+        timeouts.min_samples = 1
+        timeouts.record('slow', 0.05)
+        answer_at = time.monotonic() + 0.3
+        with patch.object(self.web_controller.webdriver, 'execute_script',
+                          side_effect=lambda *args: time.monotonic() > answer_at or None):
+            self.assertTrue(self.web_controller.wait_until_script_returns_value('slow', key='slow'))
+        self.assertGreater(timeouts.timeout('slow', 4), 0.6)
+
+    def test_timed_out_wait_raises_learned_timeout(self):
+        timeouts = self.web_controller.timeouts
+        timeouts.min_samples = 1
+        timeouts.record((By.ID, 'missing'), 0.01)
+        with self.assertRaisesRegex(TpLinkSwitchException, 'after 0.4 seconds'):
+            self.web_controller.wait_until_element_is_present(By.ID, 'missing')
+        self.assertGreaterEqual(timeouts.timeout((By.ID, 'missing'), 4), 1.2)
+
+    def test_first_wait_in_loaded_page_is_learned_apart(self):
+        timeouts = self.web_controller.timeouts
+        timeouts.min_samples = 1
+        self.web_controller.forget_elements()
+        self.web_controller.get_table(By.ID, 'txt_note', columns=1)
+        self.assertTrue(timeouts.learned(((scripts.ELEMENTS_TEXTS, By.ID, 'txt_note'), 'page loaded')))
+        self.assertFalse(timeouts.learned((scripts.ELEMENTS_TEXTS, By.ID, 'txt_note')))
+        self.web_controller.get_table(By.ID, 'txt_note', columns=1)
+        self.assertTrue(timeouts.learned((scripts.ELEMENTS_TEXTS, By.ID, 'txt_note')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import Mock, MagicMock, patch, DEFAULT
+from unittest.mock import MagicMock, patch, DEFAULT
 from ddt import ddt, data, unpack
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
@@ -112,7 +112,6 @@ class TestVLAN(unittest.TestCase):
     )
     @unpack
     @patch.object(VLANControlField, 'get_alert_text')
-    @patch('switch_TL_SG108PE.control_fields.vlan.Select', Mock())
     def test_change_mtu_vlan_uplink_port(self, get_alert_text, port_id, error, alert_text):
         get_alert_text.return_value = alert_text
         if error is None:
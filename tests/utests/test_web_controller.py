@@ -0,0 +1,241 @@
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import Mock, call, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src'))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+from switch_TL_SG108PE.web_controller import WebController
+from switch_TL_SG108PE.switch_manager import SwitchManager
+from switch_TL_SG108PE.browser import SharedBrowser
+from switch_TL_SG108PE.utils import Frame
+from switch_TL_SG108PE.exceptions import DeadlineExceededException
+from tests.utests.switch_pages import windowed_webdriver
+
+
+QUERY = "//input[@name='apply']"
+
+
+class TestElementCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.webdriver = Mock()
+        self.webdriver.execute.return_value = {'value': None}
+        self.found = []
+        self.webdriver.find_element.side_effect = self._find_element
+        self.web_controller = WebController('192.168.1.42', 'admin', 'admin', self.webdriver)
+        self.web_controller.switch_to_default_content()
+
+    def _find_element(self, method, query):
+        self.found.append((method, query))
+        return WebElement(self.webdriver, f'element-{len(self.found)}')
+
+    def test_element_is_found_once_per_page_load(self):
+        first = self.web_controller.wait_until_element_is_present(By.XPATH, QUERY)
+        second = self.web_controller.find_element(By.XPATH, QUERY)
+        self.assertIs(first, second)
+        self.assertEqual(self.found, [(By.XPATH, QUERY)])
+        self.web_controller.forget_elements()
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.assertEqual(len(self.found), 2)
+
+    def test_elements_of_other_frame_are_kept(self):
+        self.web_controller._active_frame = Frame.MENU
+        menu_link = self.web_controller.find_element(By.XPATH, QUERY)
+        self.web_controller._active_frame = Frame.MAIN
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.web_controller.forget_elements(Frame.MAIN)
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.web_controller._active_frame = Frame.MENU
+        self.assertIs(self.web_controller.find_element(By.XPATH, QUERY), menu_link)
+        self.assertEqual(len(self.found), 3)
+
+    def test_element_is_not_cached_in_unknown_frame(self):
+        self.web_controller._active_frame = ''
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.assertEqual(len(self.found), 2)
+
+    def test_remembered_element_is_returned_without_commands(self):
+        element = self.web_controller.wait_until_element_is_present(By.XPATH, QUERY)
+        self.webdriver.execute.reset_mock()
+        self.assertIs(self.web_controller.wait_until_element_is_present(By.XPATH, QUERY), element)
+        self.assertIs(self.web_controller.find_element(By.XPATH, QUERY), element)
+        self.webdriver.execute.assert_not_called()
+        element.click()
+        self.webdriver.execute.assert_called_once_with(Command.CLICK_ELEMENT, {'id': 'element-1'})
+
+    def test_stale_element_is_found_again(self):
+        self.web_controller.find_element(By.XPATH, QUERY)
+        self.webdriver.execute.side_effect = [StaleElementReferenceException('stale'), {'value': None}]
+        element = self.web_controller.wait_until_element_is_present(By.XPATH, QUERY)
+        element.click()
+        self.assertEqual(element.id, 'element-2')
+        self.assertEqual(self.webdriver.execute.call_args_list, [call(Command.CLICK_ELEMENT, {'id': 'element-1'}),
+                                                                 call(Command.CLICK_ELEMENT, {'id': 'element-2'})])
+        self.webdriver.execute.side_effect = None
+        self.assertIs(self.web_controller.find_element(By.XPATH, QUERY), element)
+        self.assertEqual(len(self.found), 2)
+
+
+class TestPageLoadDeadline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.webdriver = Mock()
+        self.webdriver.execute.return_value = {'value': 'frame'}  # admin page is loaded (session is valid)
+        self.webdriver.find_element.return_value = WebElement(self.webdriver, 'element')
+        self.web_controller = WebController('192.168.1.42', 'admin', 'admin', self.webdriver)
+
+    def test_page_load_is_bounded_by_deadline(self):
+        self.web_controller.begin_operation(deadline=5)
+        self.web_controller.login()
+        timeouts = [call.args[0] for call in self.webdriver.set_page_load_timeout.call_args_list]
+        self.assertLessEqual(timeouts[0], 5)
+        self.assertEqual(timeouts[1:], [self.web_controller.page_load_timeout])
+
+    def test_page_load_timeout_is_not_changed_without_deadline(self):
+        self.web_controller.login()
+        self.webdriver.get.assert_called_once_with('http://192.168.1.42')
+        self.webdriver.set_page_load_timeout.assert_not_called()
+
+    def test_slow_page_load_exceeds_deadline(self):
+        self.webdriver.get.side_effect = TimeoutException('timeout')
+        self.web_controller.begin_operation(deadline=5)
+        self.assertRaises(DeadlineExceededException, self.web_controller.login)
+        self.webdriver.set_page_load_timeout.assert_called_with(self.web_controller.page_load_timeout)
+
+
+class TestSharedBrowser(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.webdriver = windowed_webdriver()
+        self.browser = SharedBrowser(self.webdriver)
+        self.first = WebController('192.168.1.42', 'admin', 'admin', self.webdriver, shared_browser=self.browser)
+        self.second = WebController('192.168.1.43', 'admin', 'admin', self.webdriver, shared_browser=self.browser)
+
+    def test_operation_runs_in_own_window(self):
+        self.first.begin_operation()
+        self.assertEqual(self.webdriver.current_window_handle, 'window-1')
+        self.first._active_frame = Frame.MAIN
+        self.first.end_operation()
+        self.first.begin_operation()
+        self.assertEqual(self.first._active_frame, Frame.MAIN)  # window was not switched
+        self.first.end_operation()
+        self.second.begin_operation()
+        self.assertEqual(self.webdriver.current_window_handle, 'window-2')
+        self.second.end_operation()
+        self.first.begin_operation()
+        self.assertEqual(self.webdriver.current_window_handle, 'window-1')
+        self.assertIsNone(self.first._active_frame)
+        self.first.end_operation()
+
+    def test_operations_of_controllers_are_serialized(self):
+        started = threading.Event()
+
+        def operation():
+            self.second.begin_operation()
+            started.set()
+            self.second.end_operation()
+
+        self.first.begin_operation()
+        thread = threading.Thread(target=operation)
+        thread.start()
+        self.assertFalse(started.wait(0.05))
+        self.first.end_operation()
+        thread.join()
+        self.assertTrue(started.is_set())
+        self.assertEqual(self.webdriver.current_window_handle, 'window-2')
+
+    def test_quit_closes_window(self):
+        self.second.quit()
+        self.webdriver.close.assert_called_once_with()
+        self.webdriver.quit.assert_not_called()
+
+    def test_logout_is_skipped_while_other_manager_uses_switch(self):
+        switch_managers = [SwitchManager(), SwitchManager()]
+        with patch.object(SwitchManager, '_start_session'), patch.object(WebController, 'logout') as logout:
+            for switch_manager in switch_managers:
+                switch_manager.connect('192.168.1.44', 'admin', 'admin', shared_browser=self.browser)
+            self.assertFalse(self.first.shares_session())
+            switch_managers[0].disconnect()
+            logout.assert_not_called()
+            switch_managers[1].disconnect()
+            logout.assert_called_once_with()
+
+    def test_pinned_tab_window_is_opened_through_shared_browser(self):
+        statistics, system_info = ('Monitoring', 'Port Statistics'), ('System', 'System Info')
+        self.second.pinned_tabs = {statistics}
+        for tab, window in ((statistics, 'window-3'), (system_info, 'window-2'), (statistics, 'window-3')):
+            self.second.begin_operation(read_only=True)
+            self.second.use_tab_window(tab)
+            self.assertEqual(self.webdriver.current_window_handle, window)
+            self.second.current_tab = tab
+            self.second.end_operation()
+        self.assertEqual(self.browser._windows, ['window-1', 'window-2', 'window-3'])
+        self.second.quit()
+        self.assertEqual(self.webdriver.close.call_count, 2)
+        self.assertEqual(self.browser._windows, ['window-1'])
+        self.first.begin_operation()
+        self.assertEqual(self.webdriver.current_window_handle, 'window-1')
+        self.first.end_operation()
+
+
+class TestTabWindows(unittest.TestCase):
+
+    STATISTICS = ('Monitoring', 'Port Statistics')
+    SYSTEM_INFO = ('System', 'System Info')
+
+    def setUp(self) -> None:
+        self.webdriver = windowed_webdriver()
+        self.web_controller = WebController('192.168.1.42', 'admin', 'admin', self.webdriver)
+        self.web_controller.pinned_tabs = {self.STATISTICS}
+
+    def _open(self, tab, read_only: bool = True) -> None:
+        self.web_controller.begin_operation(read_only)
+        self.web_controller.use_tab_window(tab)
+        if self.web_controller.current_tab != tab:
+            self.web_controller.current_tab = tab  # page would be loaded by control field
+        self.web_controller.end_operation()
+
+    def test_pinned_tab_is_kept_in_own_window(self):
+        self._open(self.STATISTICS)
+        self.assertEqual(self.webdriver.current_window_handle, 'window-2')
+        self.webdriver.get.assert_called_once_with('http://192.168.1.42')
+        self._open(self.SYSTEM_INFO)
+        self.assertEqual(self.webdriver.current_window_handle, 'window-1')
+        self.web_controller.begin_operation(read_only=True)
+        self.web_controller.use_tab_window(self.STATISTICS)
+        self.assertEqual(self.webdriver.current_window_handle, 'window-2')
+        self.assertEqual(self.web_controller.current_tab, self.STATISTICS)  # page is not loaded again
+        self.web_controller.end_operation()
+        self.webdriver.switch_to.new_window.assert_called_once_with('tab')
+
+    def test_pinned_page_is_loaded_again_after_settings_changed(self):
+        self._open(self.STATISTICS)
+        self._open(self.SYSTEM_INFO, read_only=False)
+        self.web_controller.begin_operation(read_only=True)
+        self.web_controller.use_tab_window(self.STATISTICS)
+        self.assertIsNone(self.web_controller.current_tab)
+        self.web_controller.end_operation()
+
+    def test_tab_windows_are_closed_when_browser_is_left_running(self):
+        self._open(self.STATISTICS)
+        self.web_controller.quit(browser=False)
+        self.webdriver.close.assert_called_once_with()
+        self.assertEqual(self.webdriver.current_window_handle, 'window-1')
+
+    def test_windows_are_not_used_without_pinned_tabs(self):
+        self.web_controller.pinned_tabs = set()
+        self._open(self.STATISTICS)
+        self.webdriver.switch_to.new_window.assert_not_called()
+        self.webdriver.switch_to.window.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()